@@ -0,0 +1,5 @@
+"""Benchmarks for docx2python. These are not tests. Run each from the project root.
+
+:author: Shay Hill
+:created: 2023-07-03
+"""
@@ -0,0 +1,118 @@
+"""Compare the tree and sax extraction engines.
+
+:author: Shay Hill
+:created: 2023-07-03
+
+For each docx in ``tests/resources`` and each synthetic scenario in
+``benchmarks.extract``, time plain-text extraction of every content file with
+``engine="tree"`` (unzip, parse, and ``get_text``) and ``engine="sax"``
+(``sax_text``). Rels and numbering are read before timing. Print the times, the
+sax/tree ratio, and whether the content is the same.
+
+Run from the project root::
+
+    python -m benchmarks.engines
+    python -m benchmarks.engines --repeat 5 --scale 0.5
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import warnings
+from dataclasses import replace
+from io import BytesIO
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from docx2python.docx_reader import DocxReader
+
+from .extract import SCENARIOS
+
+RESOURCES = Path(__file__).parents[1] / "tests" / "resources"
+
+
+def _time_engine(
+    docx: Path | BytesIO, engine: str, repeat: int
+) -> Tuple[float, List[object]]:
+    """Extract every content file with one engine.
+
+    :param docx: path to a docx file or docx bytes
+    :param engine: "tree" or "sax"
+    :param repeat: keep the fastest of this many extractions
+    :return: seconds, content of every content file
+    """
+    best = float("inf")
+    content: List[object] = []
+    for _ in range(repeat):
+        if isinstance(docx, BytesIO):
+            _ = docx.seek(0)
+        with DocxReader(docx, engine=engine) as reader:
+            files = reader.content_files()
+            _ = reader.numId2numFmts, reader.numId2numStarts
+            _ = [x.rels for x in files]
+            start = time.perf_counter()
+            content = [x.content for x in files]
+            best = min(best, time.perf_counter() - start)
+    return best, content
+
+
+def compare(docx: Path | BytesIO, repeat: int = 1) -> Dict[str, float | bool]:
+    """Time both engines on one docx.
+
+    :param docx: path to a docx file or docx bytes
+    :param repeat: keep the fastest of this many extractions
+    :return: "tree" and "sax" seconds and "same" (True if content is the same)
+    """
+    tree_seconds, tree_content = _time_engine(docx, "tree", repeat)
+    sax_seconds, sax_content = _time_engine(docx, "sax", repeat)
+    same = tree_content == sax_content
+    return {"tree": tree_seconds, "sax": sax_seconds, "same": same}
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    """Define command-line arguments.
+
+    :return: argument parser
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--repeat", type=int, default=3, help="keep best of n runs")
+    parser.add_argument(
+        "--scale", type=float, default=1, help="multiply scenario paragraph counts"
+    )
+    return parser
+
+
+def main() -> None:
+    """Print times for each resource and scenario, then the totals."""
+    args = _get_parser().parse_args()
+    docxs: Dict[str, Callable[[], Path | BytesIO]] = {}
+    for path in sorted(RESOURCES.glob("*.docx")):
+        docxs[path.name] = lambda path=path: path
+    for name, docx in SCENARIOS.items():
+        docx = replace(docx, paragraphs=int(docx.paragraphs * args.scale))
+        docxs[f"synthetic: {name}"] = docx.to_bytesio
+
+    print(f"{'':<36}{'tree':>9}{'sax':>9}{'ratio':>9}  same")
+    totals = {"tree": 0.0, "sax": 0.0}
+    for name, get_docx in docxs.items():
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            try:
+                times = compare(get_docx(), args.repeat)
+            except Exception as ex:  # a few test resources are broken on purpose
+                print(f"{name[:35]:<36}{type(ex).__name__}")
+                continue
+        totals["tree"] += times["tree"]
+        totals["sax"] += times["sax"]
+        ratio = times["sax"] / times["tree"]
+        print(
+            f"{name[:35]:<36}{times['tree']:>9.4f}{times['sax']:>9.4f}"
+            + f"{ratio:>9.2f}  {times['same']}"
+        )
+    ratio = totals["sax"] / totals["tree"]
+    print(f"{'total':<36}{totals['tree']:>9.4f}{totals['sax']:>9.4f}{ratio:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""Time docx2python end to end and per phase on synthetic docx files.
+
+:author: Shay Hill
+:created: 2023-07-03
+
+Each scenario is a ``SyntheticDocx``. For each, print the time to
+
+    * ``unzip``: read ``word/document.xml`` from the zip archive
+    * ``parse``: parse the xml into an lxml tree
+    * ``depths``: find the depth of every element (``_get_elem_depths``)
+    * ``content``: find every element with content (``get_content_elems``)
+    * ``extract``: ``get_text`` (includes depths and content)
+    * ``merge``: ``merge_elems`` on a parsed tree (only used to save merged xml)
+    * ``images``: ``pull_image_files``
+    * ``total``: ``docx2python(...).text`` and ``.images``
+
+Run from the project root::
+
+    python -m benchmarks.extract
+    python -m benchmarks.extract --scale 4 --repeat 3
+    python -m benchmarks.extract --paragraphs 20000 --runs 8 --table-depth 10
+
+Use the same arguments before and after a change.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from dataclasses import fields, replace
+from typing import Callable, Dict
+
+from lxml import etree
+
+from docx2python.attribute_register import get_content_elems
+from docx2python.docx_reader import DocxReader
+from docx2python.docx_text import _get_elem_depths, get_text
+from docx2python.main import docx2python
+from docx2python.merge_runs import merge_elems
+
+from .synthetic import SyntheticDocx
+
+SCENARIOS: Dict[str, SyntheticDocx] = {
+    "flat": SyntheticDocx(paragraphs=5000, runs=4),
+    "many runs": SyntheticDocx(paragraphs=1000, runs=40),
+    "nested tables": SyntheticDocx(paragraphs=500, table_depth=20, table_every=10),
+    "lists": SyntheticDocx(paragraphs=5000, list_every=2),
+    "links": SyntheticDocx(paragraphs=5000, link_every=2),
+    "images": SyntheticDocx(paragraphs=2000, image_every=4),
+    "everything": SyntheticDocx(
+        paragraphs=5000,
+        runs=8,
+        table_depth=5,
+        table_every=50,
+        list_every=3,
+        link_every=5,
+        image_every=20,
+    ),
+}
+
+PHASES = ("unzip", "parse", "depths", "content", "extract", "merge", "images")
+
+
+def _best_of(repeat: int, func: Callable[[], object]) -> float:
+    """Time a function.
+
+    :param repeat: number of times to call func
+    :param func: function to time
+    :return: fastest time in seconds
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _ = func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def time_phases(docx: SyntheticDocx, repeat: int = 1) -> Dict[str, float]:
+    """Time each phase of extraction then the entire extraction.
+
+    :param docx: synthetic docx parameters
+    :param repeat: time each phase this many times and keep the fastest
+    :return: phase names mapped to seconds (plus "total")
+    """
+    docx_bytes = docx.to_bytesio()
+    times: Dict[str, float] = {}
+    with DocxReader(docx_bytes, html=True) as reader:
+        file = reader.file_of_type("officeDocument")
+        xml = reader.zipf.read(file.path)
+        root = etree.fromstring(xml)
+        _ = reader.numId2numFmts, reader.numId2numStarts, file.rels
+
+        times["unzip"] = _best_of(repeat, lambda: reader.zipf.read(file.path))
+        times["parse"] = _best_of(repeat, lambda: etree.fromstring(xml))
+        times["depths"] = _best_of(repeat, lambda: _get_elem_depths(root))
+        times["content"] = _best_of(repeat, lambda: get_content_elems(root))
+        times["extract"] = _best_of(repeat, lambda: get_text(file, root))
+
+        def merge() -> None:
+            merge_elems(file, etree.fromstring(xml))
+
+        times["merge"] = _best_of(repeat, merge) - times["parse"]
+        times["images"] = _best_of(repeat, reader.pull_image_files)
+
+    def total() -> None:
+        with docx2python(docx.to_bytesio(), html=True) as content:
+            _ = content.text, content.images
+
+    times["total"] = _best_of(repeat, total)
+    return times
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    """Define command-line arguments.
+
+    :return: argument parser
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--repeat", type=int, default=1, help="keep best of n runs")
+    parser.add_argument(
+        "--scale", type=float, default=1, help="multiply scenario paragraph counts"
+    )
+    parser.add_argument(
+        "--write", metavar="FOLDER", help="also write each scenario as a docx file"
+    )
+    for field in fields(SyntheticDocx):
+        name = "--" + field.name.replace("_", "-")
+        parser.add_argument(name, type=int, help="time one custom scenario")
+    return parser
+
+
+def main() -> None:
+    """Print phase times for each scenario."""
+    args = _get_parser().parse_args()
+    custom = {x.name: getattr(args, x.name) for x in fields(SyntheticDocx)}
+    custom = {k: v for k, v in custom.items() if v is not None}
+    if custom:
+        scenarios = {"custom": SyntheticDocx(**custom)}
+    else:
+        scenarios = {
+            k: replace(v, paragraphs=int(v.paragraphs * args.scale))
+            for k, v in SCENARIOS.items()
+        }
+
+    columns = (*PHASES, "total")
+    print(f"{'seconds':<14}" + "".join(f"{x:>9}" for x in columns))
+    for name, docx in scenarios.items():
+        if args.write:
+            docx.write(f"{args.write}/{name.replace(' ', '_')}.docx")
+        times = time_phases(docx, args.repeat)
+        print(f"{name:<14}" + "".join(f"{times[x]:>9.4f}" for x in columns))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""Measure memory used to collect text into a DepthCollector.
+
+:author: Shay Hill
+:created: 2023-07-03
+
+Each workload is run once untraced (for time) and once under ``tracemalloc``. Print
+
+    * ``peak``: the most memory held by Python at any time during the workload
+    * ``held``: memory held by the output when the workload ends
+    * ``blocks``: memory blocks held by the output when the workload ends
+    * ``seconds``: time for the workload (without tracing)
+
+Workloads:
+
+    * ``paragraphs``: the DepthCollector calls ``get_text`` makes for a document of
+      ``--paragraphs`` paragraphs, each with a bullet and eight runs.
+    * ``one paragraph``: the same number of runs in a single paragraph. Every run
+      is held until the paragraph is closed, so this shows the size of each run.
+    * ``extract``: ``get_text`` on a synthetic docx of ``--paragraphs``
+      paragraphs. The xml is parsed before tracing starts.
+
+Run from the project root::
+
+    python -m benchmarks.memory
+    python -m benchmarks.memory --paragraphs 20000 --html
+
+Use the same arguments before and after a change.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+from dataclasses import replace
+from typing import Callable, Dict
+
+from docx2python.depth_collector import DepthCollector
+from docx2python.docx_reader import DocxReader
+from docx2python.docx_text import get_text
+
+from .extract import SCENARIOS
+
+_RUNS_PER_PARAGRAPH = 8
+
+
+def collect_paragraphs(paragraphs: int, html: bool) -> object:
+    """Collect paragraphs of bulleted runs, as ``get_text`` would.
+
+    :param paragraphs: number of paragraphs
+    :param html: give every third paragraph and every other run an html style
+    :return: collected content
+    """
+    tables = DepthCollector(5)
+    for i in range(paragraphs):
+        _ = tables.commence_paragraph(["h1"] if html and i % 3 == 0 else [])
+        tables.insert_text_as_new_run("--\t" if i % 2 else "")
+        for j in range(_RUNS_PER_PARAGRAPH):
+            tables.commence_run(["b"] if html and j % 2 else [])
+            tables.add_text_into_open_run("lorem ")
+            tables.conclude_run()
+        tables.conclude_paragraph()
+    return tables.tree
+
+
+def collect_one_paragraph(runs: int, html: bool) -> object:
+    """Collect runs into one paragraph. Insert a tab after every tenth.
+
+    :param runs: number of runs
+    :param html: give every other run an html style
+    :return: collected content
+    """
+    tables = DepthCollector(5)
+    _ = tables.commence_paragraph()
+    for j in range(runs):
+        tables.commence_run(["b"] if html and j % 2 else [])
+        tables.add_text_into_open_run("lorem ")
+        tables.conclude_run()
+        if j % 10 == 0:
+            tables.insert_text_as_new_run("\t")
+    tables.conclude_paragraph()
+    return tables.tree
+
+
+def measure(workload: Callable[[], object]) -> Dict[str, float]:
+    """Time a workload then trace its memory.
+
+    :param workload: function to measure
+    :return: peak and held in KiB, blocks, and seconds
+    """
+    start = time.perf_counter()
+    _ = workload()
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    try:
+        output = workload()
+        held, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    del output
+    return {
+        "peak": peak / 1024,
+        "held": held / 1024,
+        "blocks": sum(x.count for x in snapshot.statistics("filename")),
+        "seconds": seconds,
+    }
+
+
+def measure_extract(paragraphs: int, html: bool) -> Dict[str, float]:
+    """Measure ``get_text`` on a synthetic docx with a parsed xml tree.
+
+    :param paragraphs: number of paragraphs in the synthetic docx
+    :param html: extract with html formatting
+    :return: peak and held in KiB, blocks, and seconds
+    """
+    docx = replace(SCENARIOS["flat"], paragraphs=paragraphs).to_bytesio()
+    with DocxReader(docx, html=html) as reader:
+        file = reader.file_of_type("officeDocument")
+        _ = file.root_element, file.rels, reader.numbering
+        return measure(lambda: get_text(file))
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    """Command-line arguments.
+
+    :return: argument parser
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    _ = parser.add_argument("--paragraphs", type=int, default=100_000)
+    _ = parser.add_argument("--html", action="store_true", help="html styles")
+    return parser
+
+
+def main() -> None:
+    """Print memory and time for each workload."""
+    args = _get_parser().parse_args()
+    workloads: Dict[str, Callable[[], Dict[str, float]]] = {
+        "paragraphs": lambda: measure(
+            lambda: collect_paragraphs(args.paragraphs, args.html)
+        ),
+        "one paragraph": lambda: measure(
+            lambda: collect_one_paragraph(args.paragraphs, args.html)
+        ),
+        "extract": lambda: measure_extract(args.paragraphs, args.html),
+    }
+    print(f"{args.paragraphs} paragraphs, html={args.html}")
+    print(
+        f"{'workload':<16}{'peak KiB':>12}{'held KiB':>12}{'blocks':>12}"
+        + f"{'seconds':>10}"
+    )
+    for name, workload in workloads.items():
+        results = workload()
+        print(
+            f"{name:<16}{results['peak']:>12,.0f}{results['held']:>12,.0f}"
+            + f"{results['blocks']:>12,.0f}{results['seconds']:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Time merge_elems on deeply nested tables.
+
+:author: Shay Hill
+:created: 2023-07-03
+
+Each nested table holds a cell with a few paragraphs of mergeable runs then another
+table. Before ``get_content_elems``, ``merge_elems`` called ``has_content`` on every
+child at every level, so time per element grew with nesting depth. Time per element
+should now be roughly constant.
+
+Run from the project root::
+
+    python -m benchmarks.merge_elems
+"""
+
+from __future__ import annotations
+
+import time
+
+from lxml import etree
+
+from docx2python.docx_reader import DocxReader
+from docx2python.merge_runs import merge_elems
+
+from .synthetic import SyntheticDocx
+
+
+def time_merge_elems(depth: int) -> tuple[int, float]:
+    """Time merge_elems on a document with ``depth`` nested tables.
+
+    :param depth: number of nested tables
+    :return: number of elements before merging, seconds to merge
+    """
+    docx = SyntheticDocx(paragraphs=1, table_depth=depth, table_every=1)
+    with DocxReader(docx.to_bytesio()) as reader:
+        file = reader.file_of_type("officeDocument")
+        parser = etree.XMLParser(huge_tree=True)
+        root = etree.fromstring(reader.zipf.read(file.path), parser)
+        elem_count = sum(1 for _ in root.iter())
+        start = time.perf_counter()
+        merge_elems(file, root)
+        return elem_count, time.perf_counter() - start
+
+
+def main() -> None:
+    """Print merge time per element for increasingly deep nests."""
+    print(f"{'depth':>6} {'elements':>9} {'seconds':>9} {'us/element':>11}")
+    for depth in (25, 50, 100, 200):
+        elem_count, seconds = time_merge_elems(depth)
+        per_elem = seconds / elem_count * 1e6
+        print(f"{depth:>6} {elem_count:>9} {seconds:>9.4f} {per_elem:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""Write deterministic, synthetic docx files of any size.
+
+:author: Shay Hill
+:created: 2023-07-03
+
+``tests/resources`` holds small files written by Word, LibreOffice, etc. These are
+good for testing, but not for timing, because nothing about them can be scaled.
+``SyntheticDocx`` writes a minimal docx with a body of ``paragraphs`` paragraphs
+and optionally::
+
+    * ``runs`` runs per paragraph. Formatting alternates every two runs, so half
+      of the runs can be merged.
+    * a ``table_depth``-deep nest of tables every ``table_every`` paragraphs.
+      Each cell holds two paragraphs and the next table.
+    * a numbered paragraph (two levels) every ``list_every`` paragraphs
+    * a hyperlink, split in two like Word splits links, every ``link_every``
+      paragraphs
+    * an inline image every ``image_every`` paragraphs
+
+Output is the same for the same arguments::
+
+    docx = SyntheticDocx(paragraphs=10_000, runs=8, table_depth=5).to_bytesio()
+    with docx2python(docx) as content:
+        ...
+"""
+
+from __future__ import annotations
+
+import zipfile
+from dataclasses import dataclass
+from io import BytesIO
+from pathlib import Path
+
+from docx2python.namespace import NSMAP
+
+_XML_HEAD = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+
+_REL_TYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/"
+
+_CONTENT_TYPES = (
+    _XML_HEAD
+    + '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    + '<Default Extension="rels" '
+    + 'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    + '<Default Extension="xml" ContentType="application/xml"/>'
+    + '<Default Extension="png" ContentType="image/png"/>'
+    + "</Types>"
+)
+
+_RELS = (
+    _XML_HEAD
+    + '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/'
+    + f'relationships"><Relationship Id="rId1" Type="{_REL_TYPE}officeDocument" '
+    + 'Target="word/document.xml"/></Relationships>'
+)
+
+_NUMBERING = (
+    _XML_HEAD
+    + f'<w:numbering xmlns:w="{NSMAP["w"]}">'
+    + '<w:abstractNum w:abstractNumId="0">'
+    + '<w:lvl w:ilvl="0"><w:start w:val="1"/><w:numFmt w:val="decimal"/></w:lvl>'
+    + '<w:lvl w:ilvl="1"><w:start w:val="1"/><w:numFmt w:val="lowerLetter"/></w:lvl>'
+    + "</w:abstractNum>"
+    + '<w:num w:numId="1"><w:abstractNumId w:val="0"/></w:num>'
+    + "</w:numbering>"
+)
+
+# a 1x1 transparent png
+_PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    + "1f15c4890000000d49444154789c6360000002000154a24f5d0000000049454e44ae426082"
+)
+
+_WORDS = ("lorem", "ipsum", "dolor", "sit", "amet", "consectetur", "adipiscing")
+
+_IMAGE = (
+    '<w:r><w:drawing><wp:inline><wp:docPr id="1" name="image" descr="synthetic"/>'
+    + '<a:graphic><a:graphicData><a:blip r:embed="rIdImage"/></a:graphicData>'
+    + "</a:graphic></wp:inline></w:drawing></w:r>"
+)
+
+
+def _get_run(i: int) -> str:
+    """A text run. Formatting alternates every two runs.
+
+    :param i: index of the run
+    :return: run xml
+    """
+    rpr = "<w:rPr><w:b/></w:rPr>" if i // 2 % 2 else ""
+    return f"<w:r>{rpr}<w:t xml:space=\"preserve\">{_WORDS[i % 7]} </w:t></w:r>"
+
+
+@dataclass(frozen=True)
+class SyntheticDocx:
+    """Parameters for a synthetic docx file. Zero disables an option.
+
+    :param paragraphs: number of paragraphs in the body (not counting tables)
+    :param runs: text runs per paragraph
+    :param table_depth: depth of each nest of tables
+    :param table_every: insert a nest of tables after every n paragraphs
+    :param list_every: number every nth paragraph
+    :param link_every: add a hyperlink to every nth paragraph
+    :param image_every: add an image to every nth paragraph
+    """
+
+    paragraphs: int = 1000
+    runs: int = 4
+    table_depth: int = 0
+    table_every: int = 100
+    list_every: int = 0
+    link_every: int = 0
+    image_every: int = 0
+
+    def _get_paragraph(self, i: int) -> str:
+        """A paragraph with optional numbering, hyperlink, and image.
+
+        :param i: index of the paragraph
+        :return: paragraph xml
+        """
+        ppr = ""
+        if self.list_every and i % self.list_every == 0:
+            ilvl = i // self.list_every % 2
+            ppr = (
+                f'<w:pPr><w:numPr><w:ilvl w:val="{ilvl}"/><w:numId w:val="1"/>'
+                + "</w:numPr></w:pPr>"
+            )
+        runs = "".join(_get_run(j) for j in range(self.runs))
+        if self.link_every and i % self.link_every == 0:
+            link = i // self.link_every
+            runs += "".join(
+                f'<w:hyperlink r:id="rIdLink{link}_{half}">{_get_run(half)}'
+                + "</w:hyperlink>"
+                for half in range(2)
+            )
+        if self.image_every and i % self.image_every == 0:
+            runs += _IMAGE
+        return f"<w:p>{ppr}{runs}</w:p>"
+
+    def _get_tables(self, i: int) -> str:
+        """A nest of tables, two paragraphs in each cell.
+
+        :param i: index of the paragraph before the nest
+        :return: table xml
+        """
+        cell_pars = self._get_paragraph(i) + self._get_paragraph(i + 1)
+        open_ = ("<w:tbl><w:tr><w:tc>" + cell_pars) * self.table_depth
+        close = ("<w:p/></w:tc></w:tr></w:tbl>") * self.table_depth
+        return open_ + close
+
+    def _get_links(self) -> list[int]:
+        """Index of each hyperlink, as numbered in ``_get_paragraph``.
+
+        :return: indices for hyperlink rIds
+
+        ``_get_tables`` builds paragraph ``i + 1`` after paragraph ``i``, so there
+        may be a link for paragraph index ``self.paragraphs``.
+        """
+        if not self.link_every:
+            return []
+        return list(range(self.paragraphs // self.link_every + 1))
+
+    def get_document_xml(self) -> str:
+        """Build word/document.xml.
+
+        :return: document xml string
+        """
+        body: list[str] = []
+        for i in range(self.paragraphs):
+            body.append(self._get_paragraph(i))
+            if self.table_depth and self.table_every and i % self.table_every == 0:
+                body.append(self._get_tables(i))
+        namespaces = " ".join(f'xmlns:{k}="{NSMAP[k]}"' for k in ("w", "r", "wp", "a"))
+        return (
+            _XML_HEAD
+            + f"<w:document {namespaces}><w:body>"
+            + "".join(body)
+            + "</w:body></w:document>"
+        )
+
+    def get_document_rels(self) -> str:
+        """Build word/_rels/document.xml.rels.
+
+        :return: rels xml string
+        """
+        rels = [
+            f'<Relationship Id="rIdNumbering" Type="{_REL_TYPE}numbering" '
+            + 'Target="numbering.xml"/>',
+            f'<Relationship Id="rIdImage" Type="{_REL_TYPE}image" '
+            + 'Target="media/image1.png"/>',
+        ]
+        for link in self._get_links():
+            rels += [
+                f'<Relationship Id="rIdLink{link}_{half}" Type="{_REL_TYPE}hyperlink" '
+                + f'Target="https://example.com/{link}" TargetMode="External"/>'
+                for half in range(2)
+            ]
+        return (
+            _XML_HEAD
+            + '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/'
+            + 'relationships">'
+            + "".join(rels)
+            + "</Relationships>"
+        )
+
+    def to_bytesio(self) -> BytesIO:
+        """Write a docx file in memory.
+
+        :return: docx file in memory
+        """
+        docx = BytesIO()
+        with zipfile.ZipFile(docx, "w", zipfile.ZIP_DEFLATED) as zipf:
+            zipf.writestr("[Content_Types].xml", _CONTENT_TYPES)
+            zipf.writestr("_rels/.rels", _RELS)
+            zipf.writestr("word/document.xml", self.get_document_xml())
+            zipf.writestr("word/_rels/document.xml.rels", self.get_document_rels())
+            zipf.writestr("word/numbering.xml", _NUMBERING)
+            zipf.writestr("word/media/image1.png", _PNG)
+        _ = docx.seek(0)
+        return docx
+
+    def write(self, path: str | Path) -> None:
+        """Write a docx file to disk.
+
+        :param path: path to the new docx file
+        """
+        _ = Path(path).write_bytes(self.to_bytesio().getvalue())
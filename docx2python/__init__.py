@@ -1,11 +1,12 @@
-"""Import function docx2python into the docx2python namespace.
+"""Import functions docx2python and docx2python_many into the docx2python namespace.
 
 :author: Shay Hill
 :created: 2023-01-09
 """
 
+from .batch import DocxResult, docx2python_many
 from .main import docx2python
 
-__all__ = ["docx2python"]
+__all__ = ["docx2python", "docx2python_many", "DocxResult"]
 
 # TODO: remove import cycles (turn back on in pyproject.toml)
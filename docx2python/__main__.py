@@ -0,0 +1,12 @@
+"""Run the command-line extractor with ``python -m docx2python``.
+
+:author: Shay Hill
+:created: 2023-07-03
+"""
+
+import sys
+
+from .cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
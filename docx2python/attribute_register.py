@@ -8,7 +8,7 @@ record spelling errors, revision history, etc. Docx2Python will ignore (by desig
 much of this.
 """
 from enum import Enum
-from typing import Callable, Iterator, NamedTuple, Optional
+from typing import Callable, FrozenSet, NamedTuple, Optional, Set
 
 from lxml.etree import _Element as EtreeElement  # type: ignore
 
@@ -74,6 +74,18 @@ XML2HTML_FORMATTER = {
     "Heading6": HtmlFormatter(lambda tag, val: "h6"),
 }
 
+# the formatters above, before any are added, removed, or replaced
+BUILTIN_XML2HTML_FORMATTER = dict(XML2HTML_FORMATTER)
+
+
+def has_builtin_formatter() -> bool:
+    """
+    Has XML2HTML_FORMATTER been left as docx2python defines it?
+
+    :return: False if any formatter has been added, removed, or replaced
+    """
+    return XML2HTML_FORMATTER == BUILTIN_XML2HTML_FORMATTER
+
 
 class Tags(str, Enum):
     """
@@ -111,7 +123,32 @@ class Tags(str, Enum):
 # ``file_instance.rels[elem.attrib[RELS_ID]]``
 RELS_ID = qn("r:id")
 
-_CONTENT_TAGS = set(Tags) - {Tags.RUN_PROPERTIES, Tags.PAR_PROPERTIES}
+_CONTENT_TAGS: Set[str] = set(Tags) - {Tags.RUN_PROPERTIES, Tags.PAR_PROPERTIES}
+
+# the content tags above, before any are added with ``register_content_tag``
+BUILTIN_CONTENT_TAGS = frozenset(_CONTENT_TAGS)
+
+
+def register_content_tag(tag: str) -> None:
+    """
+    Treat elements with this tag as content.
+
+    :param tag: Clark-notation tag (e.g., ``qn("w:fldSimple")``)
+
+    Elements without content (see ``has_content``) are skipped during extraction and
+    merging. A custom tag handler (see ``docx_text.register_tag_handler``) will
+    never see an element unless its tag is registered here.
+    """
+    _CONTENT_TAGS.add(str(tag))
+
+
+def get_content_tags() -> FrozenSet[str]:
+    """
+    Get every tag treated as content.
+
+    :return: the built-in content tags and any added with ``register_content_tag``
+    """
+    return frozenset(_CONTENT_TAGS)
 
 
 def has_content(tree: EtreeElement) -> Optional[str]:
@@ -130,16 +167,25 @@ def has_content(tree: EtreeElement) -> Optional[str]:
     If no content is found, the element can be safely ignored going forward.
     """
 
-    def iter_content(tree_: EtreeElement) -> Iterator[str]:
-        """Yield all content elements in tree
+    return next((str(x.tag) for x in tree.iter(*_CONTENT_TAGS)), None)
+
 
-        :param tree_: xml element
-        :yield: child content elements
-        :return: None
-        """
-        if tree_.tag in _CONTENT_TAGS:
-            yield tree_.tag
-        for branch in tree_:
-            yield from iter_content(branch)
+def get_content_elems(root: EtreeElement) -> Set[EtreeElement]:
+    """
+    Every element under (and including) root with a descendent content element.
 
-    return next(iter_content(tree), None)
+    :param root: xml element
+    :return: a set of elements for which ``has_content`` would return a tag
+
+    ``has_content`` walks the entire subtree of an element. Calling it on every
+    element in a tree walks every subtree once per ancestor. This finds the same
+    information for every element in one pass. Each content element marks itself
+    and its ancestors, stopping at the first ancestor already marked, so every
+    element is marked at most once.
+    """
+    content_elems: Set[EtreeElement] = set()
+    for elem in root.iter(*_CONTENT_TAGS):
+        while elem is not None and elem not in content_elems:
+            content_elems.add(elem)
+            elem = None if elem is root else elem.getparent()
+    return content_elems
@@ -0,0 +1,257 @@
+"""Extract many docx files in parallel.
+
+:author: Shay Hill
+:created: 2023-07-03
+
+``docx2python`` extracts one file on one core. ``docx2python_many`` fans files out
+over a process pool. A ``DocxContent`` instance holds an open zipfile and lxml
+elements, so it cannot be sent between processes. Each worker extracts everything
+a ``DocxContent`` instance would and returns it as a plain (picklable)
+``DocxResult``::
+
+    for result in docx2python_many(paths, html=True, max_workers=8):
+        if result.error is None:
+            print(result.source, result.text)
+
+Exceptions raised while extracting one file are caught and recorded in
+``DocxResult.error``, so one bad file will not stop the batch.
+
+With ``flat=True``, runs are returned in one ``FlatContent`` instance (see
+``flat_content``) instead of nested lists. This is much faster to send between
+processes.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    as_completed,
+    wait,
+)
+from dataclasses import dataclass, field
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, Iterator, Optional, Union
+
+from .docx_output import get_part_types
+from .flat_content import FlatContent
+from .iterators import TablesList, get_html_map, join_runs
+from .main import docx2python
+
+DocxSource = Union[str, Path, bytes, BytesIO]
+
+
+@dataclass
+class DocxResult:
+    """Picklable extraction results for one docx file.
+
+    :param index: position of the file in the ``docx2python_many`` input
+    :param source: str(path) of the file, or None if the file was bytes or BytesIO
+    :param header_runs: text runs [[[[str]]]] like ``DocxContent.header_runs``
+    :param footer_runs: text runs [[[[str]]]] like ``DocxContent.footer_runs``
+    :param body_runs: text runs [[[[str]]]] like ``DocxContent.body_runs``
+    :param footnotes_runs: text runs [[[[str]]]] like ``DocxContent.footnotes_runs``
+    :param endnotes_runs: text runs [[[[str]]]] like ``DocxContent.endnotes_runs``
+    :param flat: if ``docx2python_many(..., flat=True)``, runs of every part like
+        ``DocxContent.to_flat()``. The x_runs fields will be empty.
+    :param text: all paragraphs "\\n\\n" joined like ``DocxContent.text``
+    :param images: image names mapped to image sizes in bytes. Image data is not
+        returned. Use ``docx2python(source).images`` for that.
+    :param core_properties: like ``DocxContent.core_properties``
+    :param image_folder: folder images were written to, if any
+    :param size: size of the docx file in bytes
+    :param seconds: time spent extracting the file
+    :param error: if extraction failed, the exception as a string. Fields other
+        than index, source, size, and seconds will be empty.
+    """
+
+    index: int
+    source: Optional[str]
+    header_runs: TablesList = field(default_factory=list)
+    footer_runs: TablesList = field(default_factory=list)
+    body_runs: TablesList = field(default_factory=list)
+    footnotes_runs: TablesList = field(default_factory=list)
+    endnotes_runs: TablesList = field(default_factory=list)
+    flat: Optional[FlatContent] = None
+    text: str = ""
+    images: Dict[str, int] = field(default_factory=dict)
+    core_properties: Dict[str, Optional[str]] = field(default_factory=dict)
+    image_folder: Optional[str] = None
+    size: int = 0
+    seconds: float = 0
+    error: Optional[str] = None
+
+    @property
+    def document_runs(self) -> TablesList:
+        """All x_runs fields concatenated.
+
+        :return: text runs [[[[str]]]]
+        """
+        if self.flat is not None:
+            return self.flat.to_tables()
+        return (
+            self.header_runs
+            + self.body_runs
+            + self.footer_runs
+            + self.footnotes_runs
+            + self.endnotes_runs
+        )
+
+    @property
+    def html_map(self) -> str:
+        """A visual mapping of docx content.
+
+        :return: html to show all strings with index tuples
+        """
+        return get_html_map(join_runs(self.document_runs))
+
+
+def _get_image_folder(
+    image_folder: str | None, index: int, source: str | None
+) -> str | None:
+    """Name a subfolder of image_folder for images from one docx file.
+
+    :param image_folder: folder for images from all files
+    :param index: position of the file in the ``docx2python_many`` input
+    :param source: str(path) of the file, or None if the file was bytes or BytesIO
+    :return: ``image_folder/{index}-{filename stem}`` or ``image_folder/{index}``.
+        The index keeps files with the same name from writing to the same folder.
+    """
+    if image_folder is None:
+        return None
+    name = str(index) if source is None else f"{index}-{Path(source).stem}"
+    return os.path.join(image_folder, name)
+
+
+def _extract(
+    index: int,
+    docx: DocxSource,
+    image_folder: str | None,
+    kwargs: Dict[str, Any],
+    flat: bool = False,
+) -> DocxResult:
+    """Extract one docx file into a DocxResult. Runs in a worker process.
+
+    :param index: position of the file in the ``docx2python_many`` input
+    :param docx: path to a docx file or docx file bytes
+    :param image_folder: if not None, write images to a subfolder of this folder
+    :param kwargs: keyword arguments for ``docx2python``
+    :param flat: return runs in ``DocxResult.flat`` instead of the x_runs fields
+    :return: DocxResult instance
+    """
+    start = time.perf_counter()
+    source = None if isinstance(docx, (bytes, BytesIO)) else str(docx)
+    if isinstance(docx, bytes):
+        docx = BytesIO(docx)
+    image_folder = _get_image_folder(image_folder, index, source)
+    size = 0
+    try:
+        if isinstance(docx, BytesIO):
+            size = len(docx.getbuffer())
+        else:
+            size = os.path.getsize(docx)
+        with docx2python(docx, **kwargs) as content:
+            if image_folder is not None:
+                _ = content.save_images(image_folder)
+            if flat:
+                runs: Dict[str, Any] = {"flat": content.to_flat()}
+            else:
+                runs = {
+                    "header_runs": content.header_runs,
+                    "footer_runs": content.footer_runs,
+                    "body_runs": content.body_runs,
+                    "footnotes_runs": content.footnotes_runs,
+                    "endnotes_runs": content.endnotes_runs,
+                }
+            return DocxResult(
+                index,
+                source,
+                text=content.text,
+                images=content.image_sizes,
+                core_properties=content.core_properties,
+                image_folder=image_folder,
+                size=size,
+                seconds=time.perf_counter() - start,
+                **runs,
+            )
+    except Exception as exc:  # record any failure and keep going
+        return DocxResult(
+            index,
+            source,
+            size=size,
+            seconds=time.perf_counter() - start,
+            error=f"{type(exc).__name__}: {exc}",
+        )
+
+
+def docx2python_many(
+    docx_filenames: Iterable[DocxSource],
+    html: bool = False,
+    paragraph_styles: bool = False,
+    duplicate_merged_cells: bool = False,
+    image_folder: str | None = None,
+    max_workers: int | None = None,
+    ordered: bool = True,
+    parts: Iterable[str] | None = None,
+    cache_dir: str | None = None,
+    flat: bool = False,
+) -> Iterator[DocxResult]:
+    """Extract docx files in a process pool.
+
+    :param docx_filenames: paths to docx files or docx file bytes (or BytesIO)
+    :param html: bool, extract some formatting as html
+    :param paragraph_styles: prepend the paragraphs style (if any, else "") to each
+        paragraph. This will only be useful with ``*_runs`` attributes.
+    :param duplicate_merged_cells: bool, duplicate merged cells to return a mxn
+        nested list for each table (default False)
+    :param image_folder: optionally write images to a subfolder of this folder
+        for each file (see ``DocxResult.image_folder``)
+    :param max_workers: number of worker processes (default os.cpu_count())
+    :param ordered: if True (default), yield results in input order. If False,
+        yield results as they are completed. Either way, ``DocxResult.index`` is
+        the position of the file in ``docx_filenames``.
+    :param parts: optionally extract only these parts (see ``docx2python``).
+        Runs fields of other parts will be empty.
+    :param cache_dir: optionally read and store extracted content in this
+        directory (see ``disk_cache``). Workers share the directory.
+    :param flat: return runs in ``DocxResult.flat`` (see ``flat_content``)
+        instead of nested lists in the x_runs fields. Faster to send from the
+        worker processes.
+    :return: a DocxResult for each input file
+
+    Only a few files per worker are submitted at a time, so ``docx_filenames`` can
+    be a long (or endless) generator.
+    """
+    kwargs = {
+        "html": html,
+        "paragraph_styles": paragraph_styles,
+        "duplicate_merged_cells": duplicate_merged_cells,
+        "parts": None if parts is None else get_part_types(parts),
+        "cache": cache_dir,
+    }
+    max_workers = max_workers or os.cpu_count() or 1
+    window = max_workers * 4
+    pending: Deque[Future[DocxResult]] = deque()
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for index, docx in enumerate(docx_filenames):
+            future = executor.submit(_extract, index, docx, image_folder, kwargs, flat)
+            pending.append(future)
+            if len(pending) < window:
+                continue
+            if ordered:
+                yield pending.popleft().result()
+                continue
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.remove(future)
+                yield future.result()
+        if ordered:
+            while pending:
+                yield pending.popleft().result()
+            return
+        yield from (x.result() for x in as_completed(pending))
@@ -16,13 +16,29 @@ during the extraction.
 from __future__ import annotations
 
 import warnings
-from collections import defaultdict
-from typing import Callable
+from typing import Callable, cast
 
 from lxml.etree import _Element as EtreeElement  # type: ignore
 
 from docx2python import numbering_formats as nums
+from docx2python.docx_context import NumberingLevels, numbering_from_maps
 from docx2python.namespace import qn
+from docx2python.text_runs import get_pPr
+
+_W_VAL = qn("w:val")
+_W_NUMPR = qn("w:numPr")
+_W_NUMID = qn("w:numId")
+_W_ILVL = qn("w:ilvl")
+
+
+_NUMFMT2BULLET_FUNCTION: dict[str, Callable[[int], str]] = {
+    "decimal": nums.decimal,
+    "lowerLetter": nums.lower_letter,
+    "upperLetter": nums.upper_letter,
+    "lowerRoman": nums.lower_roman,
+    "upperRoman": nums.upper_roman,
+    "bullet": nums.bullet,
+}
 
 
 def _get_bullet_function(numFmt: str) -> Callable[[int], str]:
@@ -32,17 +48,8 @@ def _get_bullet_function(numFmt: str) -> Callable[[int], str]:
     :return: a function that takes an int and returns a string. If numFmt is not
         recognized, treat numbers as bullets.
     """
-    numFmt2bullet_function: dict[str, Callable[[int], str]] = {
-        "decimal": nums.decimal,
-        "lowerLetter": nums.lower_letter,
-        "upperLetter": nums.upper_letter,
-        "lowerRoman": nums.lower_roman,
-        "upperRoman": nums.upper_roman,
-        "bullet": nums.bullet,
-    }
     try:
-        retval_: Callable[[int], str] = numFmt2bullet_function[numFmt]
-        return retval_
+        return _NUMFMT2BULLET_FUNCTION[numFmt]
     except KeyError:
         warnings.warn(
             f"{numFmt} numbering format not implemented, "
@@ -51,28 +58,13 @@ def _get_bullet_function(numFmt: str) -> Callable[[int], str]:
         return nums.bullet
 
 
-def _new_list_counter() -> defaultdict[str, defaultdict[str, int]]:
-    """
-    A counter, starting at zero, for each numId
-
-    :return: {
-        a_numId: 0,
-        b_numId: 0
-    }
-
-    This is what you need to keep track of where every nested list is at.
+def _increment_level_count(counts: list[int], ilvl: int) -> int:
     """
-    return defaultdict(lambda: defaultdict(lambda: 0))
+    Increase count at ilvl, reset counts at deeper levels.
 
-
-def _increment_list_counter(ilvl2count: defaultdict[str, int], ilvl: str) -> int:
-    """
-    Increase counter at ilvl, reset counter at deeper levels.
-
-    :param ilvl2count: context['numId2count']
-    :param ilvl: string representing an integer
-    :return: updated count at ilvl.
-        updates context['numId2count'] by reference
+    :param counts: count of one numId by ilvl. Updated in place.
+    :param ilvl: indentation level
+    :return: updated count at ilvl
 
     On a numbered list, the count for sub-lists should reset when a parent list
     increases, e.g.,
@@ -82,15 +74,12 @@ def _increment_list_counter(ilvl2count: defaultdict[str, int], ilvl: str) -> int
         b. sublist continues
     2. back to top-level list
         a. sublist counter has been reset
-
-    List counters are defaultdicts, so we can reset sublist counters by deleting
-    them.
     """
-    ilvl2count[ilvl] += 1
-    deeper_levels = [x for x in ilvl2count.keys() if x > ilvl]
-    for level in deeper_levels:
-        del ilvl2count[level]
-    return ilvl2count[ilvl]
+    if ilvl >= len(counts):
+        counts.extend([0] * (ilvl + 1 - len(counts)))
+    counts[ilvl] += 1
+    counts[ilvl + 1 :] = [0] * (len(counts) - ilvl - 1)
+    return counts[ilvl]
 
 
 class BulletGenerator:
@@ -98,15 +87,26 @@ class BulletGenerator:
     Keep track of list counters and generate bullet strings.
     """
 
-    def __init__(self, numId2numFmts: dict[str, list[str]], numId2numStarts: dict[str, list[str]]) -> None:
+    def __init__(
+        self,
+        numbering: dict[str, NumberingLevels] | dict[str, list[str]],
+        numId2numStarts: dict[str, list[str]] | None = None,
+    ) -> None:
         """
-        Set numId2numFmts. Initiate counters.
+        Set numbering formats. Initiate counters.
+
+        :param numbering: numId mapped to NumberingLevels (``DocxReader.numbering``)
+            or, as in earlier versions, numId mapped to numFmts by ilvl
+            (``DocxReader.numId2numFmts``)
+        :param numId2numStarts: if numbering is numId2numFmts, optionally numId
+            mapped to starts by ilvl. Lists start at 1 if not given.
         """
-        self.numId2numFmts = numId2numFmts
-        # print(f"numId2numFmts: {numId2numFmts}\n\n")
-        self.numId2numStarts = numId2numStarts
-        # print(f"numId2numStarts: {numId2numStarts}\n\n")
-        self.numId2count = _new_list_counter()
+        if all(isinstance(x, NumberingLevels) for x in numbering.values()):
+            self.numbering = cast("dict[str, NumberingLevels]", numbering)
+        else:
+            numId2numFmts = cast("dict[str, list[str]]", numbering)
+            self.numbering = numbering_from_maps(numId2numFmts, numId2numStarts)
+        self.numId2count: dict[str, list[int]] = {}
 
     def get_bullet(self, paragraph: EtreeElement) -> str:
         """
@@ -130,46 +130,61 @@ class BulletGenerator:
 
         bullet preceded by one tab for every indentation level.
         """
-        try:
-            numStart = 1
-            pPr = next(paragraph.iterfind(qn("w:pPr")))
-            # print('-------------------------')
-            # print(f"pPr: {pPr}\n")
-            numPr = next(pPr.iterfind(qn("w:numPr")))
-            # print(f"numPr: {numPr}\n")
-            numId = next(numPr.iterfind(qn("w:numId"))).attrib[qn("w:val")]
-            # print(f"numId: {numId}\n")
-            ilvl = next(numPr.iterfind(qn("w:ilvl"))).attrib[qn("w:val")]
-            # print(f"ilvl: {ilvl}\n")
-            # print(f"numStart: {numStart} pPr: {pPr} numPr: {numPr} numId: {numId} ilvl: {ilvl}\n")
-            try:
-                numFmt = self.numId2numFmts[str(numId)][int(ilvl)]
-                # print(f"numFmt: {numFmt}\n")
-            except IndexError:
-                # give up and put a bullet
-                numFmt = "bullet"
-            try:
-                numStart = int(self.numId2numStarts[str(numId)][int(ilvl)])
-            except:
-                numStart = 1
-        except (StopIteration, KeyError):
-            # not a numbered paragraph
-            # print("not a numbered paragraph")
+        return self.get_pPr_bullet(get_pPr(paragraph))
+
+    def get_pPr_bullet(self, pPr: EtreeElement | None) -> str:
+        """
+        Get bullet string from the paragraph properties of a paragraph.
+
+        :param pPr: <w:pPr> xml element (see ``text_runs.get_pPr``) or None
+        :return: specified 'bullet' string or '' if paragraph is not numbered
+
+        This is ``get_bullet`` after the pPr has been found. Most paragraphs are not
+        numbered, so return as soon as an element is missing.
+        """
+        if pPr is None:
+            return ""
+        numPr = pPr.find(_W_NUMPR)
+        if numPr is None:
+            return ""
+        numId = numPr.find(_W_NUMID)
+        ilvl = numPr.find(_W_ILVL)
+        if numId is None or ilvl is None:
+            return ""
+        numId_val = numId.attrib.get(_W_VAL)
+        ilvl_val = ilvl.attrib.get(_W_VAL)
+        if numId_val is None or ilvl_val is None:
             return ""
+        return self.get_numbered_bullet(str(numId_val), str(ilvl_val))
 
-        def format_bullet(bullet: str) -> str:
-            """Indent, format and pad the bullet or number string.
-
-            :param bullet: any kind of list-item string (bullet, number, Roman, ...)
-            :return: formatted bullet string
-            """
-            if bullet != nums.bullet():
-                bullet += ")"
-            lol = "\t" * int(ilvl) + bullet + "\t"
-            # print(f"bullet: {lol}\n")
-            return "\t" * int(ilvl) + bullet + "\t"
-
-        number = _increment_list_counter(self.numId2count[numId], str(ilvl))
-        get_unformatted_bullet_str = _get_bullet_function(numFmt)
-        # return format_bullet(get_unformatted_bullet_str(number))
-        return format_bullet(get_unformatted_bullet_str(number+numStart-1))
+    def get_numbered_bullet(self, numId: str, ilvl: str) -> str:
+        """
+        Get bullet string for a numbered paragraph. (e.g, '--  ' or '1)  ')
+
+        :param numId: the w:val of the paragraph's <w:numId> element
+        :param ilvl: the w:val of the paragraph's <w:ilvl> element
+        :return: specified 'bullet' string or '' if numId is not defined
+
+        This is ``get_bullet`` after the numId and ilvl have been read from the
+        paragraph. Call it if you have already read them (e.g., while parsing).
+        """
+        levels = self.numbering.get(numId)
+        if levels is None:
+            # not a numbered paragraph
+            return ""
+        ilvl_ = int(ilvl)
+        try:
+            numFmt = levels.numFmts[ilvl_]
+            numStart = levels.starts[ilvl_]
+        except IndexError:
+            # give up and put a bullet
+            numFmt, numStart = "bullet", 1
+
+        counts = self.numId2count.get(numId)
+        if counts is None:
+            counts = self.numId2count[numId] = [0] * len(levels.numFmts)
+        number = _increment_level_count(counts, ilvl_)
+        bullet = _get_bullet_function(numFmt)(number + numStart - 1)
+        if bullet != nums.bullet():
+            bullet += ")"
+        return "\t" * ilvl_ + bullet + "\t"
@@ -0,0 +1,233 @@
+"""Extract docx files from the command line.
+
+:author: Shay Hill
+:created: 2023-07-03
+
+Write one JSON line per docx file::
+
+    python -m docx2python path/to/file.docx
+    python -m docx2python path/to/folder --runs --jobs 8 -o out.jsonl
+    python -m docx2python "reports/**/*.docx" --html --images path/to/images
+
+Each line holds ``index`` (position in the input), ``source`` (path), ``error``
+(None unless extraction failed) and whichever outputs were selected:
+
+    * ``text`` (default if no text output is selected): all paragraphs "\\n\\n" joined
+    * ``runs``: ``{"header": [[[[str]]]], "body": ..., "footer": ..., ...}``
+    * ``html_map``: see ``DocxContent.html_map``
+    * ``properties``: document core properties
+    * ``images``: image names mapped to sizes in bytes, and ``image_folder``, the
+      folder the images were written to
+
+A summary (documents, errors, docs/s, MB/s) is written to stderr when all files
+are done. Exit status is 1 if any file could not be extracted, 2 if no files were
+found.
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import json
+import sys
+import time
+from pathlib import Path
+from typing import IO, Any, Iterator, Sequence
+
+from .batch import DocxResult, docx2python_many
+from .docx_output import get_part_types
+
+
+def iter_docx_paths(patterns: Sequence[str]) -> Iterator[Path]:
+    """Find docx files in files, directory trees, and glob patterns.
+
+    :param patterns: paths to docx files, paths to folders, or glob patterns
+    :return: paths to docx files. Folders and glob patterns are sorted. Word lock
+        files (``~$*.docx``) are skipped in folders.
+    """
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            docx_paths = path.rglob("*.docx")
+            yield from sorted(x for x in docx_paths if not x.name.startswith("~$"))
+        elif path.is_file():
+            yield path
+        else:
+            yield from (Path(x) for x in sorted(glob.glob(pattern, recursive=True)))
+
+
+def _get_record(result: DocxResult, args: argparse.Namespace) -> dict[str, Any]:
+    """Select outputs from a DocxResult to write as a JSON line.
+
+    :param result: extraction result for one file
+    :param args: parsed command-line arguments
+    :return: dict with index, source, error, and selected outputs
+    """
+    record: dict[str, Any] = {
+        "index": result.index,
+        "source": result.source,
+        "error": result.error,
+    }
+    if result.error is not None:
+        return record
+    if args.text:
+        record["text"] = result.text
+    if args.runs:
+        record["runs"] = {
+            "header": result.header_runs,
+            "body": result.body_runs,
+            "footer": result.footer_runs,
+            "footnotes": result.footnotes_runs,
+            "endnotes": result.endnotes_runs,
+        }
+    if args.html_map:
+        record["html_map"] = result.html_map
+    if args.properties:
+        record["properties"] = result.core_properties
+    if args.images:
+        record["images"] = result.images
+        record["image_folder"] = result.image_folder
+    return record
+
+
+def _get_part(value: str) -> str:
+    """Validate a ``--parts`` value.
+
+    :param value: one command-line value for ``--parts``
+    :return: value unchanged
+    :raise argparse.ArgumentTypeError: if value is not a part name
+    """
+    try:
+        _ = get_part_types([value])
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from exc
+    return value
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    """Define command-line arguments.
+
+    :return: argument parser
+    """
+    parser = argparse.ArgumentParser(
+        prog="docx2python",
+        description="Extract docx files. Write one JSON line per file.",
+    )
+    parser.add_argument(
+        "paths", nargs="+", help="docx files, folders (searched recursively), or globs"
+    )
+    parser.add_argument("-o", "--output", help="write JSON lines here (default stdout)")
+
+    outputs = parser.add_argument_group("outputs (default --text)")
+    outputs.add_argument("--text", action="store_true", help="all text as a string")
+    outputs.add_argument("--runs", action="store_true", help="text runs per part")
+    outputs.add_argument("--html-map", action="store_true", help="html content map")
+    outputs.add_argument(
+        "--properties", action="store_true", help="document core properties"
+    )
+    outputs.add_argument(
+        "--images", metavar="FOLDER", help="write images to a subfolder per file"
+    )
+
+    options = parser.add_argument_group("extraction options")
+    options.add_argument("--html", action="store_true", help="format text as html")
+    options.add_argument(
+        "--paragraph-styles",
+        action="store_true",
+        help="prepend each paragraph's style to its runs",
+    )
+    options.add_argument(
+        "--duplicate-merged-cells",
+        action="store_true",
+        help="duplicate merged cells to return an mxn list for each table",
+    )
+    options.add_argument(
+        "--parts",
+        nargs="+",
+        type=_get_part,
+        metavar="PART",
+        help="only extract these parts (header, body, footer, footnotes, endnotes)",
+    )
+    options.add_argument(
+        "--cache", metavar="FOLDER", help="reuse content extracted into this folder"
+    )
+
+    processing = parser.add_argument_group("processing")
+    processing.add_argument(
+        "-j", "--jobs", type=int, default=1, help="number of worker processes"
+    )
+    processing.add_argument(
+        "--unordered",
+        action="store_true",
+        help="write each line as soon as its file is done",
+    )
+    processing.add_argument(
+        "-q", "--quiet", action="store_true", help="do not write a summary"
+    )
+    return parser
+
+
+def _write_summary(
+    stream: IO[str], count: int, errors: int, size: int, seconds: float
+) -> None:
+    """Write document count, error count, and throughput.
+
+    :param stream: where to write the summary
+    :param count: number of documents
+    :param errors: number of documents that could not be extracted
+    :param size: total size of documents in bytes
+    :param seconds: wall time
+    """
+    megabytes = size / 1_000_000
+    seconds = max(seconds, 1e-9)
+    _ = stream.write(
+        f"{count} documents ({errors} errors), {megabytes:.1f} MB in {seconds:.2f} s: "
+        + f"{count / seconds:.1f} docs/s, {megabytes / seconds:.2f} MB/s\n"
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Extract docx files and write one JSON line per file.
+
+    :param argv: command-line arguments (default sys.argv[1:])
+    :return: exit status. 1 if any file could not be extracted, 2 if no files
+        were found, else 0.
+    """
+    args = _get_parser().parse_args(argv)
+    if not (args.text or args.runs or args.html_map or args.properties):
+        args.text = True
+
+    results = docx2python_many(
+        iter_docx_paths(args.paths),
+        html=args.html,
+        paragraph_styles=args.paragraph_styles,
+        duplicate_merged_cells=args.duplicate_merged_cells,
+        image_folder=args.images,
+        max_workers=args.jobs,
+        ordered=not args.unordered,
+        parts=args.parts,
+        cache_dir=args.cache,
+    )
+
+    count = errors = size = 0
+    start = time.perf_counter()
+    if args.output is None:
+        output = sys.stdout
+    else:
+        output = open(args.output, "w", encoding="utf-8")
+    try:
+        for result in results:
+            count += 1
+            errors += result.error is not None
+            size += result.size
+            _ = output.write(json.dumps(_get_record(result, args)) + "\n")
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    if not args.quiet:
+        _write_summary(sys.stderr, count, errors, size, time.perf_counter() - start)
+    if count == 0:
+        _ = sys.stderr.write("docx2python: no docx files found\n")
+        return 2
+    return 1 if errors else 0
@@ -32,43 +32,46 @@ Pass out of package with depth_collector_instance.tree.
 from __future__ import annotations
 
 from contextlib import suppress
-from dataclasses import dataclass, field
-from typing import Any, Iterable
+from typing import Any, Iterable, Sequence
 
+from .iterators import IndexedItem
 from .text_runs import html_close, html_open
 
 
-@dataclass
 class Run:
-    """A text run. Html styles and text content"""
+    """A text run. An interned html style (see DepthCollector.intern_style) and text
 
-    html_style: list[str] = field(default_factory=list)
-    text: str = field(default="")
+    Style 0 is no style.
+    """
 
-    def __str__(self) -> str:
-        """Return any text content in the run
+    __slots__ = ("style_id", "text")
 
-        :return: text content or "" if none
+    def __init__(self, style_id: int = 0, text: str = "") -> None:
+        """Set style and text.
+
+        :param style_id: id of an html style in the DepthCollector holding the run
+        :param text: text content
         """
-        if self.text:
-            return html_open(self.html_style) + self.text + html_close(self.html_style)
-        return ""
+        self.style_id = style_id
+        self.text = text
 
 
-@dataclass
 class Par:
-    """A text paragraph. Html styles and a list of run strings"""
+    """A text paragraph. An interned html style and a list of runs"""
 
-    html_style: list[str]
-    runs: list[Run] = field(default_factory=list)
+    __slots__ = ("style_id", "runs", "resume")
 
-    @property
-    def strings(self) -> list[str]:
-        """Return a list of strings from the runs
+    def __init__(self, style_id: int = 0, runs: list[Run] | None = None) -> None:
+        """Set style and runs.
 
-        :return: a string for each run with text content
+        :param style_id: id of an html style in the DepthCollector holding the par
+        :param runs: runs already in the paragraph
         """
-        return [x for x in (str(y) for y in self.runs) if x]
+        self.style_id = style_id
+        self.runs: list[Run] = [] if runs is None else runs
+        # The last run is closed. Before adding text, open a run with this style.
+        # -1 if the last run is open.
+        self.resume = -1
 
 
 class CaretDepthError(Exception):
@@ -93,7 +96,20 @@ class DepthCollector:
         self._rightmost_branches: list[Any] = [[]]
 
         self.open_pars: list[Par] = []
-        self.orphan_runs: list[Run] = []
+        # runs found outside any paragraph
+        self._orphans = Par()
+
+        # html styles interned as ids. (opening, closing) html tags for each id
+        self._style_ids: dict[tuple[str, ...], int] = {(): 0}
+        self._style_tags: list[tuple[str, str]] = [("", "")]
+
+        # the branches left behind by ``drain`` and how many items were drained
+        # from the front of each.
+        self._drained: list[tuple[list[Any], int]] = []
+
+        # (paragraph, index of its first joined run, paragraph resume style) for
+        # each call to ``commence_joined_runs`` not yet concluded
+        self._joins: list[tuple[Par, int, int]] = []
 
     def view_branch(self, address: Iterable[int]) -> Any:
         """Return the item at the given address
@@ -106,14 +122,118 @@ class DepthCollector:
             branch = branch[i]
         return branch
 
-    @staticmethod
-    def _get_run_strings(runs: list[Run]) -> list[str]:
-        """Return a string for each run in the current open paragraph. Ignore ""
+    def drain(self) -> list[IndexedItem]:
+        """Remove every paragraph collected so far. Return each with its address.
+
+        :return: an IndexedItem ``((i, j, k, l), paragraph)`` for every paragraph
+            collected since the last call to ``drain``. Addresses are the indices
+            the paragraph would have in ``tree`` had nothing been drained.
+
+        Content is only ever added to the rightmost branches, so everything left of
+        the rightmost branches is finished. Drop all of that, and drop every
+        paragraph in the rightmost cell (finished paragraphs will not change). Keep
+        only the rightmost branch at each depth, and keep a count of the items
+        dropped before it, so the addresses of paragraphs collected later can be
+        found.
+
+        Do not drain while a table is open if the ``duplicate_merged_cells``
+        feature is in use. A merged cell copies its content from the row above.
+        """
+        drained: list[IndexedItem] = []
+
+        def walk(branch: list[Any], depth: int, address: tuple[int, ...]) -> None:
+            """Collect paragraphs (item_depth - 1) under branch.
+
+            :param branch: a list in the tree
+            :param depth: 0 for tree, 1 for table, ...
+            :param address: indices of branch in tree
+            """
+            start = self._count_drained(branch, depth)
+            for i, item in enumerate(branch, start=start):
+                if depth == self._par_depth - 1:
+                    drained.append(IndexedItem((*address, i), item))
+                else:
+                    walk(item, depth + 1, (*address, i))
+
+        walk(self.tree, 0, ())
+
+        new_drained: list[tuple[list[Any], int]] = []
+        branch = self.tree
+        for depth in range(self._par_depth):
+            count = self._count_drained(branch, depth)
+            if depth == self._par_depth - 1:
+                new_drained.append((branch, count + len(branch)))
+                del branch[:]
+                break
+            new_drained.append((branch, count + max(len(branch) - 1, 0)))
+            if not branch:
+                break
+            del branch[:-1]
+            branch = branch[0]
+        self._drained = new_drained
+        return drained
+
+    def _count_drained(self, branch: list[Any], depth: int) -> int:
+        """How many items have been drained from the front of branch?
+
+        :param branch: a list in the tree
+        :param depth: 0 for tree, 1 for table, ...
+        :return: number of items drained from branch
+        """
+        with suppress(IndexError):
+            drained_branch, count = self._drained[depth]
+            if drained_branch is branch:
+                return count
+        return 0
+
+    def intern_style(self, html_style: Sequence[str] | None) -> int:
+        """Get an id for an html style. Runs and paragraphs hold the id.
+
+        :param html_style: html tags without the '<' and '>' (e.g., ``['b', 'i']``)
+        :return: id of html_style. The same id for every equal html_style.
+        """
+        if not html_style:
+            return 0
+        key = tuple(html_style)
+        style_id = self._style_ids.get(key)
+        if style_id is None:
+            style_id = self._style_ids[key] = len(self._style_tags)
+            self._style_tags.append((html_open(key), html_close(list(key))))
+        return style_id
+
+    def _get_par_strings(self, par: Par) -> list[str]:
+        """Return a string for each run in a paragraph. Ignore "".
+
+        :param par: a closed paragraph
+        :return: a string for each run with text content, then the closing tags
+            of the paragraph style if any
+        """
+        strings = self._get_run_strings(par.runs)
+        close = self._style_tags[par.style_id][1]
+        if close:
+            strings.append(close)
+        return strings
+
+    def _get_run_strings(self, runs: Iterable[Run]) -> list[str]:
+        """Return a string for each run. Ignore "".
 
-        :param runs: list of runs
-        :return: a string for each run with text content
+        :param runs: runs in a paragraph
+        :return: the text of each run with text content, inside html tags if styled
         """
-        return [x for x in (str(x) for x in runs) if x]
+        tags = self._style_tags
+        return [
+            tags[x.style_id][0] + x.text + tags[x.style_id][1] if x.style_id else x.text
+            for x in runs
+            if x.text
+        ]
+
+    @property
+    def orphan_runs(self) -> list[Run]:
+        """Runs found before the paragraph that will hold them has been opened.
+
+        :return: a list of runs
+        """
+        return self._orphans.runs
 
     def commence_paragraph(self, html_style: list[str] | None = None) -> Par:
         """Gather any cached runs and open a new paragraph.
@@ -121,28 +241,56 @@ class DepthCollector:
         :param html_style: html style to apply to the paragraph
         :return: the new paragraph
         """
-        html_style = html_style or []
-        new_par = Par(html_style, self.orphan_runs + [Run([], html_open(html_style))])
-        self.orphan_runs = []
+        style_id = self.intern_style(html_style)
+        new_par = Par(style_id, self._orphans.runs)
+        if style_id:
+            # opening tags are a run, so text may be added into it
+            new_par.runs.append(Run(0, self._style_tags[style_id][0]))
+        else:
+            new_par.resume = 0
+        self._orphans = Par()
         self.open_pars.append(new_par)
         return new_par
 
     def conclude_paragraph(self) -> None:
         """Close the current paragraph and add it to the tree."""
-        old_par = self.open_pars.pop()
-        old_par.runs.append(Run([], html_close(old_par.html_style)))
-        self.insert(old_par.strings)
+        self.insert(self._get_par_strings(self.open_pars.pop()))
 
     def commence_run(self, html_style: list[str] | None = None) -> None:
         """Open a new run and add it to the current paragraph.
 
         :param html_style: html style to apply to the run
         """
-        self._open_runs.append(Run(html_style or []))
+        par = self._open_par
+        par.runs.append(Run(self.intern_style(html_style)))
+        par.resume = -1
 
     def conclude_run(self) -> None:
-        """Close the current run and add it to the current paragraph."""
-        self.commence_run()
+        """Close the current run. Later text will open an unstyled run."""
+        self._open_par.resume = 0
+
+    def commence_joined_runs(self) -> None:
+        """Collect later runs to be joined into one string.
+
+        Runs added before ``conclude_joined_runs`` are added into the current
+        paragraph as usual, then removed. Calls may be nested.
+        """
+        par = self._open_par
+        self._joins.append((par, len(par.runs), par.resume))
+        # start without an open run, as if in a new paragraph
+        par.resume = 0
+
+    def conclude_joined_runs(self) -> str:
+        """Remove the runs added since ``commence_joined_runs``. Join them.
+
+        :return: the runs as they would appear in the paragraph, joined into one
+            string. Insert it with ``insert_text_as_new_run``.
+        """
+        par, start, resume = self._joins.pop()
+        text = "".join(self._get_run_strings(par.runs[start:]))
+        del par.runs[start:]
+        par.resume = resume
+        return text
 
     @property
     def tree(self) -> list[str | list[str]]:
@@ -170,24 +318,26 @@ class DepthCollector:
         return len(self._rightmost_branches)
 
     @property
-    def _open_runs(self) -> list[Run]:
-        """Runs in the current paragraph.
+    def _open_par(self) -> Par:
+        """The current paragraph or, if no paragraph is open, the orphan runs.
 
-        :return: a list of runs
+        :return: a paragraph
         """
-        with suppress(IndexError):
-            return self.open_pars[-1].runs
-        return self.orphan_runs
+        if self.open_pars:
+            return self.open_pars[-1]
+        return self._orphans
 
     @property
     def _open_run(self) -> Run:
-        """The last run in the current paragraph.
+        """The last run in the current paragraph. Open a run if the last is closed.
 
         :return: a run
         """
-        if not self._open_runs:
-            self._open_runs.append(Run())
-        return self._open_runs[-1]
+        par = self._open_par
+        if par.resume >= 0 or not par.runs:
+            par.runs.append(Run(max(par.resume, 0)))
+            par.resume = -1
+        return par.runs[-1]
 
     def _drop_caret(self) -> None:
         """Create a new branch under caret.
@@ -207,7 +357,7 @@ class DepthCollector:
         """
         if self.caret_depth == 1:
             raise CaretDepthError("will not raise caret above root")
-        self._rightmost_branches = self._rightmost_branches[:-1]
+        _ = self._rightmost_branches.pop()
 
     def set_caret(self, depth: None | int) -> None:
         """
@@ -217,7 +367,7 @@ class DepthCollector:
             another at the same depth. This is how consecutive paragraphs avoid being
             merged into one paragraph. You'll want this true for every element except
             text runs. :depth: == None means the element (perhaps ``body``) does not
-            effect depth (see details in docx_text._get_elem_depth).
+            effect depth (see details in docx_text._get_elem_depths).
         """
         if depth is None:
             return
@@ -269,10 +419,14 @@ class DepthCollector:
             <run><b>some text</b></run>  # close this open run
             <run><a href="">link</a></run>  # add link as a new run
             <run><b>  # open a new run with the same style as the aborted first run
+
+        The new run is not opened until text is added to it (see ``_open_run``).
         """
-        open_style = self._open_run.html_style
-        if styled:
-            self._open_runs.append(Run(open_style, item))
+        par = self._open_par
+        if par.resume >= 0:
+            open_style = par.resume
         else:
-            self._open_runs.append(Run([], item))
-        self._open_runs.append(Run(open_style))
+            open_style = par.runs[-1].style_id if par.runs else 0
+        if item:
+            par.runs.append(Run(open_style if styled else 0, item))
+        par.resume = open_style
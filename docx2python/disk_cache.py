@@ -0,0 +1,204 @@
+"""Keep extracted content on disk, keyed by docx bytes and extraction options.
+
+:author: Shay Hill
+:created: 2023-07-03
+
+Pass a cache directory (or a ``DiskCache`` instance) to ``docx2python`` to skip
+extraction of files that have been extracted before::
+
+    with docx2python("file.docx", cache="path/to/cache") as content:
+        print(content.text)
+
+The first time a docx is extracted with a set of options, the text runs of every
+selected part, the core properties, and the image names and sizes are written to
+the cache directory as one zlib-compressed json file. The file name is a sha256
+digest of the docx bytes, the extraction options (html, paragraph_styles,
+duplicate_merged_cells, parts), this format version, and the docx2python version.
+The same bytes extracted with the same options will find that file and return a
+``DocxContent`` instance that reads from it without opening the docx zip archive.
+(Images are still read from the zip archive if ``images`` is requested.) The cache
+is not used once a tag handler has been registered (see
+``docx_text.register_tag_handler``) or, with html, once ``XML2HTML_FORMATTER`` has
+been changed.
+
+Files are written to a temporary file then moved into place with ``os.replace``,
+so processes sharing a cache directory will never read a partial file. Once the
+directory holds more than ``max_bytes``, the least recently used files are
+deleted. A file that cannot be read (deleted by another process, corrupt, or
+written by an older version) is a miss.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import zlib
+from contextlib import suppress
+from dataclasses import dataclass
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .iterators import TablesList
+
+# change this if the format of cached files changes
+FORMAT_VERSION = 1
+
+_SUFFIX = ".docx2python"
+_CHUNK_SIZE = 2**20
+
+
+def _get_version() -> str:
+    """The installed docx2python version, so cached content is not used by another.
+
+    :return: version string or "" if docx2python is not installed
+    """
+    # importlib.metadata is not imported at module level (slow and rarely used)
+    from importlib.metadata import PackageNotFoundError, version
+
+    with suppress(PackageNotFoundError):
+        return version("docx2python")
+    return ""
+
+
+def get_docx_digest(docx: str | Path | BytesIO) -> str:
+    """Hash the bytes of a docx file.
+
+    :param docx: path to a docx file or docx bytes
+    :return: sha256 hex digest
+    """
+    digest = hashlib.sha256()
+    if isinstance(docx, BytesIO):
+        digest.update(docx.getbuffer())
+        return digest.hexdigest()
+    with open(docx, "rb") as docx_file:
+        for chunk in iter(lambda: docx_file.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass
+class StoredContent:
+    """Everything a DocxContent instance needs to answer without the zip archive.
+
+    :param parts: content file types mapped to (path, ``File.content``) for each
+        file of that type
+    :param core_properties: like ``DocxContent.core_properties``. None if the docx
+        has no core-properties file.
+    :param image_sizes: image names mapped to sizes in bytes
+    """
+
+    parts: Dict[str, List[Tuple[str, TablesList]]]
+    core_properties: Optional[Dict[str, Optional[str]]]
+    image_sizes: Dict[str, int]
+
+    def to_bytes(self) -> bytes:
+        """Serialize to compressed json.
+
+        :return: zlib-compressed json
+        """
+        data = {
+            "parts": self.parts,
+            "core_properties": self.core_properties,
+            "image_sizes": self.image_sizes,
+        }
+        return zlib.compress(json.dumps(data, separators=(",", ":")).encode("utf-8"))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> StoredContent:
+        """Deserialize compressed json.
+
+        :param data: output of ``to_bytes``
+        :return: a new StoredContent instance
+        """
+        loaded = json.loads(zlib.decompress(data).decode("utf-8"))
+        return cls(
+            {k: [(p, c) for p, c in v] for k, v in loaded["parts"].items()},
+            loaded["core_properties"],
+            loaded["image_sizes"],
+        )
+
+
+class DiskCache:
+    """StoredContent in a directory. One file per docx and set of options."""
+
+    def __init__(self, directory: str | Path, max_bytes: int = 2**30) -> None:
+        """Create the directory if it does not exist.
+
+        :param directory: where to keep cached content
+        :param max_bytes: once files in directory take more than this many bytes,
+            delete the least recently used
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def get_key(self, docx: str | Path | BytesIO, options: Dict[str, Any]) -> str:
+        """Identify the content of a docx extracted with options.
+
+        :param docx: path to a docx file or docx bytes
+        :param options: json-serializable extraction options
+        :return: sha256 hex digest of docx bytes, options, and versions
+        """
+        versions = [FORMAT_VERSION, _get_version()]
+        summary = json.dumps([get_docx_digest(docx), options, versions], sort_keys=True)
+        return hashlib.sha256(summary.encode("utf-8")).hexdigest()
+
+    def _get_path(self, key: str) -> Path:
+        """Where content for a key is kept.
+
+        :param key: output of ``get_key``
+        :return: path to the cached file
+        """
+        return self.directory / (key + _SUFFIX)
+
+    def get(self, key: str) -> StoredContent | None:
+        """Read cached content. Mark it as recently used.
+
+        :param key: output of ``get_key``
+        :return: StoredContent instance or None if there is no (readable) file
+        """
+        path = self._get_path(key)
+        try:
+            content = StoredContent.from_bytes(path.read_bytes())
+        except (OSError, ValueError, KeyError, TypeError, zlib.error):
+            return None
+        with suppress(OSError):
+            os.utime(path)
+        return content
+
+    def put(self, key: str, content: StoredContent) -> None:
+        """Write content atomically, then evict files if the cache is too large.
+
+        :param key: output of ``get_key``
+        :param content: StoredContent to write
+        """
+        fd, temp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as temp_file:
+                _ = temp_file.write(content.to_bytes())
+            os.replace(temp, self._get_path(key))
+        except OSError:
+            # e.g., another process has the file open on Windows. Do not cache.
+            with suppress(OSError):
+                os.remove(temp)
+            return
+        self.evict()
+
+    def evict(self) -> None:
+        """Delete least recently used files until the cache fits in max_bytes."""
+        entries: List[Tuple[float, int, str]] = []
+        with os.scandir(self.directory) as scan:
+            for entry in (x for x in scan if x.name.endswith(_SUFFIX)):
+                with suppress(OSError):  # deleted by another process
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(x[1] for x in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            with suppress(OSError):
+                os.remove(path)
+            total -= size
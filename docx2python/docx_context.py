@@ -10,19 +10,108 @@ from __future__ import annotations
 
 import re
 import zipfile
+from array import array
+from dataclasses import dataclass
+from typing import Any, Dict, List
 
-from lxml import etree
 from lxml.etree import _Element as EtreeElement  # type: ignore
 
 from .namespace import qn
+from .xml_parser import parse_xml
 
 
-def collect_numFmts(numFmts_root: EtreeElement) -> dict[str, list[str]]:
+@dataclass(frozen=True)
+class NumberingLevels:
+    """List formats of one ``w:num`` by indentation level (ilvl), overrides applied.
+
+    :param numFmts: numFmt (e.g., "decimal", "bullet") for each ilvl
+    :param starts: first number for each ilvl
+    :param lvlTexts: lvlText (e.g., "%1.") for each ilvl
+    :param overrides: ilvls overridden by a ``w:lvlOverride`` in the ``w:num``
+
+    Levels are indexed by the ``w:ilvl`` attribute of each ``w:lvl``. A level
+    missing from the xml has numFmt "bullet", start 1, and lvlText "".
     """
-    Collect abstractNum bullet formats into a dictionary
 
-    :param numFmts_root: Root element of ``word/numbering.xml``.
-    :return: numId mapped to numFmts (by ilvl)
+    numFmts: tuple[str, ...]
+    starts: array[int]
+    lvlTexts: tuple[str, ...]
+    overrides: frozenset[int] = frozenset()
+
+
+def _get_val(elem: EtreeElement, tag: str) -> str | None:
+    """Get the w:val attribute of the first child with tag.
+
+    :param elem: parent element
+    :param tag: qualified tag of the child
+    :return: w:val of the child or None if there is no such child or attribute
+    """
+    child = elem.find(tag)
+    if child is None:
+        return None
+    return child.attrib.get(qn("w:val"))
+
+
+def _get_int(value: str | None, default: int) -> int:
+    """Convert an xml attribute value to an int.
+
+    :param value: attribute value or None
+    :param default: return this if value is None or not an integer
+    :return: int(value) or default
+    """
+    try:
+        return int(value)  # type: ignore
+    except (TypeError, ValueError):
+        return default
+
+
+# ilvl mapped to [numFmt, start, lvlText]
+_LevelDict = Dict[int, List[Any]]
+
+
+def _update_levels(levels: _LevelDict, lvl: EtreeElement) -> None:
+    """Read numFmt, start, and lvlText from a ``w:lvl`` element into levels.
+
+    :param levels: ilvl mapped to [numFmt, start, lvlText], updated in place.
+    :param lvl: ``w:lvl`` element from an abstractNum or a lvlOverride. Ignored if
+        it has no valid ilvl.
+    """
+    ilvl = _get_int(lvl.attrib.get(qn("w:ilvl")), -1)
+    if ilvl < 0:
+        return
+    level = levels.setdefault(ilvl, ["decimal", 1, ""])
+    numFmt = _get_val(lvl, qn("w:numFmt"))
+    if numFmt is not None:
+        level[0] = numFmt
+    level[1] = _get_int(_get_val(lvl, qn("w:start")), level[1])
+    lvlText = _get_val(lvl, qn("w:lvlText"))
+    if lvlText is not None:
+        level[2] = lvlText
+
+
+def _freeze_levels(levels: _LevelDict, overrides: set[int]) -> NumberingLevels:
+    """Pack levels into compact per-level arrays.
+
+    :param levels: ilvl mapped to [numFmt, start, lvlText]
+    :param overrides: ilvls overridden in the ``w:num``
+    :return: a NumberingLevels instance
+    """
+    missing = ["bullet", 1, ""]
+    packed = [levels.get(i, missing) for i in range(max(levels, default=-1) + 1)]
+    return NumberingLevels(
+        tuple(x[0] for x in packed),
+        array("i", (x[1] for x in packed)),
+        tuple(x[2] for x in packed),
+        frozenset(overrides),
+    )
+
+
+def collect_numbering(numbering_root: EtreeElement) -> dict[str, NumberingLevels]:
+    """
+    Collect numbering formats, starts, and lvlTexts from one walk of numbering.xml
+
+    :param numbering_root: Root element of ``word/numbering.xml``.
+    :return: numId mapped to a NumberingLevels instance
 
     :background:
 
@@ -32,7 +121,11 @@ def collect_numFmts(numFmts_root: EtreeElement) -> dict[str, list[str]]:
     indentation levels::
 
         <w:abstractNum w:abstractNumId="0">
-            <w:lvl w:ilvl="0"><w:numFmt w:val="decimal"/></w:lvl>
+            <w:lvl w:ilvl="0">
+                <w:start w:val="1"/>
+                <w:numFmt w:val="decimal"/>
+                <w:lvlText w:val="%1."/>
+            </w:lvl>
             <w:lvl w:ilvl="1"><w:numFmt w:val="lowerLetter"/></w:lvl>
             ...
         </w:abstractNum>
@@ -40,18 +133,86 @@ def collect_numFmts(numFmts_root: EtreeElement) -> dict[str, list[str]]:
     **SECTION 2** - Some num elements, each referencing an abstractNum. Multiple nums
     may reference the same abstractNum, but each will maintain a separate count (i.e.,
     each numbered paragraph will start from 1, even if it shares a style with another
-    paragraph.)::
+    paragraph.) A num may override the start or the entire definition of any level::
 
         <w:num w:numId="1">
             <w:abstractNumId w:val="0"/>
         </w:num>
         <w:num w:numId="2">
-            <w:abstractNumId w:val="5"/>
+            <w:abstractNumId w:val="0"/>
+            <w:lvlOverride w:ilvl="0">
+                <w:startOverride w:val="5"/>
+            </w:lvlOverride>
         </w:num>
 
-    **E.g, Given**: *above*
+    A num referencing a missing abstractNum is skipped.
+    """
+    abstractNumId2levels: dict[str, _LevelDict] = {}
+    for abstractNum in numbering_root.iterfind(qn("w:abstractNum")):
+        levels: _LevelDict = {}
+        for lvl in abstractNum.iterfind(qn("w:lvl")):
+            _update_levels(levels, lvl)
+        id_ = str(abstractNum.attrib.get(qn("w:abstractNumId")))
+        abstractNumId2levels[id_] = levels
+
+    numId2levels: dict[str, NumberingLevels] = {}
+    for num in numbering_root.iterfind(qn("w:num")):
+        abstract_levels = abstractNumId2levels.get(
+            str(_get_val(num, qn("w:abstractNumId")))
+        )
+        if abstract_levels is None:
+            continue
+        levels = {k: list(v) for k, v in abstract_levels.items()}
+        overrides: set[int] = set()
+        for override in num.iterfind(qn("w:lvlOverride")):
+            ilvl = _get_int(override.attrib.get(qn("w:ilvl")), -1)
+            if ilvl < 0:
+                continue
+            overrides.add(ilvl)
+            for lvl in override.iterfind(qn("w:lvl")):
+                _update_levels(levels, lvl)
+            start = _get_val(override, qn("w:startOverride"))
+            if start is not None:
+                level = levels.setdefault(ilvl, ["bullet", 1, ""])
+                level[1] = _get_int(start, level[1])
+        numId2levels[str(num.attrib.get(qn("w:numId")))] = _freeze_levels(
+            levels, overrides
+        )
+    return numId2levels
+
+
+def numbering_from_maps(
+    numId2numFmts: dict[str, list[str]],
+    numId2numStarts: dict[str, list[str]] | None = None,
+) -> dict[str, NumberingLevels]:
+    """Build a numbering model from numFmt and start lists.
+
+    :param numId2numFmts: numId mapped to numFmts (by ilvl)
+    :param numId2numStarts: optional numId mapped to starts (by ilvl). Levels
+        without a start start at 1.
+    :return: numId mapped to a NumberingLevels instance
+    """
+    numId2numStarts = numId2numStarts or {}
+    numbering: dict[str, NumberingLevels] = {}
+    for numId, numFmts in numId2numFmts.items():
+        starts = numId2numStarts.get(numId, [])
+        starts = [starts[i] if i < len(starts) else None for i in range(len(numFmts))]
+        numbering[numId] = NumberingLevels(
+            tuple(numFmts),
+            array("i", (_get_int(x, 1) for x in starts)),
+            ("",) * len(numFmts),
+        )
+    return numbering
 
-    **E.g., Returns**::
+
+def collect_numFmts(numFmts_root: EtreeElement) -> dict[str, list[str]]:
+    """
+    Collect numbering formats into a dictionary
+
+    :param numFmts_root: Root element of ``word/numbering.xml``.
+    :return: numId mapped to numFmts (by ilvl)
+
+    See ``collect_numbering``. **E.g., Returns**::
 
         {
             # -----ilvl=0------ilvl=1------ilvl=2---
@@ -59,58 +220,31 @@ def collect_numFmts(numFmts_root: EtreeElement) -> dict[str, list[str]]:
             "2": ...
         }
     """
-    abstractNumId2numFmts: dict[str, list[str]] = {}
-
-    for abstractNum in numFmts_root.findall(qn("w:abstractNum")):
-        id_ = str(abstractNum.attrib[qn("w:abstractNumId")])
-        abstractNumId2numFmts[id_] = []
-        for lvl in abstractNum.findall(qn("w:lvl")):
-            numFmt = lvl.find(qn("w:numFmt"))
-            if numFmt is not None:
-                abstractNumId2numFmts[id_].append(str(numFmt.attrib[qn("w:val")]))
-
-    numId2numFmts: dict[str, list[str]] = {}
-    num: EtreeElement
-    for num in (x for x in numFmts_root.findall(qn("w:num"))):
-        numId = num.attrib[qn("w:numId")]
-        abstractNumId = num.find(qn("w:abstractNumId"))
-        if abstractNumId is None:
-            continue
-        abstractNumIdval = abstractNumId.attrib.get(qn("w:val"))
-        numId2numFmts[str(numId)] = abstractNumId2numFmts[str(abstractNumIdval)]
-
-    return numId2numFmts
+    numbering = collect_numbering(numFmts_root)
+    return {k: list(v.numFmts) for k, v in numbering.items()}
 
 
 def collect_numStarts(numFmts_root: EtreeElement) -> dict[str, list[str]]:
-    abstractNumId2numFmts: dict[str, list[str]] = {}
-
-    for abstractNum in numFmts_root.findall(qn("w:abstractNum")):
-        id_ = str(abstractNum.attrib[qn("w:abstractNumId")])
-        abstractNumId2numFmts[id_] = []
-        for lvl in abstractNum.findall(qn("w:lvl")):
-            numFmt = lvl.find(qn("w:start"))
-            if numFmt is not None:
-                abstractNumId2numFmts[id_].append(str(numFmt.attrib[qn("w:val")]))
-
-    numId2numFmts: dict[str, list[str]] = {}
-    num: EtreeElement
-    for num in (x for x in numFmts_root.findall(qn("w:num"))):
-        numId = num.attrib[qn("w:numId")]
-        abstractNumId = num.find(qn("w:abstractNumId"))
-        if abstractNumId is None:
-            continue
-        abstractNumIdval = abstractNumId.attrib.get(qn("w:val"))
-        numId2numFmts[str(numId)] = abstractNumId2numFmts[str(abstractNumIdval)]
+    """
+    Collect the first number of each numbering level into a dictionary
 
-    return numId2numFmts
+    :param numFmts_root: Root element of ``word/numbering.xml``.
+    :return: numId mapped to starts (by ilvl) as strings
+
+    See ``collect_numbering``.
+    """
+    numbering = collect_numbering(numFmts_root)
+    return {k: [str(x) for x in v.starts] for k, v in numbering.items()}
 
 
-def collect_rels(zipf: zipfile.ZipFile) -> dict[str, list[dict[str, str]]]:
+def collect_rels(
+    zipf: zipfile.ZipFile, huge_tree: bool = False
+) -> dict[str, list[dict[str, str]]]:
     """
     Map file to relId to attrib
 
     :param zipf: created by ``zipfile.ZipFile("docx_filename")``
+    :param huge_tree: lift libxml2 limits (see ``xml_parser.parse_xml``)
     :return: a deep dictionary ``{filename: list of Relationships``
 
     Each rel in list of Relationships is::
@@ -175,7 +309,7 @@ def collect_rels(zipf: zipfile.ZipFile) -> dict[str, list[dict[str, str]]]:
     for rels in (x for x in zipf.namelist() if x[-5:] == ".rels"):
         path2rels[rels] = [
             {str(y): str(z) for y, z in x.attrib.items()}
-            for x in etree.fromstring(zipf.read(rels))
+            for x in parse_xml(zipf.read(rels), huge_tree)
         ]
     return path2rels
 
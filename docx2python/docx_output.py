@@ -35,16 +35,111 @@ Also returns a 4-deep nested list (paragraphs are strings)::
 
 This is the format for default (no trailing "_runs", e.g ``header``) properties.
 
+Content is extracted once per file (see ``File.content``). Views derived from that
+content (concatenated runs, joined paragraphs, text) are computed once and cached.
+Every property returns a new list, so altering a returned value will not alter the
+next.
+
+``docx2python(..., parts={"officeDocument"})`` selects content file types. Files of
+other types are never read, so their properties (e.g., ``header``) are empty.
+``DocxContent.get_text(parts)`` joins the text of any parts.
+
+``DocxContent.to_flat`` returns the runs of every part in one flat list with offset
+arrays instead of nested lists (see ``flat_content``).
+
+``DocxContent.iter_paragraphs`` yields one ``ParagraphRecord`` at a time as each
+file is read, without building any of these lists. ``DocxContent.preview`` reads
+only as much of ``word/document.xml`` as it needs.
+
 """
-from copy import deepcopy
-from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from contextlib import closing
+from dataclasses import dataclass, field
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 from warnings import warn
 
+from .disk_cache import StoredContent
 from .docx_context import collect_docProps
-from .docx_reader import DocxReader
+from .docx_reader import CONTENT_FILE_TYPES, DocxReader
 from .docx_text import TablesList
-from .iterators import enum_at_depth, get_html_map, iter_at_depth
+from .flat_content import FlatContent
+from .iterators import (
+    IndexedItem,
+    copy_nested,
+    enum_at_depth,
+    get_html_map,
+    iter_at_depth,
+    join_runs,
+)
+
+_T = TypeVar("_T")
+
+# names of __getattr__ paragraph properties mapped to file types
+_PARAGRAPH_TYPES = {
+    "header": "header",
+    "footer": "footer",
+    "body": "officeDocument",
+    "footnotes": "footnotes",
+    "endnotes": "endnotes",
+}
+
+# content file types in the order they are concatenated in document and text
+_PART_ORDER = ("header", "officeDocument", "footer", "footnotes", "endnotes")
+
+
+def get_part_types(parts: Optional[Iterable[str]]) -> FrozenSet[str]:
+    """Validate a ``parts`` argument. Map part names to file types.
+
+    :param parts: content file types (e.g., "officeDocument") or paragraph
+        property names (e.g., "body"). None for every content file type.
+    :return: content file types
+    :raise ValueError: if a part is not a content file type or property name
+    """
+    if parts is None:
+        return frozenset(CONTENT_FILE_TYPES)
+    if isinstance(parts, str):
+        parts = (parts,)
+    types = frozenset(_PARAGRAPH_TYPES.get(x, x) for x in parts)
+    unknown = types - CONTENT_FILE_TYPES
+    if unknown:
+        raise ValueError(
+            f"unknown parts {sorted(unknown)}. Select from {list(_PART_ORDER)} "
+            + f"or {list(_PARAGRAPH_TYPES)}"
+        )
+    return types
+
+
+class ParagraphRecord(NamedTuple):
+    """One paragraph from ``DocxContent.iter_paragraphs``.
+
+    :param part: content file type (e.g., "header", "officeDocument")
+    :param path: path of the content file in the docx (e.g., "word/header1.xml")
+    :param index: (table, row, cell, paragraph) indices of the paragraph in the
+        content of that file (``File.content``)
+    :param runs: text runs, without the paragraph style
+    :param text: runs joined. A paragraph in ``text``.
+    :param style: paragraph style if docx2python was called with
+        ``paragraph_styles=True`` (else None)
+    """
+
+    part: str
+    path: str
+    index: Tuple[int, ...]
+    runs: List[str]
+    text: str
+    style: Optional[str]
 
 
 @dataclass
@@ -54,10 +149,42 @@ class DocxContent:
     docx_reader: DocxReader
     docx2python_kwargs: Dict[str, Any]
 
+    # name -> (source File.content lists, value derived from them)
+    _cache: Dict[str, Tuple[Tuple[Any, ...], Any]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    # content read from a DiskCache (see ``disk_cache``). Selected parts, core
+    # properties, and image sizes are read from here instead of the zip archive.
+    stored: Optional[StoredContent] = field(default=None, repr=False, compare=False)
+
     def close(self):
-        """Close the zipfile opened by DocxReader"""
+        """Close the zipfile opened by DocxReader. Forget cached content."""
+        self._cache.clear()
         self.docx_reader.close()
 
+    def _get_cached(
+        self, name: str, sources: Tuple[Any, ...], build: Callable[[], _T]
+    ) -> _T:
+        """Get a value derived from File.content lists. Build it if necessary.
+
+        :param name: name of the cached value
+        :param sources: File.content lists from which the value is built
+        :param build: function to build the value
+        :return: cached value if it was built from these same sources, else a newly
+            built (and cached) value
+
+        File.content lists are cached, so they will be the same lists until
+        something changes (an option, a file is edited, the reader is closed).
+        """
+        cached_sources, value = self._cache.get(name, ((), None))
+        if len(cached_sources) == len(sources) and value is not None:
+            if all(x is y for x, y in zip(cached_sources, sources)):
+                return value
+        value = build()
+        self._cache[name] = (sources, value)
+        return value
+
     def __enter__(self) -> "DocxContent":
         """Do nothing. The zipfile will open itself when needed.
 
@@ -91,25 +218,78 @@ class DocxContent:
         Docx2Python v2 exposes runs [[[[str]]]] to the user, but still returns
         paragraphs by default.
         """
-        if name in {"header", "footer", "body", "footnotes", "endnotes"}:
-            runs = deepcopy(getattr(self, name + "_runs"))
-            for (i, j, k, l), paragraph in enum_at_depth(runs, 4):
-                runs[i][j][k][l] = "".join(paragraph)
-            return runs
+        if name in _PARAGRAPH_TYPES:
+            type_ = _PARAGRAPH_TYPES[name]
+            if type_ not in self.part_types:
+                return []
+            sources = self._get_sources(type_)
+
+            def build() -> TablesList:
+                return join_runs(self._get_cached_runs(type_))
+
+            return copy_nested(self._get_cached(name, sources, build))
         raise AttributeError(f"no attribute {name}")
 
+    @property
+    def part_types(self) -> AbstractSet[str]:
+        """Content file types selected with the ``parts`` argument of docx2python.
+
+        :return: content file types. Properties for other types (e.g., ``header``
+            if only "officeDocument" is selected) are empty, and their files are
+            never read.
+        """
+        return get_part_types(self.docx2python_kwargs.get("parts"))
+
+    def _get_sources(self, type_: str) -> Tuple[TablesList, ...]:
+        """Get (cached) File.content for each file of an internal document type.
+
+        :param type_: internal document type (e.g., "header")
+        :return: File.content for each file of type_
+        """
+        if self.stored is not None and type_ in self.stored.parts:
+            return tuple(x for _, x in self.stored.parts[type_])
+        return tuple(x.content for x in self.docx_reader.files_of_type(type_))
+
+    def to_stored(self) -> StoredContent:
+        """Extract everything a DiskCache keeps.
+
+        :return: content of the selected parts, core properties, and image sizes
+        """
+        parts = {
+            x: [(y.path, y.content) for y in self.docx_reader.files_of_type(x)]
+            for x in self.part_types
+        }
+        return StoredContent(
+            parts, self._read_core_properties(), self.docx_reader.get_image_sizes()
+        )
+
+    def _get_cached_runs(self, type_: str) -> TablesList:
+        """Get text runs for an internal document type. Do not alter these.
+
+        :param type_: this package looks for any of
+            ("header", "officeDocument", "footer", "footnotes", "endnotes")
+            You can try others.
+        :return: text runs [[[[str]]]] shared between calls
+        """
+        sources = self._get_sources(type_)
+
+        def concatenate() -> TablesList:
+            return [x for y in sources for x in y]
+
+        return self._get_cached(type_ + "_runs", sources, concatenate)
+
     def _get_runs(self, type_: str) -> TablesList:
         """Get text runs for an internal document type.
 
         :param type_: this package looks for any of
             ("header", "officeDocument", "footer", "footnotes", "endnotes")
             You can try others.
-        :return: text runs [[[[str]]]]
+        :return: text runs [[[[str]]]]. Empty if type_ is a content file type
+            not selected with ``parts``.
         """
-        content: TablesList = []
-        for file in self.docx_reader.files_of_type(type_):
-            content += file.content
-        return content
+        if type_ in CONTENT_FILE_TYPES and type_ not in self.part_types:
+            return []
+        return copy_nested(self._get_cached_runs(type_))
 
     @property
     def header_runs(self) -> TablesList:
@@ -197,14 +377,122 @@ class DocxContent:
     def text(self) -> str:
         """All docx paragraphs, "\n\n" joined.
 
-        :return: all docx paragraphs, "\n\n" joined
+        :return: all docx paragraphs (of the parts selected with ``parts``),
+            "\n\n" joined
+        """
+        return self.get_text()
+
+    def get_text(self, parts: Optional[Iterable[str]] = None) -> str:
+        """Paragraphs from some parts of the docx, "\n\n" joined.
+
+        :param parts: content file types (e.g., "officeDocument") or paragraph
+            property names (e.g., "body"). Default is the ``parts`` argument of
+            docx2python.
+        :return: paragraphs from the selected parts, "\n\n" joined
+        :raise ValueError: if a part is not a content file type or property name
+
+        Files of other parts are not read.
         """
-        if self.docx2python_kwargs["paragraph_styles"] is True:
-            # Paragraph descriptors have been inserted as the first run of each
-            # paragraph. Take them out.
-            pars = ["".join(x[1:]) for x in iter_at_depth(self.document_runs, 4)]
+        selected = self.part_types if parts is None else get_part_types(parts)
+        types = tuple(x for x in _PART_ORDER if x in selected)
+        sources = tuple(x for y in types for x in self._get_sources(y))
+
+        def join_paragraphs() -> str:
+            # Paragraph descriptors (if paragraph_styles) have been inserted as the
+            # first run of each paragraph. Take them out.
+            skip = 1 if self.docx2python_kwargs["paragraph_styles"] is True else 0
+            pars = ("".join(x[skip:]) for x in iter_at_depth(list(sources), 5))
             return "\n\n".join(pars)
-        return "\n\n".join(iter_at_depth(self.document, 4))
+
+        return self._get_cached("text:" + ",".join(types), sources, join_paragraphs)
+
+    def to_flat(self, parts: Optional[Iterable[str]] = None) -> FlatContent:
+        """Text runs in one flat list with offset arrays (see ``flat_content``).
+
+        :param parts: content file types (e.g., "officeDocument") or paragraph
+            property names (e.g., "body"). Default is the ``parts`` argument of
+            docx2python.
+        :return: a FlatContent instance with one part for each selected content
+            file type, in the order of ``document_runs``. ``to_tables()`` on the
+            result returns the same runs as ``document_runs``.
+        :raise ValueError: if a part is not a content file type or property name
+        """
+        selected = self.part_types if parts is None else get_part_types(parts)
+        return FlatContent.from_parts(
+            (x, self._get_cached_runs(x)) for x in _PART_ORDER if x in selected
+        )
+
+    def iter_paragraphs(
+        self, parts: Optional[Iterable[str]] = None
+    ) -> Iterator[ParagraphRecord]:
+        """Extract paragraphs one at a time in document order.
+
+        :param parts: content file types (e.g., "officeDocument") or paragraph
+            property names (e.g., "body"). Default is the ``parts`` argument of
+            docx2python.
+        :return: a ParagraphRecord for each paragraph, in the order of ``text``
+        :raise ValueError: if a part is not a content file type or property name
+
+        Each file is read as the paragraphs are consumed (see
+        ``File.iter_content``). word/document.xml is decompressed and parsed
+        incrementally, so memory use does not grow with the length of the
+        document. Closing the generator stops reading. Content is not cached.
+        """
+        selected = self.part_types if parts is None else get_part_types(parts)
+        has_style = self.docx2python_kwargs["paragraph_styles"] is True
+        for type_ in (x for x in _PART_ORDER if x in selected):
+            for path, (index, runs) in self._iter_file_paragraphs(type_):
+                style = runs[0] if has_style else None
+                runs = runs[1:] if has_style else runs
+                yield ParagraphRecord(type_, path, index, runs, "".join(runs), style)
+
+    def _iter_file_paragraphs(self, type_: str) -> Iterator[Tuple[str, IndexedItem]]:
+        """Extract paragraphs from each file of a type as the file is read.
+
+        :param type_: content file type (e.g., "header")
+        :return: (file path, IndexedItem) for each paragraph. Paragraphs of stored
+            content are copied.
+        """
+        if self.stored is not None and type_ in self.stored.parts:
+            for path, content in self.stored.parts[type_]:
+                for index, runs in enum_at_depth(content, 4):
+                    yield path, IndexedItem(index, list(runs))
+            return
+        for file in self.docx_reader.files_of_type(type_):
+            for item in file.iter_content():
+                yield file.path, item
+
+    def preview(
+        self, max_chars: Optional[int] = 500, max_paragraphs: Optional[int] = None
+    ) -> str:
+        """The beginning of the body text. Stop reading when it is long enough.
+
+        :param max_chars: return at most this many characters (None for no limit)
+        :param max_paragraphs: return at most this many paragraphs (None for no
+            limit)
+        :return: the beginning of ``get_text({"officeDocument"})``
+
+        word/document.xml is decompressed and parsed incrementally, and reading
+        stops as soon as either limit is met. Paragraphs are numbered and
+        formatted as in ``text``, because every paragraph before them has been
+        read. Other files are not read.
+        """
+        pars: List[str] = []
+        chars = -2  # no "\n\n" before the first paragraph
+
+        def is_full() -> bool:
+            if max_paragraphs is not None and len(pars) >= max_paragraphs:
+                return True
+            return max_chars is not None and chars >= max_chars
+
+        with closing(self.iter_paragraphs({"officeDocument"})) as paragraphs:
+            if not is_full():
+                for paragraph in paragraphs:
+                    pars.append(paragraph.text)
+                    chars += len(paragraph.text) + 2
+                    if is_full():
+                        break
+        return "\n\n".join(pars)[:max_chars]
 
     @property
     def html_map(self) -> str:
@@ -239,10 +527,11 @@ class DocxContent:
         Docx files created with Google docs won't have core-properties. If the file
         `core-properties` is missing, return an empty dict.
         """
-        try:
-            docProps = next(iter(self.docx_reader.files_of_type("core-properties")))
-            return collect_docProps(docProps.root_element)
-        except StopIteration:
+        if self.stored is None:
+            core_properties = self._read_core_properties()
+        else:
+            core_properties = self.stored.core_properties
+        if core_properties is None:
             warn(
                 "Could not find core-properties file (should be in docProps/core.xml) "
                 + "in DOCX, so returning an empty core_properties dictionary. Docx "
@@ -250,6 +539,29 @@ class DocxContent:
                 + "so this may be expected."
             )
             return {}
+        return dict(core_properties)
+
+    def _read_core_properties(self) -> Optional[Dict[str, Optional[str]]]:
+        """Read document core-properties from the zip archive.
+
+        :return: document core-properties as a dictionary or None if the file
+            `core-properties` is missing
+        """
+        try:
+            docProps = next(iter(self.docx_reader.files_of_type("core-properties")))
+        except StopIteration:
+            return None
+        return collect_docProps(docProps.root_element)
+
+    @property
+    def image_sizes(self) -> Dict[str, int]:
+        """Image names and sizes, without reading the images.
+
+        :return: the same names as ``images`` mapped to image sizes in bytes
+        """
+        if self.stored is not None:
+            return dict(self.stored.image_sizes)
+        return self.docx_reader.get_image_sizes()
 
     def save_images(self, image_folder: str) -> Dict[str, bytes]:
         """Write images to hard drive.
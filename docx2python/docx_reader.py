@@ -20,28 +20,52 @@ instances and decodes shared non-content in a docx file structure.
 
 from __future__ import annotations
 
-import copy
 import os
 import pathlib
 import zipfile
-from contextlib import suppress
+from contextlib import nullcontext, suppress
 from dataclasses import dataclass
 from io import BytesIO
 from operator import attrgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, ContextManager, Iterator
 from warnings import warn
 
 from lxml import etree
 from lxml.etree import _Element as EtreeElement  # type: ignore
 
 from .attribute_register import XML2HTML_FORMATTER
-from .docx_context import collect_numFmts, collect_rels, collect_numStarts
-from .docx_text import get_text
+from .docx_context import NumberingLevels, collect_numbering, collect_rels
+from .docx_sax import is_supported, sax_text
+from .docx_stream import stream_text
+from .docx_text import get_text, has_builtin_handlers_only
+from .iterators import IndexedItem, copy_nested
 from .merge_runs import merge_elems
+from .part_cache import PART_CACHE, SHARED_PART_TYPES, get_member_key
+from .stats import FileStats, ReaderStats
+from .text_runs import FormattingCache
+from .xml_parser import parse_xml
 
 CONTENT_FILE_TYPES = {"officeDocument", "header", "footer", "footnotes", "endnotes"}
 
+NUMBERING_PATH = "word/numbering.xml"
+
+
+def _phase(
+    stats: ReaderStats | None, path: str, phase: str
+) -> ContextManager[FileStats | None]:
+    """Time a phase if stats are being recorded.
+
+    :param stats: ReaderStats instance or None
+    :param path: path to the file in the docx
+    :param phase: name of the phase (e.g., ``parse``)
+    :return: ``stats.timer(path, phase)`` or, if stats is None, a context manager
+        that yields None
+    """
+    if stats is None:
+        return nullcontext()
+    return stats.timer(path, phase)
+
 
 @dataclass
 class File:
@@ -84,6 +108,12 @@ class File:
         self.__rels_path: None | str = None
         self.__rels: None | dict[str, str] = None
         self.__root_element: None | EtreeElement = None
+        self.__is_merged = False
+
+        # extracted content for each set of context.content_options. Not used once
+        # root_element has been accessed (and may have been edited).
+        self.__content: dict[tuple[Any, ...], list[list[list[list[str]]]]] = {}
+        self.__is_exposed = False
 
     def __repr__(self) -> str:
         """File with self.path
@@ -183,48 +213,154 @@ class File:
             return self.__rels
 
         try:
-            unzipped = self.context.zipf.read(self._rels_path)
-            tree = etree.fromstring(unzipped)
+            with _phase(self.context.stats, self.path, "rels"):
+                unzipped = self.context.zipf.read(self._rels_path)
+                tree = self.context.parse_xml(unzipped)
             self.__rels = {str(x.attrib["Id"]): str(x.attrib["Target"]) for x in tree}
         except KeyError:
             self.__rels = {}
         return self.__rels
 
+    @property
+    def _root_element(self) -> EtreeElement:
+        """Root element of the file for internal (read-only) use.
+
+        :return: Root element of the file.
+        """
+        if self.__root_element is not None:
+            return self.__root_element
+
+        stats = self.context.stats
+        with _phase(stats, self.path, "unzip") as file_stats:
+            unzipped = self.context.zipf.read(self.path)
+        with _phase(stats, self.path, "parse"):
+            self.__root_element = self.context.parse_xml(unzipped)
+        if file_stats is not None:
+            file_stats.decompressed_bytes += len(unzipped)
+            info = self.context.zipf.getinfo(self.path)
+            file_stats.compressed_bytes += info.compress_size
+            file_stats.count_tags(self.__root_element)
+        return self.__root_element
+
     @property
     def root_element(self) -> EtreeElement:
         """Root element of the file.
 
         :return: Root element of the file.
 
+        This is the xml as it is in the docx. Text extraction merges consecutive,
+        duplicate (except text) elements as it goes without altering this tree. To
+        merge these elements in the tree itself (e.g., to save a "repaired" docx),
+        use ``merged_root_element``.
+
+        The returned tree can be edited. Once it has been accessed, ``content`` will
+        no longer be cached, so edits will always be reflected in ``content``.
+        """
+        self.__is_exposed = True
+        self.clear_cache()
+        return self._root_element
+
+    @property
+    def merged_root_element(self) -> EtreeElement:
+        """Root element of the file with consecutive, duplicate elements merged.
+
+        :return: Root element of the file (the same element as ``root_element``).
+
         Try to merge consecutive, duplicate (except text) elements in content files.
         See documentation for ``merge_elems``. Warn if ``merge_elems`` fails.
         (I don't think it will fail).
-        """
-        if self.__root_element is not None:
-            return self.__root_element
 
-        root = etree.fromstring(self.context.zipf.read(self.path))
-        if self.Type in CONTENT_FILE_TYPES:
-            root_ = copy.copy(root)
+        The merge alters ``root_element`` in place and is only attempted once.
+        """
+        root = self.root_element
+        if self.Type in CONTENT_FILE_TYPES and not self.__is_merged:
+            self.__is_merged = True
             try:
-                merge_elems(self, root)
+                with _phase(self.context.stats, self.path, "merge"):
+                    merge_elems(self, root)
             except Exception as ex:
                 warn(
                     "Attempt to merge consecutive elements in "
                     + f"{self.context.docx_filename} {self.path} resulted in "
                     + f"{repr(ex)}. Moving on."
                 )
-                self.__root_element = root_
-        self.__root_element = root
-        return self.__root_element
+        return root
 
     @property
     def content(self) -> list[list[list[list[str]]]]:
         """Text extracted into a 5-layer-deep nested list of strings.
 
         :return: Text extracted into a 5-layer-deep nested list of strings.
+
+        Content is extracted once for each set of ``DocxReader.content_options``
+        and the same list is returned every time after. Copy before altering.
+
+        Content is not cached once ``root_element`` has been accessed, because the
+        tree may have been edited.
+
+        Headers and footers identical to one already extracted (in any docx) are
+        not read again. See ``part_cache``. Each reader gets its own copy of
+        shared content.
+        """
+        if self.__is_exposed:
+            return self._extract()
+        key = self.context.content_options
+        if key not in self.__content:
+            part_key = self._get_part_key()
+            shared = None if part_key is None else self.context.get_shared(part_key)
+            if shared is None:
+                content = self._extract()
+                if part_key is not None:
+                    PART_CACHE.put(part_key, copy_nested(content))
+            else:
+                content = copy_nested(shared)
+            self.__content[key] = content
+        return self.__content[key]
+
+    def _get_part_key(self) -> tuple[Any, ...] | None:
+        """Identify content that identical files in other docx files would share.
+
+        :return: a key for ``part_cache.PART_CACHE`` or None if content of this
+            file is not shared
         """
-        return get_text(self)
+        if self.Type not in SHARED_PART_TYPES or not has_builtin_handlers_only():
+            return None
+        zipf = self.context.zipf
+        file_key = get_member_key(zipf, self.path)
+        if file_key is None:
+            return None
+        return (
+            "content",
+            file_key,
+            get_member_key(zipf, self._rels_path),
+            get_member_key(zipf, NUMBERING_PATH),
+            self.context.content_options,
+        )
+
+    def _extract(self) -> list[list[list[list[str]]]]:
+        """Extract content from root element. Record stats if requested.
+
+        :return: Text extracted into a 5-layer-deep nested list of strings.
+        """
+        extract = get_text
+        if self.context.engine == "sax" and not self.__is_exposed and is_supported():
+            extract = sax_text
+        stats = self.context.stats
+        if stats is not None:
+            # time unzip, parse, rels, and numbering separately. The sax engine does
+            # not parse a tree, so its unzip and parse time is part of "extract".
+            if extract is get_text:
+                _ = self._root_element
+            _ = self.rels, self.context.numbering
+        with _phase(stats, self.path, "extract") as file_stats:
+            content = extract(self)
+        if file_stats is not None:
+            file_stats.count_content(content)
+        return content
+
+    def clear_cache(self) -> None:
+        """Forget any extracted content."""
+        self.__content.clear()
 
     def get_content(
         self, root: EtreeElement | None = None
@@ -238,6 +374,18 @@ class File:
         """
         return get_text(self, root)
 
+    def iter_content(self) -> Iterator[IndexedItem]:
+        """
+        The same paragraphs as property 'content', extracted as the file is read.
+
+        :return: an IndexedItem ``((i, j, k, l), paragraph)`` for each paragraph in
+            the file, where paragraph is a list of run strings.
+
+        The file is parsed incrementally and is not held in memory. This does not
+        read from or store to ``root_element``. See ``docx_stream.stream_text``.
+        """
+        return stream_text(self)
+
 
 @dataclass
 class DocxReader:
@@ -251,10 +399,23 @@ class DocxReader:
         html: bool = False,
         paragraph_styles: bool = False,
         duplicate_merged_cells: bool = False,
+        stats: ReaderStats | None = None,
+        engine: str = "tree",
+        huge_tree: bool = False,
     ):
+        if engine not in ("tree", "sax"):
+            raise ValueError(f"engine must be 'tree' or 'sax', not {engine!r}")
+        if engine == "sax" and html:
+            raise ValueError("engine 'sax' only extracts plain text (html=False)")
         self.docx_filename = docx_filename
         self.do_pStyle = paragraph_styles
         self.duplicate_merged_cells = duplicate_merged_cells
+        self.stats = stats
+        self.engine = engine
+        self.huge_tree = huge_tree
+        self.formatting_cache = FormattingCache(
+            stats=None if stats is None else stats.cache("formatting")
+        )
 
         if html:
             self.xml2html_format = XML2HTML_FORMATTER
@@ -264,7 +425,8 @@ class DocxReader:
         # cached properties and a flag (__closed)
         self.__zipf: None | zipfile.ZipFile = None
         self.__files: None | list[File] = None
-        self.__numId2NumFmts: None | dict[str, list[str]] = None
+        self.__numbering: None | dict[str, NumberingLevels] = None
+        self.__numId2numFmts: None | dict[str, list[str]] = None
         self.__numId2numStarts: None | dict[str, list[str]] = None
         self.__closed = False
 
@@ -284,10 +446,33 @@ class DocxReader:
         assert self.__zipf is not None
         return self.__zipf
 
+    @property
+    def content_options(self) -> tuple[Any, ...]:
+        """Reader attributes that change extracted content.
+
+        :return: a hashable summary of xml2html_format, do_pStyle, and
+            duplicate_merged_cells. Files cache extracted content by this key.
+        """
+        return (
+            frozenset(self.xml2html_format.items()),
+            self.do_pStyle,
+            self.duplicate_merged_cells,
+        )
+
+    def parse_xml(self, xml: bytes) -> EtreeElement:
+        """Parse an xml file from the docx. See ``xml_parser.parse_xml``.
+
+        :param xml: xml file content
+        :return: root element
+        """
+        return parse_xml(xml, self.huge_tree)
+
     def close(self):
-        """Close the zipfile, set __closed flag to True."""
+        """Close the zipfile, set __closed flag to True. Forget extracted content."""
         if self.__zipf is not None and self.__zipf.fp:
             self.__zipf.close()
+        for file in self.__files or ():
+            file.clear_cache()
         self.__closed = True
 
     def __enter__(self) -> DocxReader:
@@ -322,11 +507,63 @@ class DocxReader:
             return self.__files
 
         files: list[File] = []
-        for k, v in collect_rels(self.zipf).items():
+        for k, v in collect_rels(self.zipf, self.huge_tree).items():
             files += [File(self, {**x, "dir": os.path.dirname(k)}) for x in v]
         self.__files = files
         return self.__files
 
+    def get_shared(self, key: tuple[Any, ...]) -> Any:
+        """Get a value from ``part_cache.PART_CACHE``. Record stats if requested.
+
+        :param key: key of the value
+        :return: value or None if key is not in the cache
+        """
+        value = PART_CACHE.get(key)
+        if self.stats is not None:
+            counter = self.stats.cache("parts")
+            counter.hits += value is not None
+            counter.misses += value is None
+        return value
+
+    def _read_numbering(self) -> EtreeElement:
+        """Read and parse word/numbering.xml. Record stats if requested.
+
+        :return: root element of word/numbering.xml
+        :raise KeyError: if word/numbering.xml is not in the docx
+        """
+        with _phase(self.stats, NUMBERING_PATH, "numbering"):
+            return self.parse_xml(self.zipf.read(NUMBERING_PATH))
+
+    @property
+    def numbering(self) -> dict[str, NumberingLevels]:
+        """
+        numId referenced in xml to numFmt, start, and lvlText per indentation level
+
+        :return: numId referenced in xml to a NumberingLevels instance
+
+        See docstring for ``docx_context.collect_numbering``. word/numbering.xml is
+        parsed once. The result is shared with other docx files with an identical
+        word/numbering.xml (see ``part_cache``).
+
+        Returns an empty dictionary if word/numbering.xml cannot be found.
+        """
+        if self.__numbering is not None:
+            return self.__numbering
+        member_key = get_member_key(self.zipf, NUMBERING_PATH)
+        if member_key is None:
+            self.__numbering = {}
+            return self.__numbering
+        key = ("numbering", member_key)
+        numbering = self.get_shared(key)
+        if numbering is None:
+            try:
+                numbering = collect_numbering(self._read_numbering())
+            except KeyError:
+                numbering = {}
+            PART_CACHE.put(key, numbering)
+        self.__numbering = numbering
+        return numbering
+
     @property
     def numId2numFmts(self) -> dict[str, list[str]]:
         """
@@ -340,39 +577,27 @@ class DocxReader:
         Ultimately, this will result in any lists (there should NOT be any lists if
         there is no word/numbering.xml) being "numbered" with "--".
         """
-        # print(f"calling numId2numFmts")
-        if self.__numId2NumFmts is not None:
-            return self.__numId2NumFmts
+        if self.__numId2numFmts is None:
+            numbering = self.numbering
+            self.__numId2numFmts = {k: list(v.numFmts) for k, v in numbering.items()}
+        return self.__numId2numFmts
 
-        try:
-            numFmts_root = etree.fromstring(self.zipf.read("word/numbering.xml"))
-            self.__numId2NumFmts = collect_numFmts(numFmts_root)
-        except KeyError:
-            self.__numId2NumFmts = {}
-        return self.__numId2NumFmts
-    
     @property
     def numId2numStarts(self) -> dict[str, list[str]]:
         """
-        numId referenced in xml to list of numFmt per indentation level
+        numId referenced in xml to list of start values per indentation level
 
-        :return: numId referenced in xml to list of numFmt per indentation level
+        :return: numId referenced in xml to list of start values per indentation
+            level
 
-        See docstring for collect_numFmts
+        See docstring for collect_numStarts
 
         Returns an empty dictionary if word/numbering.xml cannot be found.
-        Ultimately, this will result in any lists (there should NOT be any lists if
-        there is no word/numbering.xml) being "numbered" with "--".
         """
-        # print(f"calling numId2numStarts")
-        if self.__numId2numStarts is not None:
-            return self.__numId2numStarts
-
-        try:
-            numFmts_root = etree.fromstring(self.zipf.read("word/numbering.xml"))
-            self.__numId2numStarts = collect_numStarts(numFmts_root)
-        except KeyError:
-            self.__numId2numStarts = {}
+        if self.__numId2numStarts is None:
+            self.__numId2numStarts = {
+                k: [str(x) for x in v.starts] for k, v in self.numbering.items()
+            }
         return self.__numId2numStarts
 
     def file_of_type(self, type_: str) -> File:
@@ -423,11 +648,13 @@ class DocxReader:
         """
         return self.files_of_type()
 
-    def save(self, filename: Path | str) -> None:
+    def save(self, filename: Path | str, merged: bool = False) -> None:
         """
         Save the (presumably altered) xml.
 
         :param filename: path to output file (presumably *.docx)
+        :param merged: merge consecutive, duplicate elements in every content file
+            before saving (see ``File.merged_root_element``).
 
         xml (root_element) attributes are cached, so these can be altered and saved.
         This allows saving a copy of the input docx after the ``merge_elems`` operation.
@@ -437,7 +664,8 @@ class DocxReader:
         with zipfile.ZipFile(f"{filename}", mode="w") as zout:
             _copy_but(self.zipf, zout, {x.path for x in content_files})
             for file in content_files:
-                zout.writestr(file.path, etree.tostring(file.root_element))
+                root = file.merged_root_element if merged else file.root_element
+                zout.writestr(file.path, etree.tostring(root))
 
     def pull_image_files(self, image_directory: str | None = None) -> dict[str, bytes]:
         """
@@ -457,7 +685,13 @@ class DocxReader:
         images: dict[str, bytes] = {}
         for image in self.files_of_type("image"):
             with suppress(KeyError):
-                images[os.path.basename(image.Target)] = self.zipf.read(image.path)
+                with _phase(self.stats, image.path, "images") as file_stats:
+                    image_bytes = self.zipf.read(image.path)
+                if file_stats is not None:
+                    file_stats.decompressed_bytes += len(image_bytes)
+                    info = self.zipf.getinfo(image.path)
+                    file_stats.compressed_bytes += info.compress_size
+                images[os.path.basename(image.Target)] = image_bytes
         if image_directory is not None:
             pathlib.Path(image_directory).mkdir(parents=True, exist_ok=True)
             for file, image_bytes in images.items():
@@ -465,6 +699,19 @@ class DocxReader:
                     _ = image_copy.write(image_bytes)
         return images
 
+    def get_image_sizes(self) -> dict[str, int]:
+        """Image names and sizes, read from the zip directory.
+
+        :return: the same names as ``pull_image_files`` mapped to image sizes in
+            bytes. Images are not decompressed.
+        """
+        sizes: dict[str, int] = {}
+        for image in self.files_of_type("image"):
+            with suppress(KeyError):
+                info = self.zipf.getinfo(image.path)
+                sizes[os.path.basename(image.Target)] = info.file_size
+        return sizes
+
 
 def _copy_but(
     in_zip: zipfile.ZipFile,
@@ -0,0 +1,464 @@
+"""Extract plain text from a docx content file without building an xml tree.
+
+:author: Shay Hill
+:created: 2023-07-03
+
+``get_text`` parses an entire content file into an lxml tree, then walks the tree.
+Without html formatting, most of that tree (run properties, spelling and revision
+marks, bookmarks, ...) is never used. ``sax_text`` feeds the content file, in chunks
+straight from ``zipfile.open``, to an ``lxml.etree.XMLParser`` with a parser target.
+The target receives ``start``, ``end``, and ``data`` callbacks and keeps only what
+extraction needs.
+
+Output is the same as ``get_text``::
+
+    assert sax_text(file) == get_text(file)
+
+A few things are not known when an element starts. An element's depth (see
+``docx_text._get_elem_depths``) depends on the paragraphs below it, whether it has
+content (see ``attribute_register.get_content_elems``) depends on everything below
+it, and whether it will be merged with its next sibling (see
+``merge_runs.group_elems``) depends on that sibling. So each top-level element (each
+child of ``<w:body>``) is held as a list of start and end events until it closes.
+Events of elements without content are dropped as those elements close. When a
+top-level element closes, its events are replayed into a DepthCollector with the
+handlers ``get_text`` would use, then forgotten.
+
+Only plain text can be extracted this way (``DocxReader.xml2html_format`` must be
+empty). Handlers added with ``docx_text.register_tag_handler`` expect elements, so
+``is_supported`` is False once the registry has been changed. ``File.content`` will
+use ``get_text`` in either case.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, Dict, List, NamedTuple, Optional, cast
+
+from lxml import etree
+from lxml.etree import _Element as EtreeElement  # type: ignore
+
+from .attribute_register import RELS_ID, Tags, get_content_tags
+from .bullets_and_numbering import BulletGenerator
+from .depth_collector import DepthCollector
+from .docx_text import (
+    BUILTIN_TAG_HANDLERS,
+    TablesList,
+    TagFunction,
+    TextContext,
+    commence_paragraph,
+    conclude_text,
+    duplicate_merged_cell,
+    has_builtin_handlers_only,
+)
+from .forms import get_checkBox_entry_from_vals, get_ddList_entry_from_vals
+from .namespace import qn
+from .xml_parser import get_parser_options
+
+if TYPE_CHECKING:
+    from .docx_reader import File
+
+# bytes read from the zip archive per call to ``XMLParser.feed``
+CHUNK_SIZE = 2**16
+
+_W_VAL = qn("w:val")
+_TEXT_TAGS = {Tags.TEXT.value, Tags.TEXT_MATH.value}
+_MERGEABLE_TAGS = {Tags.RUN.value, Tags.HYPERLINK.value}
+_NO_DEPTH = {Tags.DOCUMENT.value, Tags.BODY.value}
+
+# properties (see ``text_runs.gather_Pr``) are kept for these tags
+_PR_TAGS = {Tags.PARAGRAPH.value + "Pr", Tags.TABLE_CELL.value + "Pr"}
+_NUM_PR = qn("w:numPr")
+_NUM_PR_VALS = {qn("w:numId"), qn("w:ilvl")}
+
+# child elements kept for form fields (see ``forms``)
+_FORM_CHILDREN = {
+    Tags.FORM_CHECKBOX.value: {qn("w:checked"), qn("w:default")},
+    Tags.FORM_DDLIST.value: {qn("w:result"), qn("w:listEntry")},
+}
+
+
+def is_supported() -> bool:
+    """Can ``sax_text`` extract the same content as ``get_text``?
+
+    :return: False if any tag handlers or content tags have been registered
+    """
+    return has_builtin_handlers_only()
+
+
+class _Node:
+    """What extraction needs to know about one element.
+
+    Handlers that only read ``tag``, ``attrib``, and ``text`` from an element can
+    read them from a _Node.
+    """
+
+    __slots__ = (
+        "tag",
+        "attrib",
+        "parent",
+        "start",
+        "has_content",
+        "dist",
+        "depth",
+        "leader",
+        "merged_next",
+        "last_child",
+        "text",
+        "pr",
+        "owner",
+        "children",
+    )
+
+    def __init__(
+        self, tag: str, attrib: Dict[str, str], parent: Optional[_Node], start: int
+    ) -> None:
+        """Hold an element's tag and attributes as it starts.
+
+        :param tag: Clark-notation tag
+        :param attrib: attributes of the element
+        :param parent: _Node of the parent element (None for the root element)
+        :param start: index of this element's start event in the event list
+        """
+        self.tag = tag
+        self.attrib = attrib
+        self.parent = parent
+        self.start = start
+        self.has_content = False
+        # distance to the nearest descendant paragraph and depth (with the depth of
+        # any elements merged into this one)
+        self.dist: Optional[int] = None
+        self.depth: Optional[int] = None
+        # first element of a merged group (see ``merge_runs.group_elems``) and
+        # whether the next sibling is merged into this one
+        self.leader = self
+        self.merged_next = False
+        self.last_child: Optional[_Node] = None
+        self.text: Optional[str] = None
+        # values in the (first) pPr or tcPr (see ``text_runs.gather_Pr``), the _Node
+        # whose properties this element holds (if this is that pPr, tcPr, or the
+        # first numPr in that pPr), and attributes of any other elements needed
+        self.pr: Optional[Dict[str, Optional[str]]] = None
+        self.owner: Optional[_Node] = None
+        self.children: Dict[str, List[Dict[str, str]]] = {}
+
+
+# A sax handler function. Called with the TextContext and the _Node of an element
+# (the first _Node in a merged group).
+SaxFunction = Callable[[TextContext, _Node], None]
+
+
+class SaxHandler(NamedTuple):
+    """What to do when an element with a given tag is replayed.
+
+    :param open: called at the element's start event
+    :param close: called at the element's end event
+    """
+
+    open: Optional[SaxFunction] = None
+    close: Optional[SaxFunction] = None
+
+
+def _from_tree(func: Optional[TagFunction]) -> Optional[SaxFunction]:
+    """Call a ``docx_text`` handler with a _Node in place of an element.
+
+    :param func: a tag function that only reads tag, attrib, and text
+    :return: a sax function
+    """
+    if func is None:
+        return None
+    tree_func = func
+
+    def sax_func(ctx: TextContext, node: _Node) -> None:
+        tree_func(ctx, cast(List[EtreeElement], [node]), node.depth)
+
+    return sax_func
+
+
+def _first_val(node: _Node, tag: str) -> Optional[str]:
+    """The w:val attribute of the first child element with tag.
+
+    :param node: _Node of the parent element
+    :param tag: Clark-notation tag of the child element
+    :return: w:val attribute or None if there is no child or no attribute
+    """
+    children = node.children.get(tag)
+    if not children:
+        return None
+    return children[0].get(_W_VAL)
+
+
+def _keep_property(parent: _Node, node: _Node) -> None:
+    """Keep the properties and child elements handlers will need.
+
+    :param parent: _Node of the parent element
+    :param node: _Node of a new element
+    :effect: adds properties to node (if node is a pPr or tcPr) or to the owner of
+        parent (if parent is a pPr, tcPr, or numPr) or to parent (if parent is a form)
+    """
+    tag = node.tag
+    owner = parent.owner
+    if owner is not None:
+        if parent.tag == _NUM_PR:
+            if tag in _NUM_PR_VALS:
+                owner.children.setdefault(tag, []).append(node.attrib)
+            return
+        assert owner.pr is not None
+        owner.pr[tag.rpartition("}")[2]] = node.attrib.get(_W_VAL) or None
+        if tag == _NUM_PR and tag not in owner.children:
+            owner.children[tag] = [node.attrib]
+            node.owner = owner
+    elif tag in _PR_TAGS and tag == parent.tag + "Pr" and parent.pr is None:
+        parent.pr = {}
+        node.owner = parent
+    elif tag in _FORM_CHILDREN.get(parent.tag, ()):
+        parent.children.setdefault(tag, []).append(node.attrib)
+
+
+def _open_paragraph(ctx: TextContext, node: _Node) -> None:
+    """Open a paragraph. Insert a paragraph style and bullet if any.
+
+    :param ctx: TextContext instance
+    :param node: paragraph _Node
+    """
+    pr = node.pr or {}
+    bullet = ""
+    numId, ilvl = (_first_val(node, x) for x in (qn("w:numId"), qn("w:ilvl")))
+    if numId is not None and ilvl is not None:
+        bullet = ctx.bullets.get_numbered_bullet(numId, ilvl)
+    commence_paragraph(ctx, [], pr.get("pStyle"), bullet)
+
+
+def _open_run(ctx: TextContext, _: _Node) -> None:
+    """Open a run (without formatting).
+
+    :param ctx: TextContext instance
+    """
+    ctx.tables.commence_run()
+
+
+def _add_math(ctx: TextContext, node: _Node) -> None:
+    """Read an equation.
+
+    :param ctx: TextContext instance
+    :param node: equation _Node with all text inside the equation
+    """
+    ctx.tables.insert_text_as_new_run(f"<latex>{node.text}</latex>")
+
+
+def _add_checkbox(ctx: TextContext, node: _Node) -> None:
+    """Add a checkbox form entry. See ``forms.get_checkBox_entry``.
+
+    :param ctx: TextContext instance
+    :param node: checkBox _Node
+    """
+    checked = node.children.get(qn("w:checked"))
+    entry = get_checkBox_entry_from_vals(
+        None if not checked else str(checked[0].get(_W_VAL, "")),
+        _first_val(node, qn("w:default")),
+    )
+    ctx.tables.insert_text_as_new_run(entry)
+
+
+def _add_ddlist(ctx: TextContext, node: _Node) -> None:
+    """Add the selected entry of a drop-down form. See ``forms.get_ddList_entry``.
+
+    :param ctx: TextContext instance
+    :param node: ddList _Node
+    """
+    entries = [x.get(_W_VAL) for x in node.children.get(qn("w:listEntry"), [])]
+    entry = get_ddList_entry_from_vals(entries, _first_val(node, qn("w:result")))
+    ctx.tables.insert_text_as_new_run(entry)
+
+
+def _close_table_cell(ctx: TextContext, node: _Node) -> None:
+    """Duplicate merged cells if file.context.duplicate_merged_cells.
+
+    :param ctx: TextContext instance
+    :param node: table cell _Node
+    """
+    if ctx.file.context.duplicate_merged_cells:
+        duplicate_merged_cell(ctx, node.pr or {}, node.depth)
+
+
+def _get_sax_handlers() -> Dict[str, SaxHandler]:
+    """Use the ``docx_text`` handler for every tag unless it reads child elements.
+
+    :return: Clark-notation tags mapped to sax handlers
+    """
+    handlers = {
+        k: SaxHandler(_from_tree(v.open), _from_tree(v.close))
+        for k, v in BUILTIN_TAG_HANDLERS.items()
+    }
+    handlers[Tags.PARAGRAPH.value] = handlers[Tags.PARAGRAPH.value]._replace(
+        open=_open_paragraph
+    )
+    handlers[Tags.RUN.value] = handlers[Tags.RUN.value]._replace(open=_open_run)
+    handlers[Tags.MATH.value] = SaxHandler(_add_math)
+    handlers[Tags.FORM_CHECKBOX.value] = SaxHandler(_add_checkbox)
+    handlers[Tags.FORM_DDLIST.value] = SaxHandler(_add_ddlist)
+    handlers[Tags.TABLE_CELL.value] = SaxHandler(close=_close_table_cell)
+    return handlers
+
+
+SAX_HANDLERS = _get_sax_handlers()
+
+
+class _TextTarget:
+    """An lxml parser target. Collect text into a DepthCollector."""
+
+    def __init__(self, file: File) -> None:
+        """Start with no open elements and an empty DepthCollector.
+
+        :param file: File instance from which text will be extracted.
+        """
+        context = file.context
+        bullets = BulletGenerator(context.numbering)
+        self.file = file
+        self.ctx = TextContext(file, DepthCollector(5), bullets, {})
+        self.content_tags = get_content_tags()
+        self.stack: List[_Node] = []
+        # (is_start, node) for each open top-level element
+        self.events: List[tuple[bool, _Node]] = []
+        # open <w:document> and <w:body> elements. These are not replayed.
+        self.top_levels = 0
+        # where to put text (inside a text or math element)
+        self.text: Optional[List[str]] = None
+        self.math_levels = 0
+
+    def start(self, tag: str, attrib: Dict[str, str]) -> None:
+        """Open an element.
+
+        :param tag: Clark-notation tag
+        :param attrib: attributes of the element
+        """
+        if self.math_levels:
+            # equations are not descended into. Only their text is kept.
+            self.math_levels += 1
+            return
+        self.text = None
+        if len(self.stack) == self.top_levels and tag in _NO_DEPTH:
+            self.top_levels += 1
+            self.stack.append(_Node(tag, attrib, None, len(self.events)))
+            return
+
+        if attrib and "&#38;" in "".join(attrib.values()):
+            # without entity resolution, libxml2 passes "&" in attribute values to
+            # a parser target as "&#38;"
+            attrib = {k: v.replace("&#38;", "&") for k, v in attrib.items()}
+        parent = self.stack[-1] if len(self.stack) > self.top_levels else None
+        node = _Node(tag, attrib, parent, len(self.events))
+        self.stack.append(node)
+        self.events.append((True, node))
+        if parent is not None:
+            _keep_property(parent, node)
+
+        if tag in _TEXT_TAGS:
+            self.text = []
+        elif tag == Tags.MATH:
+            self.text = []
+            self.math_levels = 1
+
+    def data(self, data: str) -> None:
+        """Keep text inside text and math elements.
+
+        :param data: text
+        """
+        if self.text is not None:
+            self.text.append(data)
+
+    def end(self, tag: str) -> None:
+        """Close an element. Replay a top-level element.
+
+        :param tag: Clark-notation tag
+        """
+        if self.math_levels > 1:
+            self.math_levels -= 1
+            return
+        self.math_levels = 0
+        node = self.stack.pop()
+        if self.text is not None:
+            node.text = "".join(self.text)
+            self.text = None
+
+        if len(self.stack) < self.top_levels:
+            # <w:document> or <w:body>
+            self.top_levels -= 1
+            return
+        if tag == Tags.PARAGRAPH:
+            node.dist = 0
+        if not (node.has_content or tag in self.content_tags):
+            del self.events[node.start :]
+            return
+        self.events.append((False, node))
+        if node.dist is not None and tag not in _NO_DEPTH:
+            node.depth = max(4 - node.dist, 1)
+
+        parent = node.parent
+        if parent is None:
+            self._replay()
+            return
+        parent.has_content = True
+        dist = None if node.dist is None else node.dist + 1
+        if dist is not None and (parent.dist is None or parent.dist > dist):
+            parent.dist = dist
+        prev = parent.last_child
+        parent.last_child = node
+        if prev is None or tag not in _MERGEABLE_TAGS or prev.tag != tag:
+            return
+        if self._get_key(prev) == self._get_key(node):
+            prev.merged_next = True
+            node.leader = leader = prev.leader
+            depths = [x for x in (leader.depth, node.depth) if x is not None]
+            leader.depth = max(depths, default=None)
+
+    def _get_key(self, node: _Node) -> str:
+        """Enough to tell if two runs or links are merged. See ``merge_runs``.
+
+        :param node: a run or hyperlink _Node
+        :return: the link target (or "" for no link)
+        """
+        rels_id = node.attrib.get(RELS_ID)
+        if rels_id:
+            return str(self.file.rels.get(str(rels_id), rels_id))
+        return ""
+
+    def _replay(self) -> None:
+        """Call handlers for the events of a closed top-level element."""
+        ctx = self.ctx
+        for is_start, node in self.events:
+            if is_start:
+                if node.leader is not node:
+                    continue
+                ctx.tables.set_caret(node.depth)
+                handler = SAX_HANDLERS.get(node.tag)
+                if handler is not None and handler.open is not None:
+                    handler.open(ctx, node)
+            elif not node.merged_next:
+                leader = node.leader
+                handler = SAX_HANDLERS.get(leader.tag)
+                if handler is not None and handler.close is not None:
+                    handler.close(ctx, leader)
+                ctx.tables.set_caret(leader.depth)
+        self.events.clear()
+
+    def close(self) -> TablesList:
+        """Gather any runs or paragraphs left open.
+
+        :return: A 5-deep nested list of strings.
+        """
+        conclude_text(self.ctx.tables)
+        return cast(TablesList, self.ctx.tables.tree)
+
+
+def sax_text(file: File) -> TablesList:
+    """Extract plain text without building an xml tree.
+
+    :param file: File instance from which text will be extracted.
+    :return: A 5-deep nested list of strings (the same as ``get_text``).
+    """
+    options = get_parser_options(file.context.huge_tree)
+    parser = etree.XMLParser(target=_TextTarget(file), **options)
+    with file.context.zipf.open(file.path) as xml_file:
+        for chunk in iter(lambda: xml_file.read(CHUNK_SIZE), b""):
+            parser.feed(chunk)
+    return cast(TablesList, parser.close())
@@ -0,0 +1,101 @@
+"""Extract paragraphs from a docx content file without holding the whole file.
+
+:author: Shay Hill
+:created: 2023-07-03
+
+``File.root_element`` reads and parses an entire content file, and ``get_text`` builds
+the entire nested list of content before returning any of it. For very large
+``word/document.xml`` files, that is a lot of memory.
+
+``stream_text`` parses a content file incrementally with ``lxml.etree.iterparse``
+over ``zipfile.open``. Each top-level element (each child of ``<w:body>``) is
+extracted as soon as it closes, then cleared from memory. Extracted paragraphs
+are yielded with their address (table, row, cell, paragraph indices) as soon as
+their top-level element closes. Paragraphs in the body are yielded as each
+paragraph closes. Paragraphs in a table are yielded when the table closes.
+
+Output is the same as ``get_text``::
+
+    for (i, j, k, l), paragraph in stream_text(file):
+        assert get_text(file)[i][j][k][l] == paragraph
+
+Only ``word/document.xml`` (or any file with a ``<w:document>`` root element) is
+streamed. Headers, footers, footnotes, and endnotes are parsed whole then yielded
+paragraph by paragraph.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterator
+
+from lxml import etree
+from lxml.etree import _Element as EtreeElement  # type: ignore
+
+from .attribute_register import Tags
+from .bullets_and_numbering import BulletGenerator
+from .depth_collector import DepthCollector
+from .docx_text import collect_text, conclude_text
+from .iterators import IndexedItem
+from .xml_parser import get_parser_options
+
+if TYPE_CHECKING:
+    from .docx_reader import File
+
+
+def _is_top_level(elem: EtreeElement, depth: int) -> bool:
+    """Is elem a child of <w:body> (or a child of <w:document> besides <w:body>)?
+
+    :param elem: an element that has just closed
+    :param depth: depth of elem below the root element (root is depth 0)
+    :return: True if elem can be extracted on its own
+    """
+    if depth == 2:
+        parent = elem.getparent()
+        return parent is not None and parent.tag == Tags.BODY
+    return depth == 1 and elem.tag != Tags.BODY
+
+
+def stream_text(file: File) -> Iterator[IndexedItem]:
+    """Extract paragraphs one top-level element at a time.
+
+    :param file: File instance from which text will be extracted.
+    :return: an IndexedItem ``((i, j, k, l), paragraph)`` for each paragraph, where
+        paragraph is a list of run strings. Empty tables, rows, and cells (which
+        appear in the ``get_text`` output as empty lists) are not represented.
+
+    Closing the generator early stops reading and decompressing the content file.
+    """
+    bullets = BulletGenerator(file.context.numbering)
+    tables = DepthCollector(5)
+
+    with file.context.zipf.open(file.path) as xml_file:
+        options = get_parser_options(file.context.huge_tree)
+        del options["collect_ids"]  # not an iterparse option
+        events = etree.iterparse(xml_file, events=("start", "end"), **options)
+        depth = -1
+        for event, elem in events:
+            if event == "start":
+                depth += 1
+                if depth == 0 and elem.tag != Tags.DOCUMENT:
+                    break
+                continue
+            if _is_top_level(elem, depth):
+                collect_text(file, elem, tables, bullets)
+                elem.clear()
+                # drop extracted siblings. Top-level elements are never the root.
+                parent = elem.getparent()
+                while parent is not None and elem.getprevious() is not None:
+                    del parent[0]
+                yield from tables.drain()
+            depth -= 1
+        else:
+            conclude_text(tables)
+            yield from tables.drain()
+            return
+
+        # not a <w:document>. Parse the rest of the file and extract it whole.
+        for _ in events:
+            pass
+        collect_text(file, events.root, tables, bullets)
+        conclude_text(tables)
+        yield from tables.drain()
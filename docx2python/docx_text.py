@@ -11,38 +11,68 @@ Content in the extracted docx is found in the ``word`` folder:
 from __future__ import annotations
 
 from contextlib import suppress
-from typing import TYPE_CHECKING, List, Sequence, cast
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
 from lxml.etree import _Element as EtreeElement  # type: ignore
 
-from .attribute_register import Tags
+from .attribute_register import (
+    BUILTIN_CONTENT_TAGS,
+    HtmlFormatter,
+    Tags,
+    get_content_elems,
+    get_content_tags,
+    register_content_tag,
+)
 from .bullets_and_numbering import BulletGenerator
 from .depth_collector import DepthCollector, Run
 from .forms import get_checkBox_entry, get_ddList_entry
-from .iterators import iter_at_depth
+from .merge_runs import group_elems
 from .namespace import qn
-from .text_runs import (
-    gather_Pr,
-    get_paragraph_formatting,
-    get_pStyle,
-    get_run_formatting,
-)
+from .text_runs import gather_Pr, get_paragraph_formatting, get_pPr, get_pPr_style
 
 if TYPE_CHECKING:
     from docx_reader import File
 
 TablesList = List[List[List[List[str]]]]
 
+# An element or a group of consecutive, mergeable sibling elements (see
+# ``merge_runs.group_elems``) to be extracted as if they were merged.
+ElemGroup = Union[EtreeElement, Sequence[EtreeElement]]
+
+
+def _as_group(root: ElemGroup) -> list[EtreeElement]:
+    """Put a single element into a group of one.
+
+    :param root: an element or a group of consecutive, mergeable sibling elements
+    :return: a group of elements
+    """
+    if isinstance(root, EtreeElement):
+        return [root]
+    return list(root)
+
 
-def _get_elem_depth(tree: EtreeElement) -> int | None:
-    """What depth is this element in a nested list, relative to paragraphs (depth 4)?
+def _get_elem_depths(root: EtreeElement) -> dict[EtreeElement, int]:
+    """What depth is each element in a nested list, relative to paragraphs (depth 4)?
 
-    :param tree: element in a docx content xml (header, footer, officeDocument, etc.)
+    :param root: element in a docx content xml (header, footer, officeDocument, etc.)
 
-    :return: 4 - recursion depth;
-        None if no paragraphs are found or if descending into nest would cause a
-        false start (e.g., Tags.DOCUMENT or Tags.BODY which often have A paragraph (but
-        not the next paragraph) at one or two levels down.
+    :return: every element under (and including) root that will effect depth mapped
+        to 4 - (distance to nearest descendant paragraph). Elements are absent
+        (``depths.get(elem)`` is None) if no paragraphs are found or if descending
+        into nest would cause a false start (e.g., Tags.DOCUMENT or Tags.BODY which
+        often have A paragraph (but not the next paragraph) at one or two levels
+        down.
 
     Typically, the docx is a table of tables::
 
@@ -75,219 +105,504 @@ def _get_elem_depth(tree: EtreeElement) -> int | None:
     below paragraph = depth 5
 
     There will only ever be one document list, so the min depth returned is 1
+
+    Distances are found for every element in one bottom-up pass. In reversed
+    document order, every element is visited after all of its descendants, so its
+    distance to the nearest paragraph is known when it is visited, and that distance
+    (+1) can be handed up to its parent. This replaces a width-first search under
+    every element, which was quadratic for nested tables.
     """
+    elem2dist: dict[EtreeElement, int] = {}
+    for elem in reversed(list(root.iter())):
+        if elem.tag == Tags.PARAGRAPH:
+            dist = elem2dist[elem] = 0
+        else:
+            dist = elem2dist.get(elem)
+            if dist is None:
+                continue
+        parent = None if elem is root else elem.getparent()
+        if parent is None:
+            continue
+        parent_dist = elem2dist.get(parent)
+        if parent_dist is None or parent_dist > dist + 1:
+            elem2dist[parent] = dist + 1
+
+    no_depth = {Tags.DOCUMENT, Tags.BODY}
+    return {k: max(4 - v, 1) for k, v in elem2dist.items() if k.tag not in no_depth}
+
+
+def get_text(file: File, root: ElemGroup | None = None) -> TablesList:
+    """Xml as a string to a list of cell strings.
 
-    if tree.tag in {Tags.DOCUMENT, Tags.BODY}:
-        return None
+    :param file: File instance from which text will be extracted.
+    :param root: Optionally extract content from a single element (or a group of
+        elements, see ``collect_text``). If None, root_element of file will be used.
+    :return: A 5-deep nested list of strings.
 
-    def search_at_depth(tree_: Sequence[EtreeElement], _depth: int = 0) -> int | None:
-        """Width-first recursive search for Tags.PARAGRAPH
+    Sorts the text into the DepthCollector instance, five-levels deep
 
-        :param tree_: a sequence of elements which may contain a paragraph
-        :return: depth of the first paragraph found, or None if no paragraph found
-        """
-        if not tree_:
-            return None
-        if any(x.tag == Tags.PARAGRAPH for x in tree_):
-            return max(4 - _depth, 1)
-        grandchildren = [list(x) for x in tree_]
-        return search_at_depth([x for y in grandchildren for x in y], _depth + 1)
+    ``[table][row][cell][paragraph][run]`` is a string
 
-    return search_at_depth([tree])
+    Joins the runs before returning, so return list will be
 
+    ``[table][row][cell][paragraph]`` is a string
 
-def get_paragraphs(file: File, root: EtreeElement) -> list[str]:
-    """Return a list of paragraphs from the document
+    If you'd like to extend or edit this package, ``collect_text`` is probably where
+    you want to do it. Nothing tricky here except keeping track of the text
+    formatting.
 
-    :param file: an internal file element (e.g., header, footer, document))
-    :param root: the root element of the document
-    :return: a list of paragraphs
+    Consecutive, duplicate elements (see ``merge_runs.merge_elems``) are merged as
+    they are extracted. The xml tree is not altered.
     """
-    all_paragraphs: list[str] = []
-    for branch in root:
-        all_paragraphs += list(iter_at_depth(get_text(file, branch), 5))
-    return all_paragraphs
+    root = root if root is not None else file._root_element
+    bullets = BulletGenerator(file.context.numbering)
+    tables = DepthCollector(5)
+    collect_text(file, root, tables, bullets)
+    conclude_text(tables)
+    return cast(TablesList, tables.tree)
 
 
-def merged_text_tree(file: File, root: EtreeElement) -> str:
-    """Return a string of all text in the document
+def conclude_text(tables: DepthCollector) -> None:
+    """Gather any runs or paragraphs left open after the last element.
 
-    :param file: an internal file element (e.g., header, footer, document))
-    :param root: the root element of the document
-    :return: a string of all text in the document
+    :param tables: DepthCollector instance used in ``collect_text``
     """
-    return "".join(get_paragraphs(file, root))
+    if tables.orphan_runs:
+        _ = tables.commence_paragraph()
+    if tables.open_pars:
+        tables.conclude_paragraph()
 
 
-def get_text(file: File, root: EtreeElement | None = None) -> TablesList:
-    """Xml as a string to a list of cell strings.
+@dataclass
+class TextContext:
+    """Everything a tag handler needs to add text to a DepthCollector.
 
-    :param file: File instance from which text will be extracted.
-    :param root: Optionally extract content from a single element.
-        If None, root_element of file will be used.
-    :return: A 5-deep nested list of strings.
+    :param file: File instance from which text is being extracted
+    :param tables: DepthCollector instance where text is being collected
+    :param bullets: BulletGenerator instance to keep list counters
+    :param xml2html: file.context.xml2html_format (empty if not html)
+    """
 
-    Sorts the text into the DepthCollector instance, five-levels deep
+    file: File
+    tables: DepthCollector
+    bullets: BulletGenerator
+    xml2html: dict[str, HtmlFormatter]
 
-    ``[table][row][cell][paragraph][run]`` is a string
 
-    Joins the runs before returning, so return list will be
+# A tag handler function. Called with the TextContext, the element (in a group with
+# any elements that will be merged into it, see ``merge_runs.group_elems``), and the
+# depth of the element (see ``_get_elem_depths``).
+TagFunction = Callable[[TextContext, List[EtreeElement], Optional[int]], None]
 
-    ``[table][row][cell][paragraph]`` is a string
 
-    If you'd like to extend or edit this package, this function is probably where you
-    want to do it. Nothing tricky here except keeping track of the text formatting.
+class TagHandler(NamedTuple):
+    """What to do when an element with a given tag is found.
+
+    :param open: called before descending into the element's children
+    :param close: called after descending into the element's children
+    :param descend: if False, the element's children are not visited
     """
-    root = root if root is not None else file.root_element
-    # bullets = BulletGenerator(file.context.numId2numFmts)
-    bullets = BulletGenerator(file.context.numId2numFmts, file.context.numId2numStarts)
-    # numId2count = _new_list_counter()
-    tables = DepthCollector(5)
 
-    xml2html = file.context.xml2html_format
+    open: Optional[TagFunction] = None
+    close: Optional[TagFunction] = None
+    descend: bool = True
 
-    def branches(tree: EtreeElement) -> None:
-        """
-        Recursively iterate over tree. Add text when found.
 
-        :param tree: An Element from an xml file (etree)
-        :effect: Adds text cells to outer variable `tables`.
-        """
-        do_descend = True
+# depth and handler of a group that has been opened but not closed
+_Opened = Tuple[Optional[int], Optional[TagHandler]]
 
-        tree_depth = _get_elem_depth(tree)
-        tables.set_caret(tree_depth)
 
-        # queue up tags before opening any paragraphs or runs
-        if tree.tag == Tags.PARAGRAPH:
-            par = tables.commence_paragraph(get_paragraph_formatting(tree, xml2html))
-            if file.context.do_pStyle:
-                par.runs.insert(0, Run([], get_pStyle(tree) or "None"))
-            tables.insert_text_as_new_run(bullets.get_bullet(tree))
-
-        elif tree.tag == Tags.RUN:
-            tables.commence_run(get_run_formatting(tree, xml2html))
-
-        elif tree.tag in {Tags.TEXT, Tags.TEXT_MATH}:
-            # oddly enough, these don't all contain text
-            text = tree.text if tree.text is not None else ""
-            if xml2html:
-                text = text.replace("&", "&amp;")
-                text = text.replace("<", "&lt;")
-                text = text.replace(">", "&gt;")
-            tables.add_text_into_open_run(text)
-
-        elif tree.tag == Tags.MATH:
-            # read equations
-            text = "".join(str(x) for x in tree.itertext())
-            do_descend = False
-            tables.insert_text_as_new_run(f"<latex>{text}</latex>")
-
-        elif tree.tag == Tags.BR:
-            tables.add_text_into_open_run("\n")
-
-        elif tree.tag == Tags.SYM:
-            font = str(tree.attrib.get(qn("w:font")))
-            char = str(tree.attrib.get(qn("w:char")))
-            if char:
-                tables.add_text_into_open_run(
-                    f"<span style=font-family:{font}>&#x0{char[1:]};</span>"
-                )
-
-        elif tree.tag == Tags.FOOTNOTE:
-            footnote_type = str(tree.attrib.get(qn("w:type"), "")).lower()
-            if "separator" not in footnote_type:
-                tables.insert_text_as_new_run(
-                    f"footnote{str(tree.attrib[qn('w:id')])})\t"
-                )
-
-        elif tree.tag == Tags.ENDNOTE:
-            endnote_type = str(tree.attrib.get(qn("w:type"), "")).lower()
-            if "separator" not in endnote_type:
-                tables.insert_text_as_new_run(
-                    f"endnote{str(tree.attrib[qn('w:id')])})\t"
-                )
-
-        elif tree.tag == Tags.HYPERLINK:
-            # look for an href, ignore internal references (anchors)
-            text = merged_text_tree(file, tree)
-            do_descend = False
-            try:
-                rId = tree.attrib[qn("r:id")]
-                link = file.rels[rId]
-                tables.insert_text_as_new_run(f'<a href="{link}">{text}</a>')
-            except KeyError:
-                tables.insert_text_as_new_run(text)
-
-        if tree.tag == Tags.FORM_CHECKBOX:
-            tables.insert_text_as_new_run(get_checkBox_entry(tree))
-
-        elif tree.tag == Tags.FORM_DDLIST:
-            tables.insert_text_as_new_run(get_ddList_entry(tree))
-
-        elif tree.tag == Tags.FOOTNOTE_REFERENCE:
-            tables.insert_text_as_new_run(
-                f"----footnote{str(tree.attrib[qn('w:id')])}----"
-            )
-
-        elif tree.tag == Tags.ENDNOTE_REFERENCE:
-            tables.insert_text_as_new_run(
-                f"----endnote{str(tree.attrib[qn('w:id')])}----"
-            )
-
-        elif tree.tag == Tags.IMAGE:
-            with suppress(KeyError):
-                rId = tree.attrib[qn("r:embed")]
-                image = file.rels[rId]
-                tables.insert_text_as_new_run(f"----{image}----")
-
-        elif tree.tag == Tags.IMAGE_ALT:
-            with suppress(KeyError):
-                description = tree.attrib["descr"]
-                tables.insert_text_as_new_run(f"----Image alt text---->{description}<")
-
-        elif tree.tag == Tags.IMAGEDATA:
-            with suppress(KeyError):
-                rId = tree.attrib[qn("r:id")]
-                image = file.rels[rId]
-                tables.insert_text_as_new_run(f"----{image}----")
-
-        elif tree.tag == Tags.TAB:
-            tables.insert_text_as_new_run("\t")
-
-        if do_descend:
-            for branch in tree:
-                branches(branch)
-
-        if tree.tag == Tags.PARAGRAPH:
-            tables.conclude_paragraph()
-
-        elif tree.tag == Tags.TABLE_CELL and file.context.duplicate_merged_cells:
-            pr = gather_Pr(tree)
-
-            if pr.get("vMerge", "Not None") is None:
-                tables.set_caret(tree_depth)
-                cell_idx = len(tables.caret) - 1
-                assert isinstance(tree_depth, int)
-                prev_row_cell = tables.view_branch((tree_depth - 2, -2, cell_idx))
-                tables.caret[-1] = prev_row_cell
-
-            grid_span = pr.get("gridSpan", 1)
-            assert grid_span is not None
-            for _ in range(int(grid_span) - 1):
-                tables.set_caret(tree_depth)
-                tables.caret.append(tables.caret[-1])
-
-        elif tree.tag == Tags.RUN:
-            tables.conclude_run()
+def _open_paragraph(ctx: TextContext, group: list[EtreeElement], _: int | None) -> None:
+    """Open a paragraph. Insert a paragraph style and bullet if any.
+
+    :param ctx: TextContext instance
+    :param group: paragraph element in a group of one
+    """
+    tree = group[0]
+    pPr = get_pPr(tree)
+    pStyle = get_pPr_style(pPr)
+    commence_paragraph(
+        ctx,
+        get_paragraph_formatting(tree, ctx.xml2html, pStyle),
+        pStyle,
+        ctx.bullets.get_pPr_bullet(pPr),
+    )
+
+
+def commence_paragraph(
+    ctx: TextContext, html_style: list[str], pStyle: str | None, bullet: str
+) -> None:
+    """Open a paragraph with values already read from its element.
+
+    :param ctx: TextContext instance
+    :param html_style: html paragraph formatting (see ``get_paragraph_formatting``)
+    :param pStyle: paragraph style name or None
+    :param bullet: bullet string (see ``BulletGenerator``) or ""
+    :effect: opens a paragraph in ctx.tables. Inserts a paragraph style (if
+        file.context.do_pStyle) and bullet.
+    """
+    par = ctx.tables.commence_paragraph(html_style)
+    if ctx.file.context.do_pStyle:
+        par.runs.insert(0, Run(text=pStyle or "None"))
+    ctx.tables.insert_text_as_new_run(bullet)
+
+
+def _close_paragraph(
+    ctx: TextContext, group: list[EtreeElement], _: int | None
+) -> None:
+    """Close a paragraph.
+
+    :param ctx: TextContext instance
+    :param group: paragraph element in a group of one
+    """
+    ctx.tables.conclude_paragraph()
+
+
+def _open_run(ctx: TextContext, group: list[EtreeElement], _: int | None) -> None:
+    """Open a run with the run formatting of the first element in group.
+
+    :param ctx: TextContext instance
+    :param group: consecutive runs with identical formatting
+    """
+    cache = ctx.file.context.formatting_cache
+    ctx.tables.commence_run(cache.get_run_formatting(group[0], ctx.xml2html))
+
+
+def _close_run(ctx: TextContext, group: list[EtreeElement], _: int | None) -> None:
+    """Close a run.
+
+    :param ctx: TextContext instance
+    :param group: consecutive runs with identical formatting
+    """
+    ctx.tables.conclude_run()
+
+
+def _add_text(ctx: TextContext, group: list[EtreeElement], _: int | None) -> None:
+    """Add text (escaped if html) into the open run.
+
+    :param ctx: TextContext instance
+    :param group: consecutive text elements
+    """
+    # oddly enough, these don't all contain text
+    text = "".join(x.text or "" for x in group)
+    if ctx.xml2html:
+        text = text.replace("&", "&amp;")
+        text = text.replace("<", "&lt;")
+        text = text.replace(">", "&gt;")
+    ctx.tables.add_text_into_open_run(text)
+
+
+def _add_math(ctx: TextContext, group: list[EtreeElement], _: int | None) -> None:
+    """Read an equation.
+
+    :param ctx: TextContext instance
+    :param group: equation element in a group of one
+    """
+    text = "".join(str(x) for x in group[0].itertext())
+    ctx.tables.insert_text_as_new_run(f"<latex>{text}</latex>")
+
+
+def _add_br(ctx: TextContext, group: list[EtreeElement], _: int | None) -> None:
+    """Add a line break into the open run.
+
+    :param ctx: TextContext instance
+    :param group: br element in a group of one
+    """
+    ctx.tables.add_text_into_open_run("\n")
 
+
+def _add_sym(ctx: TextContext, group: list[EtreeElement], _: int | None) -> None:
+    """Add a symbol in its font.
+
+    :param ctx: TextContext instance
+    :param group: sym element in a group of one
+    """
+    font = str(group[0].attrib.get(qn("w:font")))
+    char = str(group[0].attrib.get(qn("w:char")))
+    if char:
+        ctx.tables.add_text_into_open_run(
+            f"<span style=font-family:{font}>&#x0{char[1:]};</span>"
+        )
+
+
+def _open_note(ctx: TextContext, group: list[EtreeElement], _: int | None) -> None:
+    """Label a footnote or endnote (e.g., "footnote1)\t").
+
+    :param ctx: TextContext instance
+    :param group: footnote or endnote element in a group of one
+    """
+    tree = group[0]
+    note_type = str(tree.attrib.get(qn("w:type"), "")).lower()
+    if "separator" not in note_type:
+        name = "footnote" if tree.tag == Tags.FOOTNOTE else "endnote"
+        ctx.tables.insert_text_as_new_run(f"{name}{str(tree.attrib[qn('w:id')])})\t")
+
+
+def _open_hyperlink(ctx: TextContext, group: list[EtreeElement], _: int | None) -> None:
+    """Collect text inside a hyperlink to be joined into one run.
+
+    :param ctx: TextContext instance
+    :param group: consecutive hyperlinks with the same href
+    """
+    ctx.tables.commence_joined_runs()
+
+
+def _close_hyperlink(
+    ctx: TextContext, group: list[EtreeElement], _: int | None
+) -> None:
+    """Add a hyperlink as html. Ignore internal references (anchors).
+
+    :param ctx: TextContext instance
+    :param group: consecutive hyperlinks with the same href
+
+    Runs collected since ``_open_hyperlink`` are replaced with one run.
+    """
+    text = ctx.tables.conclude_joined_runs()
+    try:
+        rId = group[0].attrib[qn("r:id")]
+        link = ctx.file.rels[rId]
+        ctx.tables.insert_text_as_new_run(f'<a href="{link}">{text}</a>')
+    except KeyError:
+        ctx.tables.insert_text_as_new_run(text)
+
+
+def _add_checkbox(ctx: TextContext, group: list[EtreeElement], _: int | None) -> None:
+    """Add a checkbox form entry.
+
+    :param ctx: TextContext instance
+    :param group: checkBox element in a group of one
+    """
+    ctx.tables.insert_text_as_new_run(get_checkBox_entry(group[0]))
+
+
+def _add_ddlist(ctx: TextContext, group: list[EtreeElement], _: int | None) -> None:
+    """Add a drop-down form entry.
+
+    :param ctx: TextContext instance
+    :param group: ddList element in a group of one
+    """
+    ctx.tables.insert_text_as_new_run(get_ddList_entry(group[0]))
+
+
+def _add_note_reference(
+    ctx: TextContext, group: list[EtreeElement], _: int | None
+) -> None:
+    """Add a footnote or endnote reference (e.g., "----footnote1----").
+
+    :param ctx: TextContext instance
+    :param group: footnoteReference or endnoteReference element in a group of one
+    """
+    tree = group[0]
+    name = "footnote" if tree.tag == Tags.FOOTNOTE_REFERENCE else "endnote"
+    ctx.tables.insert_text_as_new_run(f"----{name}{str(tree.attrib[qn('w:id')])}----")
+
+
+def _add_image(ctx: TextContext, group: list[EtreeElement], _: int | None) -> None:
+    """Add an image path (e.g., "----media/image1.png----").
+
+    :param ctx: TextContext instance
+    :param group: blip or imagedata element in a group of one
+    """
+    rels_key = qn("r:embed") if group[0].tag == Tags.IMAGE else qn("r:id")
+    with suppress(KeyError):
+        rId = group[0].attrib[rels_key]
+        image = ctx.file.rels[rId]
+        ctx.tables.insert_text_as_new_run(f"----{image}----")
+
+
+def _add_image_alt(ctx: TextContext, group: list[EtreeElement], _: int | None) -> None:
+    """Add image alt text.
+
+    :param ctx: TextContext instance
+    :param group: docPr element in a group of one
+    """
+    with suppress(KeyError):
+        description = group[0].attrib["descr"]
+        ctx.tables.insert_text_as_new_run(f"----Image alt text---->{description}<")
+
+
+def _add_tab(ctx: TextContext, group: list[EtreeElement], _: int | None) -> None:
+    """Add a tab as a new run.
+
+    :param ctx: TextContext instance
+    :param group: tab element in a group of one
+    """
+    ctx.tables.insert_text_as_new_run("\t")
+
+
+def _close_table_cell(
+    ctx: TextContext, group: list[EtreeElement], tree_depth: int | None
+) -> None:
+    """Duplicate merged cells if file.context.duplicate_merged_cells.
+
+    :param ctx: TextContext instance
+    :param group: table cell element in a group of one
+    :param tree_depth: depth of the table cell
+    """
+    if ctx.file.context.duplicate_merged_cells:
+        duplicate_merged_cell(ctx, gather_Pr(group[0]), tree_depth)
+
+
+def duplicate_merged_cell(
+    ctx: TextContext, pr: dict[str, str | None], tree_depth: int | None
+) -> None:
+    """Copy a vertically merged cell from the row above. Repeat a spanning cell.
+
+    :param ctx: TextContext instance
+    :param pr: table cell properties (see ``text_runs.gather_Pr``)
+    :param tree_depth: depth of the table cell
+    """
+    tables = ctx.tables
+    if pr.get("vMerge", "Not None") is None:
+        tables.set_caret(tree_depth)
+        cell_idx = len(tables.caret) - 1
+        assert isinstance(tree_depth, int)
+        prev_row_cell = tables.view_branch((tree_depth - 2, -2, cell_idx))
+        tables.caret[-1] = prev_row_cell
+
+    grid_span = pr.get("gridSpan", 1)
+    assert grid_span is not None
+    for _ in range(int(grid_span) - 1):
         tables.set_caret(tree_depth)
+        tables.caret.append(tables.caret[-1])
+
+
+# Clark-notation tags mapped to handlers. Elements with any other tag do nothing
+# (their children are still visited). See ``register_tag_handler``.
+TAG_HANDLERS: dict[str, TagHandler] = {
+    Tags.PARAGRAPH.value: TagHandler(_open_paragraph, _close_paragraph),
+    Tags.RUN.value: TagHandler(_open_run, _close_run),
+    Tags.TEXT.value: TagHandler(_add_text),
+    Tags.TEXT_MATH.value: TagHandler(_add_text),
+    Tags.MATH.value: TagHandler(_add_math, descend=False),
+    Tags.BR.value: TagHandler(_add_br),
+    Tags.SYM.value: TagHandler(_add_sym),
+    Tags.FOOTNOTE.value: TagHandler(_open_note),
+    Tags.ENDNOTE.value: TagHandler(_open_note),
+    Tags.HYPERLINK.value: TagHandler(_open_hyperlink, _close_hyperlink),
+    Tags.FORM_CHECKBOX.value: TagHandler(_add_checkbox),
+    Tags.FORM_DDLIST.value: TagHandler(_add_ddlist),
+    Tags.FOOTNOTE_REFERENCE.value: TagHandler(_add_note_reference),
+    Tags.ENDNOTE_REFERENCE.value: TagHandler(_add_note_reference),
+    Tags.IMAGE.value: TagHandler(_add_image),
+    Tags.IMAGE_ALT.value: TagHandler(_add_image_alt),
+    Tags.IMAGEDATA.value: TagHandler(_add_image),
+    Tags.TAB.value: TagHandler(_add_tab),
+    Tags.TABLE_CELL.value: TagHandler(close=_close_table_cell),
+}
+
+# the handlers above, before any are added or replaced with ``register_tag_handler``
+BUILTIN_TAG_HANDLERS = dict(TAG_HANDLERS)
+
+
+def register_tag_handler(
+    tag: str,
+    open_: TagFunction | None = None,
+    close: TagFunction | None = None,
+    descend: bool = True,
+) -> None:
+    """Add (or replace) the handler for a tag.
+
+    :param tag: Clark-notation tag (e.g., ``qn("w:fldSimple")``)
+    :param open_: optional function called before the element's children are visited
+    :param close: optional function called after the element's children are visited
+    :param descend: if False, do not visit the element's children
+    :effect: adds a TagHandler to TAG_HANDLERS and registers tag as a content tag
+        (see ``attribute_register.register_content_tag``)
+
+    Handlers receive a TextContext, the element in a list (with any elements that
+    will be merged into it), and its depth. Use ``ctx.tables`` to add text::
+
+        def add_field(ctx, group, depth):
+            instr = group[0].attrib.get(qn("w:instr"), "")
+            ctx.tables.insert_text_as_new_run(f"[{instr}]")
+
+        register_tag_handler(qn("w:fldSimple"), add_field)
+
+    Handlers are global. They will be used in every later extraction.
+    """
+    TAG_HANDLERS[str(tag)] = TagHandler(open_, close, descend)
+    register_content_tag(tag)
 
-    branches(root)
 
-    if tables.orphan_runs:
-        _ = tables.commence_paragraph()
-    if tables.open_pars:
-        tables.conclude_paragraph()
+def has_builtin_handlers_only() -> bool:
+    """Have tag handlers and content tags been left as docx2python defines them?
 
-    return cast(TablesList, tables.tree)
+    :return: False if any tag handlers or content tags have been registered
+    """
+    return (
+        TAG_HANDLERS == BUILTIN_TAG_HANDLERS
+        and get_content_tags() == BUILTIN_CONTENT_TAGS
+    )
+
+
+def collect_text(
+    file: File, root: ElemGroup, tables: DepthCollector, bullets: BulletGenerator
+) -> None:
+    """Add text from root and its descendants into tables.
+
+    :param file: File instance from which text will be extracted.
+    :param root: extract content from this element. This can also be a group of
+        consecutive, mergeable sibling elements (see ``merge_runs.group_elems``).
+        These will be extracted as one merged element.
+    :param tables: DepthCollector instance where text will be collected.
+    :param bullets: BulletGenerator instance to keep list counters.
+    :effect: Adds text cells to tables.
+
+    Sibling elements (e.g., each element in a body) can be passed one after the other
+    with the same ``tables`` and ``bullets`` to collect the same text as if their
+    parent had been passed. Call ``conclude_text`` when finished.
+
+    ``merge_elems`` would merge consecutive runs, links, and text elements with
+    identical formatting. Rather than altering the tree, find groups of these
+    elements as the tree is walked (``group_elems``) and extract each group as one
+    element. Elements without content (``get_content_elems``) will not add any text,
+    so these are skipped.
+
+    What each element does is looked up by tag in ``TAG_HANDLERS``.
+    """
+    ctx = TextContext(file, tables, bullets, file.context.xml2html_format)
+    group = _as_group(root)
+    depths: dict[EtreeElement, int] = {}
+    content_elems: set[EtreeElement] = set()
+    for elem in group:
+        depths.update(_get_elem_depths(elem))
+        content_elems |= get_content_elems(elem)
+
+    def get_group_depth(group_: list[EtreeElement]) -> int | None:
+        """Depth of a group of elements as if they were merged.
+
+        :param group_: consecutive, mergeable sibling elements
+        :return: depth of the nearest paragraph in any element.
+        """
+        if len(group_) == 1:
+            return depths.get(group_[0])
+        group_depths = [d for d in (depths.get(x) for x in group_) if d is not None]
+        return max(group_depths, default=None)
+
+    # Walk the tree with an explicit stack, so deeply nested documents will not
+    # exceed the recursion limit. Each group is pushed twice: once to open it (with
+    # no state) and, after it has been opened, once to close it (with its depth
+    # and handler). The close entry is pushed under the group's children.
+    stack: list[tuple[list[EtreeElement], _Opened | None]] = [(group, None)]
+    while stack:
+        group_, opened = stack.pop()
+        if opened is not None:
+            tree_depth, handler = opened
+            if handler is not None and handler.close is not None:
+                handler.close(ctx, group_, tree_depth)
+            ctx.tables.set_caret(tree_depth)
+            continue
+
+        tree_depth = get_group_depth(group_)
+        ctx.tables.set_caret(tree_depth)
+
+        handler = TAG_HANDLERS.get(group_[0].tag)
+        if handler is not None and handler.open is not None:
+            handler.open(ctx, group_, tree_depth)
+        stack.append((group_, (tree_depth, handler)))
+
+        if handler is None or handler.descend:
+            children = (x for y in group_ for x in y)
+            branches = group_elems(file, children, content_elems)
+            stack += ((x, None) for x in reversed(branches))
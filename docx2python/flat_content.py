@@ -0,0 +1,208 @@
+"""Hold extracted text runs in one flat list with an offset array for each depth.
+
+:author: Shay Hill
+:created: 2023-07-03
+
+The ``_runs`` properties of ``DocxContent`` return a 5-deep nested list (see
+``docx_output``). Each paragraph, cell, row, and table is a list object, so a
+large document is many thousands of lists, and pickling them (e.g., to send them
+from a worker process) is slow. ``FlatContent`` holds the same runs as
+
+    * ``runs``: every run string, in document order
+    * ``paragraphs``: ``array('i')`` of offsets into ``runs``
+    * ``cells``: ``array('i')`` of offsets into ``paragraphs``
+    * ``rows``: ``array('i')`` of offsets into ``cells``
+    * ``tables``: ``array('i')`` of offsets into ``rows``
+    * ``parts``: ``array('i')`` of offsets into ``tables``
+    * ``part_names``: the content file type (e.g., "header") of each part
+
+Each offset array has one more item than the number of items it describes. Runs
+of paragraph ``i`` are ``runs[paragraphs[i] : paragraphs[i + 1]]``, paragraphs of
+cell ``i`` are ``range(cells[i], cells[i + 1])``, and so on. Empty paragraphs,
+cells, rows, and tables are kept. The runs of row 3 can be found without walking
+any nested list::
+
+    flat = docx_content.to_flat()
+    for cell in flat.children("rows", 3):
+        print([flat.get_runs(x) for x in flat.children("cells", cell)])
+
+Nested lists are rebuilt on demand with ``to_tables``, ``get_table``,
+``get_row``, ``get_cell``, and ``get_runs``. These hold the strings in ``runs``,
+not copies. ``offsets_as_numpy`` returns the offset arrays as numpy arrays that
+share memory with the ``array('i')`` arrays (numpy is not a dependency of
+docx2python; install it to use this method).
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Tuple
+
+from .iterators import TablesList
+
+# offset arrays from the shallowest to the deepest. Each holds offsets into the next.
+_DEPTHS = ("parts", "tables", "rows", "cells", "paragraphs")
+
+
+def _new_offsets() -> array[int]:
+    """Create an offset array holding only the start of the first item.
+
+    :return: ``array('i', [0])``
+    """
+    return array("i", [0])
+
+
+@dataclass
+class FlatContent:
+    """Text runs in one flat list with offsets for paragraphs, cells, rows, etc.
+
+    :param runs: every run string, in document order
+    :param paragraphs: runs of paragraph i are runs[paragraphs[i]:paragraphs[i+1]]
+    :param cells: paragraphs of cell i are paragraphs cells[i] to cells[i+1]
+    :param rows: cells of row i are cells rows[i] to rows[i+1]
+    :param tables: rows of table i are rows tables[i] to tables[i+1]
+    :param parts: tables of part i are tables parts[i] to parts[i+1]
+    :param part_names: content file type (e.g., "header") of each part
+    """
+
+    runs: List[str] = field(default_factory=list)
+    paragraphs: array[int] = field(default_factory=_new_offsets)
+    cells: array[int] = field(default_factory=_new_offsets)
+    rows: array[int] = field(default_factory=_new_offsets)
+    tables: array[int] = field(default_factory=_new_offsets)
+    parts: array[int] = field(default_factory=_new_offsets)
+    part_names: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_parts(cls, parts: Iterable[Tuple[str, TablesList]]) -> FlatContent:
+        """Flatten text runs.
+
+        :param parts: (name, text runs [[[[str]]]]) for each part. E.g.,
+            ``("header", docx_content.header_runs)``
+        :return: a new FlatContent instance
+        """
+        flat = cls()
+        for name, tables in parts:
+            flat.append_part(name, tables)
+        return flat
+
+    def append_part(self, name: str, tables: TablesList) -> None:
+        """Flatten text runs into a new part at the end.
+
+        :param name: content file type (e.g., "header") of the part
+        :param tables: text runs [[[[str]]]]
+        """
+        runs, paragraphs, cells = self.runs, self.paragraphs, self.cells
+        rows = self.rows
+        for table in tables:
+            for row in table:
+                for cell in row:
+                    for paragraph in cell:
+                        runs.extend(paragraph)
+                        paragraphs.append(len(runs))
+                    cells.append(len(paragraphs) - 1)
+                rows.append(len(cells) - 1)
+            self.tables.append(len(rows) - 1)
+        self.parts.append(len(self.tables) - 1)
+        self.part_names.append(name)
+
+    def count(self, depth: str) -> int:
+        """Count parts, tables, rows, cells, or paragraphs.
+
+        :param depth: "parts", "tables", "rows", "cells", or "paragraphs"
+        :return: number of items at depth
+        """
+        return len(self._get_offsets(depth)) - 1
+
+    def _get_offsets(self, depth: str) -> array[int]:
+        """Get the offset array for a depth.
+
+        :param depth: "parts", "tables", "rows", "cells", or "paragraphs"
+        :return: offsets of the children of each item at depth
+        :raise ValueError: if depth is not one of the above
+        """
+        if depth not in _DEPTHS:
+            raise ValueError(f"depth must be one of {_DEPTHS}, not {depth!r}")
+        offsets: array[int] = getattr(self, depth)
+        return offsets
+
+    def children(self, depth: str, index: int) -> range:
+        """Indices of the children of one item.
+
+        :param depth: "parts", "tables", "rows", "cells", or "paragraphs"
+        :param index: index of a part, table, ... (counted across the document)
+        :return: indices of the tables of a part, the rows of a table, ... or, for
+            a paragraph, the indices of its runs in ``runs``
+        :raise IndexError: if there is no item at index
+        """
+        offsets = self._get_offsets(depth)
+        if not -len(offsets) < index < len(offsets) - 1:
+            raise IndexError(f"{depth} index out of range")
+        index %= len(offsets) - 1
+        return range(offsets[index], offsets[index + 1])
+
+    def get_runs(self, paragraph: int) -> List[str]:
+        """Get the runs of one paragraph.
+
+        :param paragraph: index of a paragraph (counted across the document)
+        :return: run strings [str]
+        """
+        children = self.children("paragraphs", paragraph)
+        return self.runs[children.start : children.stop]
+
+    def get_cell(self, cell: int) -> List[List[str]]:
+        """Rebuild one cell.
+
+        :param cell: index of a cell (counted across the document)
+        :return: text runs [[str]]
+        """
+        return [self.get_runs(x) for x in self.children("cells", cell)]
+
+    def get_row(self, row: int) -> List[List[List[str]]]:
+        """Rebuild one row.
+
+        :param row: index of a row (counted across the document)
+        :return: text runs [[[str]]]
+        """
+        return [self.get_cell(x) for x in self.children("rows", row)]
+
+    def get_table(self, table: int) -> List[List[List[List[str]]]]:
+        """Rebuild one table.
+
+        :param table: index of a table (counted across the document)
+        :return: text runs [[[[str]]]]
+        """
+        return [self.get_row(x) for x in self.children("tables", table)]
+
+    def get_part(self, name: str) -> TablesList:
+        """Rebuild every part with a name.
+
+        :param name: content file type (e.g., "header")
+        :return: text runs [[[[str]]]] like ``DocxContent.header_runs``. Empty if
+            there is no such part.
+        """
+        indices = (i for i, x in enumerate(self.part_names) if x == name)
+        return [self.get_table(x) for i in indices for x in self.children("parts", i)]
+
+    def to_tables(self) -> TablesList:
+        """Rebuild the nested list of every part.
+
+        :return: text runs [[[[str]]]] like ``DocxContent.document_runs``
+        """
+        return [self.get_table(x) for x in range(self.count("tables"))]
+
+    def offsets_as_numpy(self) -> Dict[str, Any]:
+        """Get the offset arrays as numpy arrays without copying them.
+
+        :return: depth name ("parts", "tables", ...) mapped to a numpy int32 array
+            sharing memory with the ``array('i')`` of the same name. The
+            ``array('i')`` cannot grow while a numpy array holds its memory.
+        :raise ImportError: if numpy is not installed
+        """
+        try:
+            import numpy as np  # type: ignore
+        except ImportError as exc:
+            msg = "offsets_as_numpy requires numpy. Use the array('i') attributes."
+            raise ImportError(msg) from exc
+        return {x: np.frombuffer(getattr(self, x), dtype=np.intc) for x in _DEPTHS}
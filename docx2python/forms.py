@@ -11,8 +11,7 @@ crossed-out checkboxes. Pypi doesn't like them in my file, so I have to referenc
 them by their escape sequences.
 """
 
-from contextlib import suppress
-from typing import Union
+from typing import List, Optional
 
 from lxml.etree import _Element as EtreeElement  # type: ignore
 
@@ -48,20 +47,26 @@ def get_checkBox_entry(checkBox: EtreeElement) -> str:
     If the ``checked`` attribute is present, but not w:val is given, return unchecked
     """
 
-    def get_wval() -> Union[str, None]:
-        """Get the value of the ``w:val`` attribute of the ``checked`` element.
+    checked = checkBox.find(qn("w:checked"))
+    default = checkBox.find(qn("w:default"))
+    return get_checkBox_entry_from_vals(
+        None if checked is None else str(checked.attrib.get(qn("w:val"), "")),
+        None if default is None else default.attrib.get(qn("w:val")),
+    )
 
-        :return: the value of the ``w:val`` attribute of the ``checked`` element
-        """
-        with suppress(StopIteration):
-            checked = next(checkBox.iterfind(qn("w:checked")))
-            return str(checked.attrib.get(qn("w:val")) or "1")
-        with suppress(StopIteration, KeyError):
-            default = next(checkBox.iterfind(qn("w:default")))
-            return str(default.attrib[qn("w:val")])
-        return None
 
-    return {"0": "\u2610", "1": "\u2612", None: "----checkbox failed----"}[get_wval()]
+def get_checkBox_entry_from_vals(checked: Optional[str], default: Optional[str]) -> str:
+    """Create text representation for a checkBox from its sub-element values.
+
+    :param checked: ``w:val`` of the ``w:checked`` element ("" if the element has
+        no ``w:val``, None if there is no ``w:checked`` element)
+    :param default: ``w:val`` of the ``w:default`` element (None if there is no
+        element or no ``w:val``)
+    :return: "\u2610", "\u2612", or ``--checkbox failed--``. See
+        ``get_checkBox_entry``.
+    """
+    val = (checked or "1") if checked is not None else default
+    return {"0": "\u2610", "1": "\u2612", None: "----checkbox failed----"}[val]
 
 
 def get_ddList_entry(ddList: EtreeElement) -> str:
@@ -81,9 +86,20 @@ def get_ddList_entry(ddList: EtreeElement) -> str:
     list_entries = [
         x.attrib.get(qn("w:val")) for x in ddList.findall(qn("w:listEntry"))
     ]
-    try:
-        result = next(ddList.iterfind(qn("w:result")))
-        list_index = int(result.attrib[qn("w:val")])
-    except (StopIteration, KeyError):
-        list_index = 0
-    return str(list_entries[list_index])
+    result = ddList.find(qn("w:result"))
+    return get_ddList_entry_from_vals(
+        list_entries, None if result is None else result.attrib.get(qn("w:val"))
+    )
+
+
+def get_ddList_entry_from_vals(
+    list_entries: List[Optional[str]], result: Optional[str]
+) -> str:
+    """Get the selected string of a dropdown list from its sub-element values.
+
+    :param list_entries: ``w:val`` of each ``w:listEntry`` element
+    :param result: ``w:val`` of the ``w:result`` element (None if there is no
+        element or no ``w:val``)
+    :return: the selected entry. The first if there is no result.
+    """
+    return str(list_entries[int(result or 0)])
@@ -257,6 +257,29 @@ def enum_paragraphs(tables: TablesList) -> Iterator[IndexedItem]:
     return enum_at_depth(tables, 4)
 
 
+def join_runs(tables: TablesList) -> TablesList:
+    """
+    Join the runs of each paragraph into a string.
+
+    :param tables: ``[[[["run", "run"]]]]``
+    :return: ``[[[["runrun"]]]]``, a new nested list. ``tables`` is not altered
+        or copied, so only the new lists and the joined strings are allocated.
+    """
+    return [
+        [[["".join(par) for par in cell] for cell in row] for row in tbl]
+        for tbl in tables
+    ]
+
+
+def copy_nested(nested: List[Any]) -> List[Any]:
+    """Copy the lists of a nested list without copying the (str) items.
+
+    :param nested: a nested list of strings (e.g., TablesList)
+    :return: a new nested list holding the same strings
+    """
+    return [copy_nested(x) if isinstance(x, list) else x for x in nested]
+
+
 def get_text(tables: TablesList) -> str:
     """
     Short cut to pull text from any subset of extracted content.
@@ -7,10 +7,51 @@ from __future__ import annotations
 
 from io import BytesIO
 from pathlib import Path
+from typing import Iterable
 from warnings import warn
 
-from .docx_output import DocxContent
+from .attribute_register import has_builtin_formatter
+from .disk_cache import DiskCache
+from .docx_output import DocxContent, get_part_types
 from .docx_reader import DocxReader
+from .docx_text import has_builtin_handlers_only
+from .stats import ReaderStats
+
+
+def _read_through(
+    docx_content: DocxContent, cache: DiskCache, stats: ReaderStats | None
+) -> None:
+    """Read docx_content from a DiskCache. Extract and store it on a miss.
+
+    :param docx_content: DocxContent instance (nothing has been extracted yet)
+    :param cache: DiskCache instance
+    :param stats: optionally count hits and misses in ``stats.caches["disk"]``
+    :effects: sets ``docx_content.stored``
+
+    The key does not describe registered tag handlers or html formatters. Do not
+    read or store content if any have been registered or changed.
+    """
+    reader = docx_content.docx_reader
+    if not has_builtin_handlers_only():
+        return
+    if reader.xml2html_format and not has_builtin_formatter():
+        return
+    options = {
+        "html": bool(reader.xml2html_format),
+        "paragraph_styles": reader.do_pStyle,
+        "duplicate_merged_cells": reader.duplicate_merged_cells,
+        "parts": sorted(docx_content.part_types),
+    }
+    key = cache.get_key(reader.docx_filename, options)
+    stored = cache.get(key)
+    if stats is not None:
+        counter = stats.cache("disk")
+        counter.hits += stored is not None
+        counter.misses += stored is None
+    if stored is None:
+        stored = docx_content.to_stored()
+        cache.put(key, stored)
+    docx_content.stored = stored
 
 
 def docx2python(
@@ -20,6 +61,11 @@ def docx2python(
     paragraph_styles: bool = False,
     extract_image: bool | None = None,
     duplicate_merged_cells: bool = False,
+    stats: ReaderStats | None = None,
+    engine: str = "tree",
+    huge_tree: bool = False,
+    parts: Iterable[str] | None = None,
+    cache: DiskCache | str | Path | None = None,
 ) -> DocxContent:
     """
     Unzip a docx file and extract contents.
@@ -33,7 +79,23 @@ def docx2python(
     :param extract_image: bool, extract images from document (default True)
     :param duplicate_merged_cells: bool, duplicate merged cells to return a mxn
         nested list for each table (default False)
+    :param stats: optionally record timing and counters for each phase of reading
+        each file in the docx (see ``stats.ReaderStats``)
+    :param engine: "tree" (default) to parse each file into an xml tree, or "sax"
+        to extract plain text (html=False only) without building a tree (see
+        ``docx_sax``). Content is the same either way.
+    :param huge_tree: parse xml without libxml2 limits on text-node size and tree
+        depth. Only for files you trust. See ``xml_parser``.
+    :param parts: optionally extract only these parts, e.g., ``{"officeDocument"}``.
+        Content file types ("header", "officeDocument", "footer", "footnotes",
+        "endnotes") or paragraph property names ("body"). Files of other parts are
+        never read, and their properties (e.g., ``header_runs``) are empty.
+    :param cache: optionally, a DiskCache instance or a directory for one. If the
+        same docx bytes have been extracted with the same options, read content
+        from the cache without opening the docx. Else extract the selected parts
+        now and store them. See ``disk_cache``.
     :return: DocxContent object
+    :raise ValueError: if a part is not a content file type or property name
     """
     if extract_image is not None:
         warn(
@@ -43,10 +105,22 @@ def docx2python(
             + "``docx2python(filename).write_images(image_folder)``. Images files are "
             + "available as before with ``docx2text(filename).images`` attribute."
         )
+    if parts is not None:
+        parts = get_part_types(parts)
     docx_context = DocxReader(
-        docx_filename, html, paragraph_styles, duplicate_merged_cells
+        docx_filename,
+        html,
+        paragraph_styles,
+        duplicate_merged_cells,
+        stats,
+        engine,
+        huge_tree,
     )
     docx_content = DocxContent(docx_context, locals())
+    if cache is not None:
+        if not isinstance(cache, DiskCache):
+            cache = DiskCache(cache)
+        _read_through(docx_content, cache, stats)
     if image_folder:
         _ = docx_content.images
     return docx_content
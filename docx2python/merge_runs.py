@@ -9,12 +9,11 @@ from __future__ import annotations
 
 import functools
 from itertools import groupby
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable, List, Set
 
 from lxml.etree import _Element as EtreeElement  # type: ignore
 
-from .attribute_register import RELS_ID, Tags, has_content
-from .text_runs import get_html_formatting
+from .attribute_register import RELS_ID, Tags, get_content_elems
 
 if TYPE_CHECKING:
     from .docx_reader import File
@@ -53,17 +52,56 @@ def _elem_key(file: File, elem: EtreeElement) -> tuple[str, str, list[str]]:
     # always join links pointing to the same address
     rels_id = elem.attrib.get(RELS_ID)
     if rels_id:
-        return tag, str(file.rels[str(rels_id)]), []
+        return tag, str(file.rels.get(str(rels_id), rels_id)), []
 
-    return tag, "", get_html_formatting(elem, file.context.xml2html_format)
+    if tag != Tags.RUN:
+        return tag, "", []
+    cache = file.context.formatting_cache
+    return tag, "", cache.get_run_formatting(elem, file.context.xml2html_format)
 
 
-def merge_elems(file: File, tree: EtreeElement) -> None:
+def group_elems(
+    file: File, elems: Iterable[EtreeElement], content_elems: Set[EtreeElement]
+) -> List[List[EtreeElement]]:
+    """
+    Group consecutive sibling elements ``merge_elems`` would merge.
+
+    :param file: File instance
+    :param elems: consecutive sibling elements (e.g., all children of a paragraph)
+    :param content_elems: elements with descendent content elements. See
+        ``get_content_elems``.
+    :return: groups of consecutive, duplicate (as far as docx2python is concerned)
+        content elements in order of their first element. Elements without content
+        are ignored.
+
+    This finds the same merges as ``merge_elems`` without altering the tree. A
+    group of more than one element is equivalent to the first element of the group
+    after ``merge_elems``: the first element's tag, attributes, and style with the
+    children of every element in the group. Groups of text elements are equivalent
+    to one text element with the text of every element in the group.
+    """
+    groups: List[List[EtreeElement]] = []
+    prev_key: tuple[str, str, list[str]] | None = None
+    for elem in (x for x in elems if x in content_elems):
+        key = _elem_key(file, elem)
+        if key == prev_key and elem.tag in _MERGEABLE_TAGS:
+            groups[-1].append(elem)
+        else:
+            groups.append([elem])
+        prev_key = key
+    return groups
+
+
+def merge_elems(
+    file: File, tree: EtreeElement, content_elems: Set[EtreeElement] | None = None
+) -> None:
     """
-    Recursively merge duplicate (as far as docx2python is concerned) elements.
+    Merge duplicate (as far as docx2python is concerned) elements at every level.
 
     :param file: File instancce
     :param tree: root_element from an xml in File instance
+    :param content_elems: elements with descendent content elements. These are
+        found once (see ``get_content_elems``) if not given.
     :effects: Merges consecutive elements if tag, attrib, and style are the same
 
     There are a few ways consecutive elements can be "identical":
@@ -135,20 +173,29 @@ def merge_elems(file: File, tree: EtreeElement) -> None:
     or larger elements would ignore information docx2python DOES want to preserve.
 
     Filter out non-content items so runs can be joined even
+
+    Elements without content will have nothing to merge, so there is no need to
+    descend into them.
     """
+    if content_elems is None:
+        content_elems = get_content_elems(tree)
 
     file_elem_key = functools.partial(_elem_key, file)
 
-    elems = [x for x in tree if has_content(x)]
-    runs = [list(y) for _, y in groupby(elems, key=file_elem_key)]
-
-    for run in (x for x in runs if len(x) > 1 and x[0].tag in _MERGEABLE_TAGS):
-        if run[0].tag in {Tags.TEXT, Tags.TEXT_MATH}:
-            run[0].text = "".join(x.text or "" for x in run)
-        for elem in run[1:]:
-            for e in elem:
-                run[0].append(e)
-            tree.remove(elem)
-
-    for branch in tree:
-        merge_elems(file, branch)
+    # merge children of each branch, then push the (merged) children onto a stack.
+    # An explicit stack will not exceed the recursion limit for deeply nested xml.
+    stack = [tree]
+    while stack:
+        branch = stack.pop()
+        elems = [x for x in branch if x in content_elems]
+        runs = [list(y) for _, y in groupby(elems, key=file_elem_key)]
+
+        for run in (x for x in runs if len(x) > 1 and x[0].tag in _MERGEABLE_TAGS):
+            if run[0].tag in {Tags.TEXT, Tags.TEXT_MATH}:
+                run[0].text = "".join(x.text or "" for x in run)
+            for elem in run[1:]:
+                for e in elem:
+                    run[0].append(e)
+                branch.remove(elem)
+
+        stack += reversed([x for x in branch if x in content_elems])
@@ -0,0 +1,107 @@
+"""Reuse work on zip members that are identical across docx files.
+
+:author: Shay Hill
+:created: 2023-07-03
+
+Documents created from the same template often hold byte-identical headers,
+footers, and ``word/numbering.xml``. The zip directory gives the CRC32 and size of
+every member without decompressing it, so identical members can be found before
+they are read.
+
+``PART_CACHE`` is one bounded (least recently used) cache per process. DocxReader
+consults it before reading
+
+    * ``word/numbering.xml``: the numbering model is kept by (CRC32, size).
+    * headers and footers (``SHARED_PART_TYPES``): extracted content is kept by the
+      (CRC32, size) of the file, of its rels file, and of ``word/numbering.xml``,
+      plus ``DocxReader.content_options``.
+
+The cache holds its own copy of extracted content, and each DocxReader that takes
+content from the cache gets a new copy, so altering ``File.content`` of one
+DocxReader does not alter content of another. Content is not cached if a tag
+handler has been registered (see ``docx_text.has_builtin_handlers_only``) or if
+the xml of a file has been exposed. To disable the cache, set
+``PART_CACHE.maxsize = 0``.
+"""
+
+from __future__ import annotations
+
+import threading
+import zipfile
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+from .stats import CacheStats
+
+# content file types that are often identical across documents
+SHARED_PART_TYPES = frozenset({"header", "footer"})
+
+
+def get_member_key(zipf: zipfile.ZipFile, path: str) -> Optional[Tuple[int, int]]:
+    """Identify a zip member by its content without reading it.
+
+    :param zipf: open zip archive
+    :param path: path of the member in the archive
+    :return: (CRC32, uncompressed size) from the zip directory or None if there is
+        no member at path
+    """
+    try:
+        info = zipf.getinfo(path)
+    except KeyError:
+        return None
+    return info.CRC, info.file_size
+
+
+class PartCache:
+    """A bounded, thread-safe, least-recently-used mapping."""
+
+    def __init__(self, maxsize: int = 512) -> None:
+        """Create an empty cache.
+
+        :param maxsize: keep at most this many values. 0 to keep none.
+        """
+        self.maxsize = maxsize
+        self.stats = CacheStats()
+        self._values: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of values held.
+
+        :return: number of values held
+        """
+        return len(self._values)
+
+    def get(self, key: Hashable) -> Any:
+        """Get a value. Mark it as recently used.
+
+        :param key: key of the value
+        :return: value or None if key is not in the cache
+        """
+        with self._lock:
+            value = self._values.get(key)
+            if value is None:
+                self.stats.misses += 1
+                return None
+            self.stats.hits += 1
+            self._values.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Add a value. Forget the least recently used values if necessary.
+
+        :param key: key of the value
+        :param value: anything but None
+        """
+        with self._lock:
+            self._values[key] = value
+            while len(self._values) > self.maxsize:
+                _ = self._values.popitem(last=False)
+
+    def clear(self) -> None:
+        """Forget every value."""
+        with self._lock:
+            self._values.clear()
+
+
+PART_CACHE = PartCache()
@@ -0,0 +1,239 @@
+"""Optional timing and counters for each phase of reading a docx.
+
+:author: Shay Hill
+:created: 2023-07-03
+
+Pass a ``ReaderStats`` instance to ``DocxReader`` (or ``docx2python``) to record,
+for each file in the docx:
+
+    * ``seconds``: wall time per phase
+        * ``unzip``: read (decompress) the file from the zip archive
+        * ``parse``: parse the xml
+        * ``rels``: read and parse the file's rels
+        * ``numbering``: read and parse ``word/numbering.xml``
+        * ``extract``: extract content (``get_text``), including formatting
+        * ``merge``: merge elements in the xml (``File.merged_root_element``)
+        * ``images``: read an image from the zip archive
+    * ``compressed_bytes`` and ``decompressed_bytes`` read from the zip archive
+    * ``tags``: element count per tag (e.g., ``{"w:p": 12, "w:r": 40, ...}``)
+    * ``paragraphs`` and ``runs`` extracted
+
+and, for all files, hits and misses of each cache (e.g., ``formatting``, see
+``text_runs.FormattingCache``).
+
+::
+
+    stats = ReaderStats()
+    with docx2python("file.docx", stats=stats) as content:
+        _ = content.text
+    print(stats.as_dict())
+    for file_stats in stats.worst("extract", 3):
+        print(file_stats.path, file_stats.seconds["extract"])
+
+Optionally, ``ReaderStats(on_phase=callback)`` will call ``callback(path, phase,
+seconds)`` as each phase ends.
+
+With ``engine="sax"`` (see ``docx_sax``), content files are not parsed into trees.
+Their unzip and parse time is part of ``extract``, and their tags are not counted.
+
+If no ``ReaderStats`` instance is given (the default), nothing is timed or
+counted. Each instrumented phase checks ``DocxReader.stats is None`` once.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from lxml.etree import _Element as EtreeElement  # type: ignore
+
+from .iterators import TablesList, iter_at_depth
+from .namespace import NSMAP
+
+_URI2PREFIX = {f"{{{v}}}": f"{k}:" for k, v in NSMAP.items()}
+
+
+def _prefix_tag(tag: str) -> str:
+    """Replace a Clark-notation namespace with its NSMAP prefix.
+
+    :param tag: e.g., ``{http://schemas.openxmlformats.org/.../main}p``
+    :return: e.g., ``w:p``. Tags in unknown namespaces are returned unchanged.
+    """
+    uri, _, name = tag.rpartition("}")
+    prefix = _URI2PREFIX.get(uri + "}")
+    return tag if prefix is None else prefix + name
+
+
+@dataclass
+class FileStats:
+    """Timing and counters for one file in a docx.
+
+    :param path: path to the file in the docx (e.g., ``word/document.xml``)
+    :param seconds: phase names mapped to wall time
+    :param compressed_bytes: bytes read from the zip archive
+    :param decompressed_bytes: bytes after decompression
+    :param tags: element count per tag
+    :param paragraphs: paragraphs extracted
+    :param runs: runs extracted
+    """
+
+    path: str
+    seconds: Dict[str, float] = field(default_factory=dict)
+    compressed_bytes: int = 0
+    decompressed_bytes: int = 0
+    tags: Counter[str] = field(default_factory=Counter)
+    paragraphs: int = 0
+    runs: int = 0
+
+    def count_tags(self, root: EtreeElement) -> None:
+        """Count elements per tag in an xml tree.
+
+        :param root: root element of the file
+        """
+        tags = (x.tag for x in root.iter())
+        self.tags.update(_prefix_tag(x) for x in tags if isinstance(x, str))
+
+    def count_content(self, content: TablesList) -> None:
+        """Count paragraphs and runs in extracted content.
+
+        :param content: extracted content [[[[[str]]]]]
+        """
+        paragraphs = list(iter_at_depth(content, 4))
+        self.paragraphs += len(paragraphs)
+        self.runs += sum(len(x) for x in paragraphs)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Plain (json-serializable) dictionary of timing and counters.
+
+        :return: all fields as a dictionary
+        """
+        return {
+            "path": self.path,
+            "seconds": dict(self.seconds),
+            "compressed_bytes": self.compressed_bytes,
+            "decompressed_bytes": self.decompressed_bytes,
+            "tags": dict(self.tags),
+            "paragraphs": self.paragraphs,
+            "runs": self.runs,
+        }
+
+
+@dataclass
+class CacheStats:
+    """Hits and misses of one cache.
+
+    :param hits: lookups found in the cache
+    :param misses: lookups computed and added to the cache
+    """
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups found in the cache.
+
+        :return: hits / (hits + misses), 0 if there have been no lookups
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Plain (json-serializable) dictionary of counters.
+
+        :return: hits, misses, and hit_rate
+        """
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hit_rate}
+
+
+@dataclass
+class ReaderStats:
+    """Timing and counters for every file read by a DocxReader.
+
+    :param on_phase: optional callback ``(path, phase, seconds)`` called as each
+        phase ends
+    :param files: file paths mapped to FileStats, created as files are read
+    :param caches: cache names mapped to CacheStats, created as caches are used
+    """
+
+    on_phase: Optional[Callable[[str, str, float], None]] = None
+    files: Dict[str, FileStats] = field(default_factory=dict)
+    caches: Dict[str, CacheStats] = field(default_factory=dict)
+
+    def cache(self, name: str) -> CacheStats:
+        """Get (or create) stats for one cache.
+
+        :param name: name of the cache (e.g., ``formatting``)
+        :return: CacheStats instance for name
+        """
+        if name not in self.caches:
+            self.caches[name] = CacheStats()
+        return self.caches[name]
+
+    def file(self, path: str) -> FileStats:
+        """Get (or create) stats for one file.
+
+        :param path: path to the file in the docx
+        :return: FileStats instance for path
+        """
+        if path not in self.files:
+            self.files[path] = FileStats(path)
+        return self.files[path]
+
+    @contextmanager
+    def timer(self, path: str, phase: str) -> Iterator[FileStats]:
+        """Add the time spent in a with block to a phase.
+
+        :param path: path to the file in the docx
+        :param phase: name of the phase (e.g., ``parse``)
+        :return: FileStats instance for path (yielded) to record counters
+        """
+        file_stats = self.file(path)
+        start = time.perf_counter()
+        try:
+            yield file_stats
+        finally:
+            seconds = time.perf_counter() - start
+            file_stats.seconds[phase] = file_stats.seconds.get(phase, 0) + seconds
+            if self.on_phase is not None:
+                self.on_phase(path, phase, seconds)
+
+    def totals(self) -> Dict[str, float]:
+        """Wall time per phase for all files.
+
+        :return: phase names mapped to seconds
+        """
+        totals: Dict[str, float] = {}
+        for file_stats in self.files.values():
+            for phase, seconds in file_stats.seconds.items():
+                totals[phase] = totals.get(phase, 0) + seconds
+        return totals
+
+    def worst(self, phase: str | None = None, n: int = 5) -> List[FileStats]:
+        """Files that took the most time.
+
+        :param phase: optionally, only consider this phase
+        :param n: number of files to return
+        :return: up to n FileStats instances, slowest first
+        """
+
+        def get_seconds(file_stats: FileStats) -> float:
+            if phase is None:
+                return sum(file_stats.seconds.values())
+            return file_stats.seconds.get(phase, 0)
+
+        return sorted(self.files.values(), key=get_seconds, reverse=True)[:n]
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Plain (json-serializable) dictionary of timing and counters.
+
+        :return: phase totals, stats for every file, and stats for every cache
+        """
+        return {
+            "seconds": self.totals(),
+            "files": [x.as_dict() for x in self.files.values()],
+            "caches": {k: v.as_dict() for k, v in self.caches.items()},
+        }
@@ -9,14 +9,18 @@ those elements to extract formatting information.
 from __future__ import annotations
 
 import re
-from collections import defaultdict
-from contextlib import suppress
-from typing import Sequence, Tuple, Union
+from collections import OrderedDict, defaultdict
+from typing import Any, Sequence, Tuple, Union
 
 from lxml.etree import _Element as EtreeElement  # type: ignore
 
 from .attribute_register import HtmlFormatter, Tags
 from .namespace import qn
+from .stats import CacheStats
+
+_W_VAL = qn("w:val")
+_W_PPR = qn("w:pPr")
+_W_PSTYLE = qn("w:pStyle")
 
 
 def _elem_tag_str(elem: EtreeElement) -> str:
@@ -94,13 +98,15 @@ def _gather_sub_vals(element: EtreeElement, qname: str) -> dict[str, str | None]
     """
 
     sub_vals: dict[str, str | None] = {}
-    with suppress(StopIteration):
-        for sub_element in next(element.iterfind(qname)):
-            sub_val = sub_element.attrib.get(qn("w:val"))
-            if sub_val:
-                sub_vals[_elem_tag_str(sub_element)] = str(sub_val)
-            else:
-                sub_vals[_elem_tag_str(sub_element)] = None
+    Pr = element.find(qname)
+    if Pr is None:
+        return sub_vals
+    for sub_element in Pr:
+        sub_val = sub_element.attrib.get(_W_VAL)
+        if sub_val:
+            sub_vals[_elem_tag_str(sub_element)] = str(sub_val)
+        else:
+            sub_vals[_elem_tag_str(sub_element)] = None
     return sub_vals
 
 
@@ -123,6 +129,35 @@ def gather_Pr(element: EtreeElement) -> dict[str, str | None]:
     return _gather_sub_vals(element, element.tag + "Pr")
 
 
+def get_pPr(paragraph_element: EtreeElement) -> EtreeElement | None:
+    """
+    Find the paragraph-properties element of a paragraph.
+
+    :param paragraph_element: a ``<w:p>`` xml element
+    :return: the first ``<w:pPr>`` child or None if there is none
+
+    Paragraph style, numbering, and html formatting are all read from this element.
+    Find it once per paragraph and pass it to ``get_pPr_style`` and
+    ``BulletGenerator.get_pPr_bullet``.
+    """
+    return paragraph_element.find(_W_PPR)
+
+
+def get_pPr_style(pPr: EtreeElement | None) -> str:
+    """
+    Get the pStyle value from a paragraph-properties element.
+
+    :param pPr: a ``<w:pPr>`` xml element or None
+    :return: pStyle value or "" if there is no pPr, pStyle, or value
+    """
+    if pPr is None:
+        return ""
+    pStyle = pPr.find(_W_PSTYLE)
+    if pStyle is None:
+        return ""
+    return str(pStyle.attrib.get(_W_VAL) or "")
+
+
 def get_pStyle(paragraph_element: EtreeElement) -> str:
     """
     Collect and format paragraph -> pPr -> pStyle value.
@@ -133,7 +168,7 @@ def get_pStyle(paragraph_element: EtreeElement) -> str:
 
     Also see docstring for ``gather_pPr``
     """
-    return gather_Pr(paragraph_element).get("pStyle", "") or ""
+    return get_pPr_style(get_pPr(paragraph_element))
 
 
 def get_run_formatting(
@@ -165,8 +200,83 @@ def get_run_formatting(
     return _format_Pr_into_html(gather_Pr(run_element), xml2html)
 
 
+class FormattingCache:
+    """Html formatting of runs, keyed by a signature of their run properties.
+
+    ``get_run_formatting`` gathers and formats the rPr of every run, but a
+    document with thousands of runs typically has only a few dozen distinct rPr
+    elements. The signature of a run is a tuple of the (tag, w:val) of each rPr
+    child, the only values ``gather_Pr`` reads. Two runs with the same signature
+    have the same formatting.
+
+    One cache is shared by every file in a DocxReader, so formatting computed to
+    merge runs (``merge_runs._elem_key``) is found again when the same runs are
+    extracted. The cache holds formatting for one xml2html mapping at a time, and
+    is cleared if called with another.
+    """
+
+    def __init__(self, maxsize: int = 1024, stats: CacheStats | None = None):
+        """Create an empty cache.
+
+        :param maxsize: keep at most this many signatures. Forget the least
+            recently used.
+        :param stats: optionally count hits and misses here (e.g., a
+            ``ReaderStats.cache`` instance). Counted in a new CacheStats if not
+            given.
+        """
+        self.maxsize = maxsize
+        self.stats = CacheStats() if stats is None else stats
+        self._xml2html: dict[str, HtmlFormatter] | None = None
+        self._formatting: OrderedDict[tuple[Any, ...], tuple[str, ...]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        """Number of signatures held.
+
+        :return: number of signatures held
+        """
+        return len(self._formatting)
+
+    def get_run_formatting(
+        self, run_element: EtreeElement, xml2html: dict[str, HtmlFormatter]
+    ) -> list[str]:
+        """The same value as ``get_run_formatting``, computed once per signature.
+
+        :param run_element: a ``<w:r>`` xml element
+        :param xml2html: mapping to convert xml styles to html styles
+        :return: ``['b', 'i', ...]`` (a new list)
+        """
+        if not xml2html:
+            return []
+        if xml2html is not self._xml2html:
+            self._formatting.clear()
+            self._xml2html = xml2html
+
+        rPr = run_element.find(Tags.RUN_PROPERTIES)
+        if rPr is None:
+            signature: tuple[Any, ...] = ()
+        else:
+            signature = tuple((x.tag, x.get(_W_VAL)) for x in rPr)
+
+        formatting = self._formatting.get(signature)
+        if formatting is not None:
+            self.stats.hits += 1
+            self._formatting.move_to_end(signature)
+            return list(formatting)
+
+        self.stats.misses += 1
+        formatting = tuple(get_run_formatting(run_element, xml2html))
+        self._formatting[signature] = formatting
+        if len(self._formatting) > self.maxsize:
+            _ = self._formatting.popitem(last=False)
+        return list(formatting)
+
+
 def get_paragraph_formatting(
-    paragraph_element: EtreeElement, xml2html: dict[str, HtmlFormatter]
+    paragraph_element: EtreeElement,
+    xml2html: dict[str, HtmlFormatter],
+    pStyle: str | None = None,
 ) -> list[str]:
     """
     Get paragraph-element formatting converted into html.
@@ -182,6 +292,8 @@ def get_paragraph_formatting(
             'b': (<function <lambda> at 0x0000026BC7875A60>,),
             'smallCaps': (<function <lambda> at 0x0000026BC7896DC0>, 'font', 'style')
         }
+    :param pStyle: optionally, the pStyle of paragraph_element if it has already
+        been read (see ``get_pPr_style``)
 
     :return: ``['b', 'i', ...]``
 
@@ -191,7 +303,11 @@ def get_paragraph_formatting(
 
     Also see docstring for ``gather_rPr``
     """
-    return _format_Pr_into_html({get_pStyle(paragraph_element): None}, xml2html)
+    if not xml2html:
+        return []
+    if pStyle is None:
+        pStyle = get_pStyle(paragraph_element)
+    return _format_Pr_into_html({pStyle: None}, xml2html)
 
 
 def _format_Pr_into_html(
@@ -45,15 +45,15 @@ def replace_root_text(root: EtreeElement, old: str, new: str) -> None:
 
     Will use softbreaks <br> to preserve line breaks in replacement text.
     """
-
-    def recursive_text_replace(branch: EtreeElement):
-        """Replace any text element contining old with one or more elements.
-
-        :param branch: an etree element
-        """
+    # replace any text element containing old with one or more elements. Walk the
+    # tree with an explicit stack so deeply nested xml will not exceed the
+    # recursion limit.
+    stack = [root]
+    while stack:
+        branch = stack.pop()
         for elem in tuple(branch):
             if not elem.text or old not in elem.text:
-                recursive_text_replace(elem)
+                stack.append(elem)
                 continue
 
             # create a new text element for each line in replacement text
@@ -70,8 +70,6 @@ def replace_root_text(root: EtreeElement, old: str, new: str) -> None:
             index = parent.index(elem)
             parent[index : index + 1] = new_elems
 
-    recursive_text_replace(root)
-
 
 def replace_docx_text(
     path_in: Path | str,
@@ -88,7 +86,7 @@ def replace_docx_text(
     """
     reader = docx2python(path_in, html=html).docx_reader
     for file in reader.content_files():
-        root = file.root_element
+        root = file.merged_root_element
         for replacement in replacements:
             replace_root_text(root, *replacement)
     reader.save(path_out)
@@ -0,0 +1,66 @@
+"""One configured lxml parser (per thread) for every xml file in a docx.
+
+:author: Shay Hill
+:created: 2023-07-03
+
+``etree.fromstring`` without a parser uses a default parser that keeps comments and
+processing instructions (which docx2python never uses), resolves internal entities,
+collects ids, and refuses very large text nodes and very deep trees. Parse with
+``parse_xml`` instead.
+
+lxml parsers can be reused, but not shared between threads, so each thread keeps one
+parser for each setting of ``huge_tree``.
+
+``huge_tree=True`` lifts libxml2's safety limits on text-node size and tree depth.
+Only use it for files you trust.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict
+
+from lxml import etree
+from lxml.etree import _Element as EtreeElement  # type: ignore
+
+_LOCAL = threading.local()
+
+
+def get_parser_options(huge_tree: bool = False) -> Dict[str, Any]:
+    """Keyword arguments for an lxml parser configured for docx extraction.
+
+    :param huge_tree: lift libxml2 limits on text-node size and tree depth
+    :return: keyword arguments for ``etree.XMLParser`` (and, except for
+        ``collect_ids``, ``etree.iterparse``)
+    """
+    return {
+        "remove_comments": True,
+        "remove_pis": True,
+        "resolve_entities": False,
+        "huge_tree": huge_tree,
+        "collect_ids": False,
+    }
+
+
+def get_parser(huge_tree: bool = False) -> etree.XMLParser:
+    """The parser for this thread.
+
+    :param huge_tree: lift libxml2 limits on text-node size and tree depth
+    :return: an XMLParser created once per thread (and per huge_tree)
+    """
+    parsers: Dict[bool, etree.XMLParser] | None = getattr(_LOCAL, "parsers", None)
+    if parsers is None:
+        parsers = _LOCAL.parsers = {}
+    if huge_tree not in parsers:
+        parsers[huge_tree] = etree.XMLParser(**get_parser_options(huge_tree))
+    return parsers[huge_tree]
+
+
+def parse_xml(xml: bytes, huge_tree: bool = False) -> EtreeElement:
+    """Parse an xml file from a docx.
+
+    :param xml: xml file content
+    :param huge_tree: lift libxml2 limits on text-node size and tree depth
+    :return: root element
+    """
+    return etree.fromstring(xml, get_parser(huge_tree))
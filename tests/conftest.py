@@ -8,10 +8,23 @@
 import os
 import sys
 from pathlib import Path
+from typing import Iterator
+
+import pytest
 
 project = os.path.abspath(os.path.join(__file__, "..", ".."))
 sys.path.append(project)
 
+from docx2python.part_cache import PART_CACHE  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def clear_part_cache() -> Iterator[None]:
+    """Do not share headers, footers, or numbering between tests."""
+    PART_CACHE.clear()
+    yield
+    PART_CACHE.clear()
+
 
 def pytest_assertrepr_compare(config, op, left, right):
     """See full error diffs"""
@@ -0,0 +1,77 @@
+"""Test extracting many files in a process pool.
+
+:author: Shay Hill
+:created: 2023-07-03
+"""
+
+import pickle
+
+import pytest
+
+from docx2python import docx2python, docx2python_many
+
+from .conftest import RESOURCES
+
+FILES = [
+    RESOURCES / "example.docx",
+    RESOURCES / "hyperlink.docx",
+    RESOURCES / "merged_cells.docx",
+    RESOURCES / "libreoffice_conversion.docx",
+]
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_matches_docx2python(ordered: bool) -> None:
+    """Results match docx2python results for each file."""
+    results = list(docx2python_many(FILES, html=True, max_workers=2, ordered=ordered))
+    assert sorted(x.index for x in results) == list(range(len(FILES)))
+    for result in results:
+        assert result.error is None
+        with docx2python(FILES[result.index], html=True) as content:
+            assert result.source == str(FILES[result.index])
+            assert result.body_runs == content.body_runs
+            assert result.header_runs == content.header_runs
+            assert result.text == content.text
+            assert result.images == {k: len(v) for k, v in content.images.items()}
+
+
+def test_ordered() -> None:
+    """Results are yielded in input order by default."""
+    files = FILES * 3
+    results = docx2python_many(files, max_workers=2)
+    assert [x.index for x in results] == list(range(len(files)))
+
+
+def test_bytes() -> None:
+    """Accept docx file bytes."""
+    docx_bytes = (RESOURCES / "example.docx").read_bytes()
+    (result,) = docx2python_many([docx_bytes], max_workers=1)
+    assert result.source is None
+    with docx2python(RESOURCES / "example.docx") as content:
+        assert result.text == content.text
+
+
+def test_error_recorded() -> None:
+    """A file that cannot be read does not stop the batch."""
+    files = [RESOURCES / "example.docx", RESOURCES / "no_such_file.docx"]
+    results = list(docx2python_many(files, max_workers=1))
+    assert results[0].error is None
+    assert results[1].error is not None
+    assert results[1].error.startswith("FileNotFoundError")
+
+
+def test_picklable() -> None:
+    """Results can be pickled."""
+    (result,) = docx2python_many([RESOURCES / "example.docx"], max_workers=1)
+    assert pickle.loads(pickle.dumps(result)) == result
+
+
+def test_flat() -> None:
+    """Return runs in one FlatContent instance."""
+    (result,) = docx2python_many(FILES[:1], max_workers=1, flat=True)
+    assert result.body_runs == []
+    assert result.flat is not None
+    with docx2python(FILES[0]) as content:
+        assert result.document_runs == content.document_runs
+        assert result.flat.get_part("officeDocument") == content.body_runs
+        assert result.text == content.text
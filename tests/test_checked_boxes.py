@@ -21,7 +21,12 @@ parsing through forms that have all of their stuff in tables.
 '''
 """
 
+from typing import Optional
+
+import pytest
+
 from docx2python import docx2python
+from docx2python.forms import get_checkBox_entry_from_vals
 from docx2python.iterators import iter_at_depth
 
 from .conftest import RESOURCES
@@ -98,3 +103,21 @@ def test_unchecked_boxes() -> None:
     assert all_text.count("\u2612") == 12
     assert all_text.count("\u2610") == 32
     pars.close()
+
+
+@pytest.mark.parametrize(
+    "checked, default, expect",
+    [
+        ("", "0", "\u2612"),
+        ("0", "1", "\u2610"),
+        ("1", None, "\u2612"),
+        (None, "1", "\u2612"),
+        (None, "0", "\u2610"),
+        (None, None, "----checkbox failed----"),
+    ],
+)
+def test_checkBox_entry_from_vals(
+    checked: Optional[str], default: Optional[str], expect: str
+) -> None:
+    """A w:checked element without a w:val is checked. Fall back to w:default."""
+    assert get_checkBox_entry_from_vals(checked, default) == expect
@@ -0,0 +1,90 @@
+"""Test the command-line extractor.
+
+:author: Shay Hill
+:created: 2023-07-03
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from docx2python import docx2python
+from docx2python.cli import iter_docx_paths, main
+
+from .conftest import RESOURCES
+
+
+def _read_lines(path: Path) -> list:
+    """Read JSON lines.
+
+    :param path: path to a JSON lines file
+    :return: list of records
+    """
+    with path.open(encoding="utf-8") as lines:
+        return [json.loads(x) for x in lines]
+
+
+def test_iter_docx_paths() -> None:
+    """Find files by path, folder, and glob."""
+    example = str(RESOURCES / "example.docx")
+    assert list(iter_docx_paths([example])) == [RESOURCES / "example.docx"]
+    in_folder = list(iter_docx_paths([str(RESOURCES)]))
+    assert RESOURCES / "example.docx" in in_folder
+    assert all(x.suffix == ".docx" for x in in_folder)
+    globbed = list(iter_docx_paths([str(RESOURCES / "hyper*.docx")]))
+    assert globbed == [RESOURCES / "hyperlink.docx"]
+
+
+def test_text(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """Write text by default. Write a summary to stderr."""
+    output = tmp_path / "out.jsonl"
+    example = str(RESOURCES / "example.docx")
+    assert main([example, "-o", str(output)]) == 0
+    (record,) = _read_lines(output)
+    with docx2python(example) as content:
+        assert record["text"] == content.text
+    assert "runs" not in record
+    assert "1 documents (0 errors)" in capsys.readouterr().err
+
+
+def test_selected_outputs(tmp_path: Path) -> None:
+    """Write selected outputs in input order."""
+    output = tmp_path / "out.jsonl"
+    files = [str(RESOURCES / "hyperlink.docx"), str(RESOURCES / "example.docx")]
+    args = [*files, "-o", str(output), "--runs", "--html", "-j", "2", "-q"]
+    assert main(args + ["--images", str(tmp_path / "images")]) == 0
+    records = _read_lines(output)
+    assert [x["source"] for x in records] == files
+    for record in records:
+        assert "text" not in record
+        with docx2python(record["source"], html=True) as content:
+            assert record["runs"]["body"] == content.body_runs
+            assert record["images"] == {k: len(v) for k, v in content.images.items()}
+    image_folder = Path(records[1]["image_folder"])
+    assert sorted(x.name for x in image_folder.iterdir()) == sorted(
+        records[1]["images"]
+    )
+
+
+def test_error_record(tmp_path: Path) -> None:
+    """Write an error record for a file that cannot be extracted."""
+    output = tmp_path / "out.jsonl"
+    not_docx = tmp_path / "not_docx.docx"
+    _ = not_docx.write_text("not a zip file")
+    assert main([str(not_docx), "-o", str(output), "-q"]) == 1
+    (record,) = _read_lines(output)
+    assert record["error"].startswith("BadZipFile")
+
+
+def test_unknown_part(capsys: pytest.CaptureFixture[str]) -> None:
+    """Exit with a usage error (status 2) for an unknown part."""
+    with pytest.raises(SystemExit) as exc_info:
+        _ = main([str(RESOURCES / "example.docx"), "--parts", "body", "bogus"])
+    assert exc_info.value.code == 2
+    assert "error: argument --parts: unknown parts ['bogus']" in capsys.readouterr().err
+
+
+def test_no_files(tmp_path: Path) -> None:
+    """Exit status 2 if no files are found."""
+    assert main([str(tmp_path / "*.docx"), "-q"]) == 2
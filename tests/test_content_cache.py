@@ -0,0 +1,91 @@
+"""Test caching of extracted content.
+
+:author: Shay Hill
+:created: 2023-07-03
+
+Each content file is extracted once for each set of reader options. DocxContent
+properties derived from that content are built once, but each call returns a new
+list.
+"""
+
+from docx2python.attribute_register import Tags
+from docx2python.docx_reader import DocxReader
+from docx2python.iterators import iter_at_depth
+from docx2python.main import docx2python
+
+from .conftest import RESOURCES
+
+
+class TestFileContent:
+    def test_extracted_once(self) -> None:
+        """Return the same list for the same options."""
+        with DocxReader(RESOURCES / "example.docx") as reader:
+            file = reader.file_of_type("officeDocument")
+            assert file.content is file.content
+
+    def test_new_options(self) -> None:
+        """Extract again when options change."""
+        with DocxReader(RESOURCES / "example.docx") as reader:
+            file = reader.file_of_type("officeDocument")
+            plain = file.content
+            reader.xml2html_format = DocxReader(
+                RESOURCES / "example.docx", html=True
+            ).xml2html_format
+            assert file.content != plain
+            reader.xml2html_format = {}
+            assert file.content is plain
+
+    def test_edited_root_element(self) -> None:
+        """Content reflects edits to root_element."""
+        with DocxReader(RESOURCES / "example.docx") as reader:
+            file = reader.file_of_type("officeDocument")
+            _ = file.content
+            text = next(x for x in file.root_element.iter(Tags.TEXT) if x.text)
+            text.text = "edited"
+            assert "edited" in iter_at_depth(file.content, 5)
+
+    def test_close_clears_cache(self) -> None:
+        """Forget extracted content when the reader is closed."""
+        reader = DocxReader(RESOURCES / "example.docx")
+        file = reader.file_of_type("officeDocument")
+        before = file.content
+        reader.close()
+        assert file._File__content == {}  # type: ignore
+        assert before
+
+
+class TestDocxContentCache:
+    def test_runs_are_copies(self) -> None:
+        """Altering a returned list does not alter the next."""
+        with docx2python(RESOURCES / "example.docx") as content:
+            runs = content.body_runs
+            runs[0][0][0][0].append("appended")
+            runs[0].append([])
+            assert content.body_runs != runs
+
+    def test_paragraphs_are_copies(self) -> None:
+        """Altering returned paragraphs does not alter the next."""
+        with docx2python(RESOURCES / "example.docx") as content:
+            body = content.body
+            body[0][0][0][0] = "altered"
+            assert content.body != body
+
+    def test_cached_views_match_runs(self) -> None:
+        """Cached views are the same as views built from runs."""
+        with docx2python(RESOURCES / "example.docx") as content:
+            for _ in range(2):
+                joined = [
+                    [[["".join(par) for par in cell] for cell in row] for row in tbl]
+                    for tbl in content.body_runs
+                ]
+                assert content.body == joined
+
+    def test_text_follows_options(self) -> None:
+        """Text is rebuilt when reader options change."""
+        with docx2python(RESOURCES / "example.docx") as content:
+            plain = content.text
+            assert content.text is plain
+            content.docx_reader.xml2html_format = DocxReader(
+                RESOURCES / "example.docx", html=True
+            ).xml2html_format
+            assert content.text != plain
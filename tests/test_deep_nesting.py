@@ -0,0 +1,170 @@
+"""Test pathologically deep documents.
+
+:author: Shay Hill
+:created: 2023-07-03
+
+Machine-generated documents may nest tables in tables (or text boxes in text boxes)
+thousands of levels deep. Walking these must not exceed the recursion limit.
+
+libxml2 will not parse xml this deep (the limit is 256 levels, or 2048 with
+``huge_tree=True``), so these trees are built with SubElement.
+"""
+
+import sys
+from typing import Callable
+
+import pytest
+from lxml import etree
+from lxml.etree import _Element as EtreeElement  # type: ignore
+
+from docx2python.attribute_register import Tags, has_content
+from docx2python.docx_reader import DocxReader
+from docx2python.docx_text import get_text
+from docx2python.iterators import iter_at_depth
+from docx2python.merge_runs import merge_elems
+from docx2python.namespace import qn
+from docx2python.utilities import replace_root_text
+
+from .conftest import RESOURCES
+
+# about 3000 levels each
+TABLE_DEPTH = 1000
+BOX_DEPTH = 500
+
+
+def _add_paragraph(parent: EtreeElement, text: str) -> EtreeElement:
+    """Add a paragraph with two mergeable runs.
+
+    :param parent: element to hold the paragraph
+    :param text: text of the paragraph (split between two runs)
+    :return: the new paragraph element
+    """
+    paragraph = etree.SubElement(parent, Tags.PARAGRAPH)
+    for half in (text[: len(text) // 2], text[len(text) // 2 :]):
+        run = etree.SubElement(paragraph, Tags.RUN)
+        etree.SubElement(run, Tags.TEXT).text = half
+    return paragraph
+
+
+def nested_tables(depth: int) -> EtreeElement:
+    """A document with ``depth`` tables, each in a cell of the one before.
+
+    :param depth: number of nested tables (three levels each)
+    :return: document element
+    """
+    root = etree.Element(Tags.DOCUMENT)
+    parent = etree.SubElement(root, Tags.BODY)
+    for i in range(depth):
+        table = etree.SubElement(parent, Tags.TABLE)
+        row = etree.SubElement(table, Tags.TABLE_ROW)
+        parent = etree.SubElement(row, Tags.TABLE_CELL)
+        _ = _add_paragraph(parent, f"table {i}")
+    return root
+
+
+def nested_text_boxes(depth: int) -> EtreeElement:
+    """A document with ``depth`` text boxes, each in a paragraph in the one before.
+
+    :param depth: number of nested text boxes (six levels each)
+    :return: document element
+    """
+    root = etree.Element(Tags.DOCUMENT)
+    parent = etree.SubElement(root, Tags.BODY)
+    for i in range(depth):
+        paragraph = _add_paragraph(parent, f"box {i}")
+        run = etree.SubElement(paragraph, Tags.RUN)
+        pict = etree.SubElement(run, qn("w:pict"))
+        shape = etree.SubElement(pict, qn("v:shape"))
+        textbox = etree.SubElement(shape, qn("v:textbox"))
+        parent = etree.SubElement(textbox, qn("w:txbxContent"))
+    return root
+
+
+def _get_paragraphs(root: EtreeElement) -> list:
+    """Extract paragraphs with example.docx as context.
+
+    :param root: element to extract
+    :return: joined paragraphs
+    """
+    with DocxReader(RESOURCES / "example.docx") as reader:
+        file = reader.file_of_type("officeDocument")
+        return ["".join(x) for x in iter_at_depth(get_text(file, root), 4)]
+
+
+def _get_height(root: EtreeElement) -> int:
+    """Number of levels in a tree.
+
+    :param root: root element
+    :return: 1 + the number of ancestors of the deepest element
+    """
+    heights = {root: 1}
+    for elem in root.iter():
+        parent = elem.getparent()
+        if parent is not None:
+            heights[elem] = heights[parent] + 1
+    return max(heights.values())
+
+
+@pytest.mark.parametrize(
+    "build, depth, label",
+    [(nested_tables, TABLE_DEPTH, "table"), (nested_text_boxes, BOX_DEPTH, "box")],
+)
+class TestDeepNesting:
+    def test_deeper_than_recursion_limit(
+        self, build: Callable[[int], EtreeElement], depth: int, label: str
+    ) -> None:
+        """Test trees are deeper than the recursion limit."""
+        assert _get_height(build(depth)) > sys.getrecursionlimit()
+
+    def test_get_text(
+        self, build: Callable[[int], EtreeElement], depth: int, label: str
+    ) -> None:
+        """Extract every paragraph.
+
+        Nested paragraphs (in text boxes) are extracted when they close, so these
+        are extracted deepest first.
+        """
+        paragraphs = [x for x in _get_paragraphs(build(depth)) if x]
+        expect = [f"{label} {i}" for i in range(depth)]
+        if label == "box":
+            expect.reverse()
+        assert paragraphs == expect
+
+    def test_merge_elems(
+        self, build: Callable[[int], EtreeElement], depth: int, label: str
+    ) -> None:
+        """Merge runs at every level. Extract the same text."""
+        root = build(depth)
+        with DocxReader(RESOURCES / "example.docx") as reader:
+            merge_elems(reader.file_of_type("officeDocument"), root)
+        texts = root.iter(Tags.TEXT)
+        assert [x.text for x in texts] == [f"{label} {i}" for i in range(depth)]
+
+    def test_has_content(
+        self, build: Callable[[int], EtreeElement], depth: int, label: str
+    ) -> None:
+        """Find content at the bottom of the tree. Find no content without it."""
+        root = build(depth)
+        for elem in root.iter():
+            if elem.tag not in {Tags.DOCUMENT, Tags.BODY, Tags.TEXT}:
+                elem.tag = qn("w:sdt")  # not a content tag
+        assert has_content(root[0][0]) == Tags.TEXT
+        for text in list(root.iter(Tags.TEXT)):
+            text.getparent().remove(text)
+        assert has_content(root[0][0]) is None
+
+    def test_replace_root_text(
+        self, build: Callable[[int], EtreeElement], depth: int, label: str
+    ) -> None:
+        """Replace text at every level."""
+        root = build(depth)
+        replace_root_text(root, label, "replaced")
+        assert not any(label in (x.text or "") for x in root.iter(Tags.TEXT))
+
+
+def test_three_times_recursion_limit() -> None:
+    """Extract a tree three times as deep as the recursion limit, whatever it is."""
+    depth = sys.getrecursionlimit()
+    paragraphs = [x for x in _get_paragraphs(nested_tables(depth)) if x]
+    assert len(paragraphs) == depth
+    assert paragraphs[-1] == f"table {depth - 1}"
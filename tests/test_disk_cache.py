@@ -0,0 +1,181 @@
+"""Test the on-disk extraction cache.
+
+:author: Shay Hill
+:created: 2023-07-03
+"""
+
+import os
+from io import BytesIO
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+import pytest
+from lxml.etree import _Element as EtreeElement  # type: ignore
+
+from docx2python import attribute_register, docx2python, docx2python_many
+from docx2python.attribute_register import XML2HTML_FORMATTER, HtmlFormatter
+from docx2python.disk_cache import DiskCache, StoredContent
+from docx2python.docx_text import TAG_HANDLERS, TextContext, register_tag_handler
+from docx2python.namespace import qn
+from docx2python.stats import ReaderStats
+
+from .conftest import RESOURCES
+
+EXAMPLE = RESOURCES / "example.docx"
+
+
+@pytest.fixture()
+def restore_handlers() -> Iterator[None]:
+    """Remove any tag handlers and formatters registered in a test."""
+    handlers = dict(TAG_HANDLERS)
+    content_tags = set(attribute_register._CONTENT_TAGS)
+    formatters = dict(XML2HTML_FORMATTER)
+    yield
+    TAG_HANDLERS.clear()
+    TAG_HANDLERS.update(handlers)
+    attribute_register._CONTENT_TAGS.clear()
+    attribute_register._CONTENT_TAGS.update(content_tags)
+    XML2HTML_FORMATTER.clear()
+    XML2HTML_FORMATTER.update(formatters)
+
+
+def _get_outputs(path: Path, **kwargs: object) -> dict:
+    """Everything a cache hit should return.
+
+    :param path: path to a docx file
+    :param kwargs: keyword arguments for docx2python
+    :return: DocxContent properties by name
+    """
+    with docx2python(path, **kwargs) as content:  # type: ignore
+        return {
+            "text": content.text,
+            "document_runs": content.document_runs,
+            "body": content.body,
+            "footnotes": content.footnotes,
+            "core_properties": content.core_properties,
+            "image_sizes": content.image_sizes,
+            "paragraphs": list(content.iter_paragraphs()),
+        }
+
+
+@pytest.mark.parametrize("html", [False, True])
+@pytest.mark.parametrize("paragraph_styles", [False, True])
+def test_hit_returns_same_content(
+    tmp_path: Path, html: bool, paragraph_styles: bool
+) -> None:
+    """Return the same content from a miss and a hit."""
+    kwargs = {"html": html, "paragraph_styles": paragraph_styles}
+    expect = _get_outputs(EXAMPLE, **kwargs)
+    assert _get_outputs(EXAMPLE, cache=tmp_path, **kwargs) == expect
+    assert len(list(tmp_path.iterdir())) == 1
+    assert _get_outputs(EXAMPLE, cache=tmp_path, **kwargs) == expect
+
+
+def test_hit_does_not_open_zip(tmp_path: Path) -> None:
+    """Read a hit from the cache file alone."""
+    stats = ReaderStats()
+    with docx2python(EXAMPLE, cache=tmp_path, stats=stats) as content:
+        expect = content.text
+    with docx2python(EXAMPLE, cache=tmp_path, stats=stats) as content:
+        assert content.text == expect
+        assert content.header_runs
+        assert content.core_properties
+        assert content.docx_reader._DocxReader__zipf is None  # type: ignore
+    assert (stats.caches["disk"].misses, stats.caches["disk"].hits) == (1, 1)
+
+
+def test_images_from_zip(tmp_path: Path) -> None:
+    """Read image bytes from the zip archive after a hit."""
+    _ = docx2python(EXAMPLE, cache=tmp_path).text
+    with docx2python(EXAMPLE, cache=tmp_path) as content:
+        images = content.images
+        assert {k: len(v) for k, v in images.items()} == content.image_sizes
+
+
+def test_options_in_key(tmp_path: Path) -> None:
+    """Keep separate content for each set of options and each docx."""
+    _ = docx2python(EXAMPLE, cache=tmp_path)
+    _ = docx2python(EXAMPLE, cache=tmp_path, html=True)
+    _ = docx2python(EXAMPLE, cache=tmp_path, parts={"body"})
+    _ = docx2python(RESOURCES / "hyperlink.docx", cache=tmp_path)
+    assert len(list(tmp_path.iterdir())) == 4
+    with docx2python(EXAMPLE, cache=tmp_path, parts={"body"}) as content:
+        assert content.header == []
+        assert set(content.stored.parts) == {"officeDocument"}  # type: ignore
+
+
+def test_bytes(tmp_path: Path) -> None:
+    """Key docx bytes the same as a docx file."""
+    _ = docx2python(EXAMPLE, cache=tmp_path)
+    stats = ReaderStats()
+    docx = BytesIO(EXAMPLE.read_bytes())
+    with docx2python(docx, cache=DiskCache(tmp_path), stats=stats) as content:
+        assert content.text
+    assert stats.caches["disk"].hits == 1
+
+
+def test_corrupt_file(tmp_path: Path) -> None:
+    """Treat an unreadable file as a miss. Replace it."""
+    expect = docx2python(EXAMPLE, cache=tmp_path).text
+    (cached,) = tmp_path.iterdir()
+    _ = cached.write_bytes(b"not zlib")
+    assert docx2python(EXAMPLE, cache=tmp_path).text == expect
+    assert StoredContent.from_bytes(cached.read_bytes())
+
+
+def test_evict_least_recently_used(tmp_path: Path) -> None:
+    """Delete the oldest files once the cache is too large."""
+    cache = DiskCache(tmp_path, max_bytes=0)
+    _ = docx2python(EXAMPLE, cache=cache)
+    assert list(tmp_path.iterdir()) == []
+
+    cache = DiskCache(tmp_path)
+    keys = [cache.get_key(EXAMPLE, {"n": i}) for i in range(3)]
+    stored = StoredContent({}, None, {"a": 1})
+    for key in keys:
+        cache.put(key, stored)
+    paths = sorted(tmp_path.iterdir())
+    for i, path in enumerate(paths):
+        os.utime(path, (1_000_000 + i, 1_000_000 + i))
+    cache.max_bytes = paths[0].stat().st_size * 2
+    cache.evict()
+    assert len(list(tmp_path.iterdir())) == 2
+    assert not paths[0].exists()
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_many(tmp_path: Path) -> None:
+    """Share a cache directory between workers."""
+    results = list(
+        docx2python_many([EXAMPLE, EXAMPLE], max_workers=2, cache_dir=str(tmp_path))
+    )
+    assert results[0].text == results[1].text == docx2python(EXAMPLE).text
+    assert results[0].images == docx2python(EXAMPLE).image_sizes
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+def test_not_with_custom_handlers(tmp_path: Path, restore_handlers: None) -> None:
+    """Extract again once a tag handler has been registered. Store nothing."""
+
+    def add_run(ctx: TextContext, group: List[EtreeElement], _: Optional[int]) -> None:
+        ctx.tables.insert_text_as_new_run("[run]")
+
+    expect = docx2python(EXAMPLE, cache=tmp_path).text
+    register_tag_handler(qn("w:r"), add_run, descend=False)
+    stats = ReaderStats()
+    text = docx2python(EXAMPLE, cache=tmp_path, stats=stats).text
+    assert text != expect
+    assert "[run]" in text
+    assert "disk" not in stats.caches
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+def test_not_with_custom_formatter(tmp_path: Path, restore_handlers: None) -> None:
+    """Extract html again once XML2HTML_FORMATTER has been changed."""
+    expect = docx2python(EXAMPLE, cache=tmp_path, html=True).header_runs
+    XML2HTML_FORMATTER["Header"] = HtmlFormatter(lambda tag, val: "h6")
+    header_runs = docx2python(EXAMPLE, cache=tmp_path, html=True).header_runs
+    assert header_runs != expect
+    assert header_runs[0][0][0][0][0] == "<h6>"
+    assert docx2python(EXAMPLE, cache=tmp_path).text
+    assert len(list(tmp_path.iterdir())) == 2
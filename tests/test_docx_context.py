@@ -10,12 +10,14 @@ import zipfile
 from lxml import etree
 
 from docx2python.attribute_register import Tags
-from docx2python.docx_context import collect_numFmts
+from docx2python.bullets_and_numbering import BulletGenerator
+from docx2python.docx_context import collect_numbering, collect_numFmts
 from docx2python.docx_reader import DocxReader
 from docx2python.iterators import iter_at_depth
 from docx2python.main import docx2python
 
 from .conftest import RESOURCES
+from .helpers.utils import valid_xml
 
 example_docx = RESOURCES / "example.docx"
 
@@ -77,6 +79,61 @@ class TestCollectNumFmts:
         }
 
 
+NUMBERING_WITH_OVERRIDES = valid_xml(
+    '<w:abstractNum w:abstractNumId="0">'
+    + '<w:lvl w:ilvl="0"><w:start w:val="3"/><w:numFmt w:val="decimal"/>'
+    + '<w:lvlText w:val="%1."/></w:lvl>'
+    + '<w:lvl w:ilvl="2"><w:numFmt w:val="lowerRoman"/></w:lvl>'
+    + "</w:abstractNum>"
+    + '<w:num w:numId="1"><w:abstractNumId w:val="0"/></w:num>'
+    + '<w:num w:numId="2"><w:abstractNumId w:val="0"/>'
+    + '<w:lvlOverride w:ilvl="0"><w:startOverride w:val="7"/></w:lvlOverride>'
+    + '<w:lvlOverride w:ilvl="2"><w:lvl w:ilvl="2"><w:numFmt w:val="upperLetter"/>'
+    + "</w:lvl></w:lvlOverride>"
+    + "</w:num>"
+    + '<w:num w:numId="3"><w:abstractNumId w:val="9"/></w:num>'
+)
+
+
+class TestCollectNumbering:
+    """Test docx_context.collect_numbering"""
+
+    def test_levels(self) -> None:
+        """Index levels by ilvl. Fill missing levels."""
+        numbering = collect_numbering(etree.fromstring(NUMBERING_WITH_OVERRIDES))
+        levels = numbering["1"]
+        assert levels.numFmts == ("decimal", "bullet", "lowerRoman")
+        assert list(levels.starts) == [3, 1, 1]
+        assert levels.lvlTexts == ("%1.", "", "")
+        assert levels.overrides == frozenset()
+
+    def test_overrides(self) -> None:
+        """Apply startOverride and lvl overrides to one num only."""
+        numbering = collect_numbering(etree.fromstring(NUMBERING_WITH_OVERRIDES))
+        levels = numbering["2"]
+        assert levels.numFmts == ("decimal", "bullet", "upperLetter")
+        assert list(levels.starts) == [7, 1, 1]
+        assert levels.overrides == frozenset({0, 2})
+        assert numbering["1"].numFmts[2] == "lowerRoman"
+
+    def test_missing_abstract_num(self) -> None:
+        """Skip a num referencing a missing abstractNum."""
+        numbering = collect_numbering(etree.fromstring(NUMBERING_WITH_OVERRIDES))
+        assert set(numbering) == {"1", "2"}
+
+    def test_bullets(self) -> None:
+        """Number from the overridden start."""
+        numbering = collect_numbering(etree.fromstring(NUMBERING_WITH_OVERRIDES))
+        bullets = BulletGenerator(numbering)
+        assert [bullets.get_numbered_bullet("2", "0") for _ in range(2)] == [
+            "7)\t",
+            "8)\t",
+        ]
+        assert bullets.get_numbered_bullet("2", "2") == "\t\tA)\t"
+        assert bullets.get_numbered_bullet("1", "0") == "3)\t"
+        assert bullets.get_numbered_bullet("3", "0") == ""
+
+
 class TestCollectDocProps:
     """Test strip_text.collect_docProps"""
 
@@ -0,0 +1,68 @@
+"""Test depth (relative to paragraphs) of elements in a content file.
+
+:author: Shay Hill
+:created: 2023-07-03
+
+Depths are found for every element in one pass. These should match the depths that
+a width-first search for paragraphs under each element would return.
+"""
+
+from lxml import etree
+
+from docx2python.attribute_register import Tags
+from docx2python.docx_text import _get_elem_depths
+
+from .helpers.utils import valid_xml
+
+TABLE = (
+    "<w:body>"
+    + "<w:tbl><w:tr><w:tc><w:p><w:r><w:t>cell</w:t></w:r></w:p></w:tc></w:tr></w:tbl>"
+    + "<w:p><w:r><w:t>par</w:t></w:r></w:p>"
+    + "</w:body>"
+)
+
+
+def _nested_tables(depth: int) -> str:
+    """Nest tables inside table cells.
+
+    :param depth: number of nested tables
+    :return: xml string with ``depth`` nested tables, a paragraph in each cell
+    """
+    open_ = "<w:tbl><w:tr><w:tc>" * depth
+    close = "<w:p/></w:tc></w:tr></w:tbl>" * depth
+    return "<w:body>" + open_ + close + "</w:body>"
+
+
+class TestGetElemDepths:
+    def test_table_depths(self) -> None:
+        """Table, row, cell, and paragraph depths 1, 2, 3, 4"""
+        root = etree.fromstring(valid_xml(TABLE))
+        depths = _get_elem_depths(root)
+        tag2depth = {x.tag: depths.get(x) for x in root.iter()}
+        assert tag2depth[Tags.TABLE] == 1
+        assert tag2depth[Tags.TABLE_ROW] == 2
+        assert tag2depth[Tags.TABLE_CELL] == 3
+        assert tag2depth[Tags.PARAGRAPH] == 4
+
+    def test_no_depth(self) -> None:
+        """Document, body, and elements without paragraphs have no depth"""
+        root = etree.fromstring(valid_xml(TABLE))
+        depths = _get_elem_depths(root)
+        for tag in (Tags.DOCUMENT, Tags.BODY, Tags.RUN, Tags.TEXT):
+            elem = next(x for x in root.iter() if x.tag == tag)
+            assert depths.get(elem) is None
+
+    def test_nearest_paragraph(self) -> None:
+        """Depth is taken from the nearest paragraph, not the first paragraph."""
+        root = etree.fromstring(valid_xml(_nested_tables(3)))
+        depths = _get_elem_depths(root)
+        cells = [x for x in root.iter() if x.tag == Tags.TABLE_CELL]
+        assert [depths.get(x) for x in cells] == [3, 3, 3]
+
+    def test_subtree(self) -> None:
+        """Depths are relative to the root argument"""
+        root = etree.fromstring(valid_xml(TABLE))
+        cell = next(x for x in root.iter() if x.tag == Tags.TABLE_CELL)
+        depths = _get_elem_depths(cell)
+        assert depths.get(cell) == 3
+        assert len(depths) == 2
@@ -0,0 +1,82 @@
+"""Test holding text runs in a flat list with offset arrays.
+
+:author: Shay Hill
+:created: 2023-07-03
+"""
+
+import pickle
+from array import array
+
+import pytest
+
+from docx2python import docx2python
+from docx2python.flat_content import FlatContent
+
+from .conftest import RESOURCES
+
+TABLES = [
+    [[[["a", "b"], []], [["c"]]], [[["d"]]]],
+    [],
+    [[[["e", "f", "g"]]], []],
+]
+
+
+def test_offsets() -> None:
+    """Keep empty paragraphs, cells, rows, and tables."""
+    flat = FlatContent.from_parts([("header", [[]]), ("officeDocument", TABLES)])
+    assert flat.runs == ["a", "b", "c", "d", "e", "f", "g"]
+    assert flat.paragraphs == array("i", [0, 2, 2, 3, 4, 7])
+    assert flat.cells == array("i", [0, 2, 3, 4, 5])
+    assert flat.rows == array("i", [0, 2, 3, 4, 4])
+    assert flat.tables == array("i", [0, 0, 2, 2, 4])
+    assert flat.parts == array("i", [0, 1, 4])
+    assert flat.part_names == ["header", "officeDocument"]
+    assert [flat.count(x) for x in ("tables", "rows", "cells", "paragraphs")] == [
+        4,
+        4,
+        4,
+        5,
+    ]
+
+
+def test_rebuild() -> None:
+    """Rebuild nested lists from any depth."""
+    flat = FlatContent.from_parts([("header", [[]]), ("officeDocument", TABLES)])
+    assert flat.get_part("officeDocument") == TABLES
+    assert flat.get_part("footer") == []
+    assert flat.to_tables() == [[]] + TABLES
+    assert flat.get_table(-1) == TABLES[2]
+    assert flat.get_row(1) == TABLES[0][1]
+    assert flat.get_cell(0) == TABLES[0][0][0]
+    assert flat.get_runs(4) == ["e", "f", "g"]
+    assert list(flat.children("rows", 0)) == [0, 1]
+
+
+def test_out_of_range() -> None:
+    """Raise an IndexError or ValueError for a missing item or depth."""
+    flat = FlatContent.from_parts([("officeDocument", TABLES)])
+    with pytest.raises(IndexError):
+        _ = flat.get_runs(5)
+    with pytest.raises(IndexError):
+        _ = flat.get_table(-4)
+    with pytest.raises(ValueError):
+        _ = flat.children("runs", 0)
+
+
+def test_docx_content() -> None:
+    """Hold the same runs as document_runs. Pickle."""
+    with docx2python(RESOURCES / "example.docx", html=True) as content:
+        flat = content.to_flat()
+        assert flat.to_tables() == content.document_runs
+        assert flat.get_part("footer") == content.footer_runs
+        assert content.to_flat({"body"}).to_tables() == content.body_runs
+    assert pickle.loads(pickle.dumps(flat)) == flat
+
+
+def test_numpy() -> None:
+    """Share memory with numpy arrays."""
+    np = pytest.importorskip("numpy")
+    flat = FlatContent.from_parts([("officeDocument", TABLES)])
+    offsets = flat.offsets_as_numpy()
+    assert offsets["paragraphs"].tolist() == flat.paragraphs.tolist()
+    assert np.shares_memory(offsets["cells"], np.frombuffer(flat.cells, np.intc))
@@ -12,20 +12,25 @@ from typing import Dict
 import pytest
 from lxml import etree
 
-from docx2python.bullets_and_numbering import BulletGenerator, _increment_list_counter
+from docx2python.bullets_and_numbering import BulletGenerator, _increment_level_count
 
 from .helpers.utils import valid_xml
 
 
-class TestIncrementListCounter:
-    """Test get_text.increment_list_counter"""
+class TestIncrementLevelCount:
+    """Test bullets_and_numbering._increment_level_count"""
 
     def test_function(self) -> None:
-        """Increments counter at ilvl, deletes deeper counters."""
-        ilvl2count = {str(x): x for x in range(1, 6)}
-        assert ilvl2count == {"1": 1, "2": 2, "3": 3, "4": 4, "5": 5}
-        _ = _increment_list_counter(ilvl2count, "2")
-        assert ilvl2count == {"1": 1, "2": 3}
+        """Increments count at ilvl, resets deeper counts."""
+        counts = [1, 2, 3, 4, 5]
+        assert _increment_level_count(counts, 1) == 3
+        assert counts == [1, 3, 0, 0, 0]
+
+    def test_extend(self) -> None:
+        """Add counts for levels not yet seen."""
+        counts = [1]
+        assert _increment_level_count(counts, 2) == 1
+        assert counts == [1, 0, 1]
 
 
 @pytest.fixture()
@@ -142,6 +147,19 @@ class TestGetBulletString:
         bullets = BulletGenerator(numbering_context["numId2numFmts"])
         assert bullets.get_bullet(paragraph) == ""
 
+    def test_incomplete_numPr(self, numbering_context) -> None:
+        """
+        Returns '' when numPr has no ilvl or a numId has no value.
+        """
+        bullets = BulletGenerator(numbering_context["numId2numFmts"])
+        for numPr in (
+            '<w:numPr><w:numId w:val="1"/></w:numPr>',
+            '<w:numPr><w:ilvl w:val="0"/><w:numId/></w:numPr>',
+            "<w:pStyle/>",
+        ):
+            xml = valid_xml("<w:p><w:pPr>" + numPr + "</w:pPr></w:p>")
+            assert bullets.get_bullet(etree.fromstring(xml)[0]) == ""
+
     def test_resets_sublists(self, numbered_paragraphs, numbering_context):
         """Numbers reset when returning to shallower level
 
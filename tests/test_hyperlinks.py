@@ -52,9 +52,16 @@ Then to
 This module tests the final result.
 """
 
+import pytest
+from lxml import etree
+
+from docx2python import docx_text
+from docx2python.docx_reader import DocxReader
+from docx2python.iterators import iter_at_depth
 from docx2python.main import docx2python
 
 from .conftest import RESOURCES
+from .helpers.utils import valid_xml
 
 
 class TestHyperlink:
@@ -75,3 +82,41 @@ class TestHyperlink:
                     ]
                 ]
             ]
+
+    def test_no_sub_extraction(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Link text is collected as the tree is walked, not extracted again."""
+
+        collectors: list = []
+
+        class CountedCollector(docx_text.DepthCollector):
+            def __init__(self, item_depth: int) -> None:
+                super().__init__(item_depth)
+                collectors.append(self)
+
+        monkeypatch.setattr(docx_text, "DepthCollector", CountedCollector)
+        with DocxReader(RESOURCES / "hyperlink.docx") as reader:
+            tables = docx_text.get_text(reader.file_of_type("officeDocument"))
+        runs = list(iter_at_depth(tables, 5))
+        assert '<a href="http://www.shayallenhill.com/">my website</a>' in runs
+        assert len(collectors) == 1
+
+    def test_anchor(self) -> None:
+        """Internal references (no r:id) are plain text between the runs around them.
+
+        Runs inside the link are joined with their formatting. Runs after the link
+        are not affected by it.
+        """
+        xml = valid_xml(
+            "<w:body><w:p>"
+            + "<w:r><w:t>see </w:t></w:r>"
+            + '<w:hyperlink w:anchor="here">'
+            + "<w:r><w:rPr><w:b/></w:rPr><w:t>this</w:t></w:r>"
+            + "<w:r><w:t> section</w:t></w:r>"
+            + "</w:hyperlink>"
+            + "<w:r><w:t>.</w:t></w:r>"
+            + "</w:p></w:body>"
+        )
+        with DocxReader(RESOURCES / "example.docx", html=True) as reader:
+            file = reader.file_of_type("officeDocument")
+            tables = docx_text.get_text(file, etree.fromstring(xml))
+        assert list(iter_at_depth(tables, 4)) == [["see ", "<b>this</b> section", "."]]
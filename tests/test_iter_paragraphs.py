@@ -0,0 +1,70 @@
+"""Test extracting paragraph records one at a time.
+
+:author: Shay Hill
+:created: 2023-07-03
+"""
+
+import pytest
+
+from docx2python import docx2python
+from docx2python.iterators import enum_at_depth
+
+from .conftest import RESOURCES
+
+PARTS = ["header", "officeDocument", "footer", "footnotes", "endnotes"]
+
+
+@pytest.mark.parametrize(
+    "filename", ["example.docx", "merged_cells.docx", "nested_paragraphs.docx"]
+)
+@pytest.mark.parametrize("paragraph_styles", [False, True])
+def test_same_as_text(filename: str, paragraph_styles: bool) -> None:
+    """Yield every paragraph of text in order."""
+    with docx2python(
+        RESOURCES / filename, paragraph_styles=paragraph_styles
+    ) as content:
+        records = list(content.iter_paragraphs())
+        assert "\n\n".join(x.text for x in records) == content.text
+
+
+def test_records() -> None:
+    """Record part, path, address, runs, and style of each paragraph."""
+    with docx2python(RESOURCES / "example.docx", paragraph_styles=True) as content:
+        records = list(content.iter_paragraphs())
+        assert [x.part for x in records] == sorted(
+            (x.part for x in records), key=PARTS.index
+        )
+        for file in content.docx_reader.content_files():
+            file_records = [x for x in records if x.path == file.path]
+            assert {x.part for x in file_records} == {file.Type}
+            expect = list(enum_at_depth(file.content, 4))
+            assert [x.index for x in file_records] == [x.index for x in expect]
+            assert [[x.style] + x.runs for x in file_records] == [
+                x.value for x in expect
+            ]
+        assert all(x.text == "".join(x.runs) for x in records)
+
+
+def test_no_style() -> None:
+    """Style is None without paragraph_styles."""
+    with docx2python(RESOURCES / "example.docx") as content:
+        assert all(x.style is None for x in content.iter_paragraphs())
+
+
+def test_parts() -> None:
+    """Only yield paragraphs of selected parts."""
+    with docx2python(RESOURCES / "example.docx", parts={"body"}) as content:
+        assert {x.part for x in content.iter_paragraphs()} == {"officeDocument"}
+        headers = {x.part for x in content.iter_paragraphs({"header", "footer"})}
+        assert headers == {"header", "footer"}
+
+
+def test_lazy() -> None:
+    """Do not parse or cache whole files."""
+    with docx2python(RESOURCES / "example.docx") as content:
+        paragraphs = content.iter_paragraphs({"body"})
+        _ = next(paragraphs)
+        paragraphs.close()
+        file = content.docx_reader.file_of_type("officeDocument")
+        assert file._File__root_element is None  # type: ignore
+        assert not file._File__content  # type: ignore
@@ -69,6 +69,10 @@ Then finally to (by merging text)
 </w:p>
 """
 
+from lxml import etree
+
+from docx2python.attribute_register import Tags, get_content_elems, has_content
+from docx2python.docx_reader import DocxReader
 from docx2python.main import docx2python
 
 from .conftest import RESOURCES
@@ -109,3 +113,38 @@ def test_merge_runs():
         ]
     ]
     extraction.close()
+
+
+def test_content_elems_match_has_content():
+    """
+    get_content_elems finds the same elements has_content would find one at a time.
+    """
+    with DocxReader(RESOURCES / "example.docx") as reader:
+        root = reader.file_of_type("officeDocument").root_element
+        content_elems = get_content_elems(root)
+        for elem in root.iter():
+            assert (elem in content_elems) == bool(has_content(elem))
+
+
+def test_extraction_does_not_alter_tree():
+    """
+    Elements are merged during extraction. The root_element tree is not altered.
+    """
+    with DocxReader(RESOURCES / "merged_links.docx") as reader:
+        file = reader.file_of_type("officeDocument")
+        before = etree.tostring(file.root_element)
+        _ = file.content
+        assert etree.tostring(file.root_element) == before
+
+
+def test_merged_root_element():
+    """
+    Merge consecutive links in the tree when asked.
+    """
+    with DocxReader(RESOURCES / "merged_links.docx") as reader:
+        file = reader.file_of_type("officeDocument")
+        content = file.content
+        links = [x for x in file.root_element.iter() if x.tag == Tags.HYPERLINK]
+        merged = [x for x in file.merged_root_element.iter() if x.tag == Tags.HYPERLINK]
+        assert len(merged) < len(links)
+        assert file.content == content
@@ -0,0 +1,147 @@
+"""Test sharing identical headers, footers, and numbering between docx files.
+
+:author: Shay Hill
+:created: 2023-07-03
+"""
+
+import zipfile
+from io import BytesIO
+from typing import Iterator, List, Optional
+
+import pytest
+from lxml.etree import _Element as EtreeElement  # type: ignore
+
+from docx2python import attribute_register
+from docx2python.docx_reader import DocxReader
+from docx2python.docx_text import TAG_HANDLERS, TextContext, register_tag_handler
+from docx2python.namespace import qn
+from docx2python.part_cache import PART_CACHE, PartCache
+from docx2python.stats import ReaderStats
+
+from .conftest import RESOURCES
+
+EXAMPLE = RESOURCES / "example.docx"
+
+
+def _replace_member(path: str, old: bytes, new: bytes) -> BytesIO:
+    """Copy example.docx with one member edited.
+
+    :param path: path of the member to edit
+    :param old: bytes to replace in that member
+    :param new: replacement bytes
+    :return: edited docx
+    """
+    docx = BytesIO()
+    with zipfile.ZipFile(EXAMPLE) as zin, zipfile.ZipFile(docx, "w") as zout:
+        for info in zin.infolist():
+            data = zin.read(info.filename)
+            if info.filename == path:
+                assert old in data
+                data = data.replace(old, new)
+            zout.writestr(info, data)
+    return docx
+
+
+@pytest.fixture()
+def maxsize() -> Iterator[None]:
+    """Restore PART_CACHE.maxsize."""
+    maxsize = PART_CACHE.maxsize
+    yield
+    PART_CACHE.maxsize = maxsize
+
+
+def test_share_between_readers() -> None:
+    """Do not read identical headers, footers, or numbering twice."""
+    with DocxReader(EXAMPLE) as reader:
+        header = reader.files_of_type("header")[0].content
+        body = reader.file_of_type("officeDocument").content
+    stats = ReaderStats()
+    with DocxReader(EXAMPLE, stats=stats) as reader:
+        assert reader.files_of_type("header")[0].content == header
+        assert reader.files_of_type("header")[0].content is not header
+        assert reader.file_of_type("officeDocument").content == body
+        assert reader.file_of_type("officeDocument").content is not body
+    assert "word/numbering.xml" not in stats.files
+    assert not any("header" in x for x in stats.files)
+    assert stats.caches["parts"].hits >= 2
+
+
+def test_alter_shared_content() -> None:
+    """Altering one reader's content does not alter content of later readers."""
+    with DocxReader(EXAMPLE) as reader:
+        header = reader.files_of_type("header")[0].content
+        expect = repr(header)
+        header[0][0][0].append(["INJECTED"])
+        header.append([])
+    with DocxReader(EXAMPLE) as reader:
+        assert repr(reader.files_of_type("header")[0].content) == expect
+
+
+def test_options_in_key() -> None:
+    """Extract again with other options."""
+    with DocxReader(EXAMPLE) as reader:
+        header = reader.files_of_type("header")[0].content
+    with DocxReader(EXAMPLE, paragraph_styles=True) as reader:
+        assert reader.files_of_type("header")[0].content != header
+
+
+def test_numbering_in_key() -> None:
+    """Extract again if numbering.xml is different."""
+    with DocxReader(EXAMPLE) as reader:
+        numFmts = reader.numId2numFmts
+        _ = reader.files_of_type("header")[0].content
+    edited = _replace_member("word/numbering.xml", b"upperRoman", b"decimal")
+    stats = ReaderStats()
+    with DocxReader(edited, stats=stats) as reader:
+        assert reader.numId2numFmts != numFmts
+        _ = reader.files_of_type("header")[0].content
+    assert "word/numbering.xml" in stats.files
+    assert stats.caches["parts"].hits == 0
+
+
+def test_numbering_maps_built_once() -> None:
+    """Build numId2numFmts and numId2numStarts once per reader."""
+    with DocxReader(EXAMPLE) as reader:
+        assert reader.numId2numFmts is reader.numId2numFmts
+        assert reader.numId2numStarts is reader.numId2numStarts
+        assert set(reader.numId2numStarts) == set(reader.numbering)
+
+
+def test_not_with_custom_handlers() -> None:
+    """Do not share content if a tag handler has been registered."""
+
+    def add_run(ctx: TextContext, group: List[EtreeElement], _: Optional[int]) -> None:
+        ctx.tables.insert_text_as_new_run("[run]")
+
+    handlers = dict(TAG_HANDLERS)
+    content_tags = set(attribute_register._CONTENT_TAGS)
+    try:
+        register_tag_handler(qn("w:r"), add_run, descend=False)
+        with DocxReader(EXAMPLE) as reader:
+            _ = reader.files_of_type("header")[0].content
+        assert all(x[0] != "content" for x in PART_CACHE._values)
+    finally:
+        TAG_HANDLERS.clear()
+        TAG_HANDLERS.update(handlers)
+        attribute_register._CONTENT_TAGS.clear()
+        attribute_register._CONTENT_TAGS.update(content_tags)
+
+
+def test_disable(maxsize: None) -> None:
+    """Keep nothing if maxsize is 0."""
+    PART_CACHE.maxsize = 0
+    with DocxReader(EXAMPLE) as reader:
+        _ = [x.content for x in reader.content_files()]
+    assert len(PART_CACHE) == 0
+
+
+def test_least_recently_used() -> None:
+    """Forget the least recently used value."""
+    cache = PartCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    assert (cache.stats.hits, cache.stats.misses) == (3, 1)
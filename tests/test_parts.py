@@ -0,0 +1,73 @@
+"""Test extracting only selected parts of a docx.
+
+:author: Shay Hill
+:created: 2023-07-03
+"""
+
+import pytest
+
+from docx2python import docx2python, docx2python_many
+from docx2python.stats import ReaderStats
+
+from .conftest import RESOURCES
+
+EXAMPLE = RESOURCES / "example.docx"
+
+
+def test_body_only() -> None:
+    """Extract the body. Leave other parts empty."""
+    with docx2python(EXAMPLE) as content:
+        body = content.body
+        body_runs = content.body_runs
+        assert content.header
+    with docx2python(EXAMPLE, parts={"officeDocument"}) as content:
+        assert content.part_types == {"officeDocument"}
+        assert content.body == body
+        assert content.body_runs == body_runs
+        assert content.header == []
+        assert content.header_runs == []
+        assert content.footnotes_runs == []
+        assert content.document == body
+
+
+def test_text() -> None:
+    """Join only selected parts."""
+    with docx2python(EXAMPLE) as content:
+        text = content.text
+        body_text = content.get_text({"body"})
+        assert body_text in text
+        assert body_text != text
+        assert text.startswith(content.get_text(["header"]))
+    with docx2python(EXAMPLE, parts=["body"]) as content:
+        assert content.text == body_text
+        assert content.get_text() == body_text
+        assert content.get_text(None) == body_text
+        assert content.get_text("header") in text
+
+
+def test_other_files_not_read() -> None:
+    """Do not unzip or parse files of other parts."""
+    stats = ReaderStats()
+    with docx2python(EXAMPLE, stats=stats, parts={"officeDocument"}) as content:
+        _ = content.text
+        _ = content.document_runs
+        _ = content.header
+    read = {x for x in stats.files if not x.endswith(".rels")}
+    assert read == {"word/document.xml", "word/numbering.xml"}
+
+
+def test_unknown_part() -> None:
+    """Raise a ValueError for a part that is not a content file type."""
+    with pytest.raises(ValueError):
+        _ = docx2python(EXAMPLE, parts={"document"})
+    with docx2python(EXAMPLE) as content:
+        with pytest.raises(ValueError):
+            _ = content.get_text({"styles"})
+
+
+def test_many() -> None:
+    """Select parts in docx2python_many."""
+    result = next(docx2python_many([EXAMPLE], parts={"body"}, max_workers=1))
+    assert result.error is None
+    assert result.body_runs
+    assert result.header_runs == []
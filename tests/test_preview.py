@@ -0,0 +1,55 @@
+"""Test previewing the beginning of the body text.
+
+:author: Shay Hill
+:created: 2023-07-03
+"""
+
+from typing import Iterator
+
+import pytest
+
+from docx2python import docx2python
+from docx2python.docx_reader import File
+from docx2python.iterators import IndexedItem
+
+from .conftest import RESOURCES
+
+
+@pytest.mark.parametrize(
+    "filename", ["example.docx", "merged_cells.docx", "hyperlink.docx"]
+)
+@pytest.mark.parametrize("html", [False, True])
+@pytest.mark.parametrize("paragraph_styles", [False, True])
+def test_beginning_of_text(filename: str, html: bool, paragraph_styles: bool) -> None:
+    """Return the beginning of the body text, numbered and formatted the same."""
+    with docx2python(
+        RESOURCES / filename, html=html, paragraph_styles=paragraph_styles
+    ) as content:
+        body_text = content.get_text({"officeDocument"})
+        paragraphs = body_text.split("\n\n")
+        for max_chars in (0, 1, 10, 100, 500, None):
+            assert content.preview(max_chars) == body_text[:max_chars]
+        for max_paragraphs in (0, 1, 3):
+            preview = content.preview(None, max_paragraphs)
+            assert preview == "\n\n".join(paragraphs[:max_paragraphs])
+
+
+def test_stop_reading(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Stop extracting paragraphs once the preview is long enough."""
+    read = []
+    closed = []
+    iter_content = File.iter_content
+
+    def counted_iter_content(file: File) -> Iterator[IndexedItem]:
+        try:
+            for item in iter_content(file):
+                read.append(item)
+                yield item
+        finally:
+            closed.append(file)
+
+    monkeypatch.setattr(File, "iter_content", counted_iter_content)
+    with docx2python(RESOURCES / "example.docx") as content:
+        assert content.preview(max_paragraphs=2).count("\n\n") == 1
+    assert len(read) == 2
+    assert len(closed) == 1
@@ -0,0 +1,107 @@
+"""Test extraction without an xml tree.
+
+:author: Shay Hill
+:created: 2023-07-03
+"""
+
+from typing import Iterator, List, Optional
+
+import pytest
+from lxml.etree import _Element as EtreeElement  # type: ignore
+
+from docx2python import attribute_register, docx2python
+from docx2python.attribute_register import Tags
+from docx2python.docx_reader import DocxReader
+from docx2python.docx_sax import is_supported, sax_text
+from docx2python.docx_text import TAG_HANDLERS, TextContext, register_tag_handler
+from docx2python.iterators import iter_at_depth
+from docx2python.namespace import qn
+
+from .conftest import RESOURCES
+
+# every feature of get_text is in at least one of these
+SAMPLES = (
+    "apples_and_pears.docx",
+    "check_drop_my.docx",
+    "checked_boxes.docx",
+    "created-in-pages-bulleted-lists.docx",
+    "equations.docx",
+    "example.docx",
+    "has_pict.docx",
+    "merged_cells.docx",
+    "merged_links.docx",
+    "nested_paragraphs.docx",
+    "nested_paragraphs_in_header.docx",
+    "pic_alt_text.docx",
+    "soft_line_breaks.docx",
+    "symbols.docx",
+)
+
+
+@pytest.fixture()
+def restore_handlers() -> Iterator[None]:
+    """Remove any handlers registered in a test."""
+    handlers = dict(TAG_HANDLERS)
+    content_tags = set(attribute_register._CONTENT_TAGS)
+    yield
+    TAG_HANDLERS.clear()
+    TAG_HANDLERS.update(handlers)
+    attribute_register._CONTENT_TAGS.clear()
+    attribute_register._CONTENT_TAGS.update(content_tags)
+
+
+@pytest.mark.parametrize("filename", SAMPLES)
+@pytest.mark.parametrize("paragraph_styles", [False, True])
+@pytest.mark.parametrize("duplicate_merged_cells", [False, True])
+def test_same_content(
+    filename: str, paragraph_styles: bool, duplicate_merged_cells: bool
+) -> None:
+    """Extract the same content from every file as get_text."""
+    kwargs = {
+        "paragraph_styles": paragraph_styles,
+        "duplicate_merged_cells": duplicate_merged_cells,
+    }
+    with DocxReader(RESOURCES / filename, **kwargs) as reader:
+        for file in reader.content_files():
+            assert sax_text(file) == file.content
+
+
+def test_engine_argument() -> None:
+    """Select the engine in docx2python."""
+    with docx2python(RESOURCES / "example.docx") as tree_content:
+        expect = tree_content.document_runs
+    with docx2python(RESOURCES / "example.docx", engine="sax") as sax_content:
+        assert sax_content.docx_reader.engine == "sax"
+        assert sax_content.document_runs == expect
+
+
+def test_bad_arguments() -> None:
+    """Only extract plain text. Only accept known engines."""
+    with pytest.raises(ValueError):
+        _ = DocxReader(RESOURCES / "example.docx", html=True, engine="sax")
+    with pytest.raises(ValueError):
+        _ = DocxReader(RESOURCES / "example.docx", engine="dom")
+
+
+def test_edited_tree() -> None:
+    """Extract from root_element once it has been exposed."""
+    with DocxReader(RESOURCES / "example.docx", engine="sax") as reader:
+        file = reader.file_of_type("officeDocument")
+        for text in file.root_element.iter(Tags.TEXT):
+            text.text = "edited"
+        runs = set(iter_at_depth(file.content, 5))
+        assert "edited" in runs
+        assert not any(x.isalpha() and x.replace("edited", "") for x in runs)
+
+
+def test_custom_handler(restore_handlers: None) -> None:
+    """Extract from the tree if a tag handler has been registered."""
+
+    def add_run(ctx: TextContext, group: List[EtreeElement], _: Optional[int]) -> None:
+        ctx.tables.insert_text_as_new_run("[run]")
+
+    assert is_supported()
+    register_tag_handler(qn("w:r"), add_run, descend=False)
+    assert not is_supported()
+    with docx2python(RESOURCES / "hyperlink.docx", engine="sax") as content:
+        assert "[run]" in content.text
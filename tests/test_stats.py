@@ -0,0 +1,84 @@
+"""Test optional timing and counters.
+
+:author: Shay Hill
+:created: 2023-07-03
+"""
+
+import json
+
+from docx2python import docx2python
+from docx2python.docx_reader import DocxReader
+from docx2python.iterators import iter_at_depth
+from docx2python.stats import ReaderStats, _prefix_tag
+
+from .conftest import RESOURCES
+
+
+def test_prefix_tag() -> None:
+    """Replace known namespaces with prefixes."""
+    assert _prefix_tag("p") == "p"
+    w_p = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}p"
+    assert _prefix_tag(w_p) == "w:p"
+    assert _prefix_tag("{unknown}p") == "{unknown}p"
+
+
+def test_no_stats() -> None:
+    """Nothing is recorded by default."""
+    with DocxReader(RESOURCES / "example.docx") as reader:
+        _ = reader.file_of_type("officeDocument").content
+        assert reader.stats is None
+
+
+def test_phases() -> None:
+    """Record time, bytes, tags, and content for each file."""
+    stats = ReaderStats()
+    with docx2python(RESOURCES / "example.docx", stats=stats) as content:
+        body_runs = content.body_runs
+        images = content.images
+    document = stats.files["word/document.xml"]
+    for phase in ("unzip", "parse", "rels", "extract"):
+        assert document.seconds[phase] > 0
+    assert document.decompressed_bytes > document.compressed_bytes > 0
+    assert document.tags["w:p"] == len(list(iter_at_depth(body_runs, 4)))
+    assert document.paragraphs == len(list(iter_at_depth(body_runs, 4)))
+    assert document.runs == len(list(iter_at_depth(body_runs, 5)))
+    assert stats.files["word/numbering.xml"].seconds["numbering"] > 0
+    image_stats = [x for x in stats.files.values() if "images" in x.seconds]
+    assert {x.path.split("/")[-1] for x in image_stats} == set(images)
+    assert all(x.decompressed_bytes > 0 for x in image_stats)
+    assert set(stats.totals()) >= {"unzip", "parse", "extract", "images"}
+
+
+def test_callback() -> None:
+    """Call on_phase as each phase ends."""
+    calls = []
+    stats = ReaderStats(on_phase=lambda *args: calls.append(args))
+    with docx2python(RESOURCES / "example.docx", stats=stats) as content:
+        _ = content.text
+    assert ("word/document.xml", "extract") in {x[:2] for x in calls}
+    total = sum(x[2] for x in calls)
+    assert abs(total - sum(stats.totals().values())) < 1e-9
+
+
+def test_worst_and_export() -> None:
+    """Find the slowest files and export to json."""
+    stats = ReaderStats()
+    with docx2python(RESOURCES / "example.docx", stats=stats) as content:
+        _ = content.text
+    worst = stats.worst("extract", 2)
+    assert len(worst) == 2
+    assert worst[0].seconds["extract"] >= worst[1].seconds["extract"]
+    exported = json.loads(json.dumps(stats.as_dict()))
+    assert {x["path"] for x in exported["files"]} == set(stats.files)
+
+
+def test_formatting_cache() -> None:
+    """Count formatting cache hits and misses."""
+    stats = ReaderStats()
+    with docx2python(RESOURCES / "example.docx", html=True, stats=stats) as content:
+        _ = content.text
+    formatting = stats.caches["formatting"]
+    assert formatting.misses > 0
+    assert formatting.hits > formatting.misses
+    assert 0.5 < formatting.hit_rate < 1
+    assert stats.as_dict()["caches"]["formatting"]["hits"] == formatting.hits
@@ -0,0 +1,57 @@
+"""Test extracting paragraphs while a content file is parsed.
+
+:author: Shay Hill
+:created: 2023-07-03
+
+``File.iter_content`` should yield the same paragraphs, at the same addresses, as
+``File.content``.
+"""
+
+import pytest
+
+from docx2python.docx_reader import DocxReader
+from docx2python.iterators import enum_at_depth
+
+from .conftest import RESOURCES
+
+
+@pytest.mark.parametrize(
+    "filename",
+    [
+        "example.docx",
+        "merged_cells.docx",
+        "nested_paragraphs_in_header.docx",
+        "hyperlink.docx",
+        "libreoffice_conversion.docx",
+    ],
+)
+@pytest.mark.parametrize("html", [False, True])
+@pytest.mark.parametrize("duplicate_merged_cells", [False, True])
+def test_stream_matches_content(
+    filename: str, html: bool, duplicate_merged_cells: bool
+) -> None:
+    """Streamed paragraphs match paragraphs in the full nested list."""
+    with DocxReader(
+        RESOURCES / filename, html=html, duplicate_merged_cells=duplicate_merged_cells
+    ) as reader:
+        for file in reader.content_files():
+            streamed = list(file.iter_content())
+            assert streamed == list(enum_at_depth(file.content, 4))
+
+
+def test_stream_does_not_parse_root_element() -> None:
+    """Streaming does not read or cache the whole file."""
+    with DocxReader(RESOURCES / "example.docx") as reader:
+        file = reader.file_of_type("officeDocument")
+        _ = list(file.iter_content())
+        assert file._File__root_element is None  # type: ignore
+
+
+def test_stream_close_early() -> None:
+    """Stop extracting after the first paragraph."""
+    with DocxReader(RESOURCES / "example.docx") as reader:
+        file = reader.file_of_type("officeDocument")
+        paragraphs = file.iter_content()
+        first = next(paragraphs)
+        paragraphs.close()
+        assert first == next(enum_at_depth(file.content, 4))
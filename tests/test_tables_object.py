@@ -56,3 +56,50 @@ class TestDepthCollector:
         assert inst._rightmost_branches == [[[[]]], [[]]]
         inst.set_caret(1)
         assert inst._rightmost_branches == [[[[]]]]
+
+    def test_intern_style(self) -> None:
+        """Give equal styles the same id. Give no style id 0."""
+        inst = DepthCollector(5)
+        assert inst.intern_style([]) == inst.intern_style(None) == 0
+        assert inst.intern_style(["b", "i"]) == inst.intern_style(("b", "i")) == 1
+        assert inst.intern_style(["b"]) == 2
+
+    def test_runs(self) -> None:
+        """Open a run for text after an inserted run only if there is text."""
+        inst = DepthCollector(5)
+        par = inst.commence_paragraph(["h1"])
+        inst.commence_run(["b"])
+        inst.add_text_into_open_run("bold")
+        inst.insert_text_as_new_run("\t")
+        inst.insert_text_as_new_run("")
+        inst.add_text_into_open_run("still bold")
+        inst.conclude_run()
+        inst.add_text_into_open_run("plain")
+        assert len(par.runs) == 5
+        inst.conclude_paragraph()
+        assert inst.tree == [
+            [[[["<h1>", "<b>bold</b>", "\t", "<b>still bold</b>", "plain", "</h1>"]]]]
+        ]
+
+    def test_joined_runs(self) -> None:
+        """Replace runs collected between commence and conclude with one string."""
+        inst = DepthCollector(5)
+        par = inst.commence_paragraph()
+        inst.commence_run(["i"])
+        inst.add_text_into_open_run("before")
+        inst.commence_joined_runs()
+        inst.commence_run(["b"])
+        inst.add_text_into_open_run("bold")
+        inst.conclude_run()
+        inst.commence_joined_runs()
+        inst.add_text_into_open_run("plain")
+        inner = inst.conclude_joined_runs()
+        inst.insert_text_as_new_run(f"[{inner}]")
+        outer = inst.conclude_joined_runs()
+        assert len(par.runs) == 1
+        inst.insert_text_as_new_run(f"<a>{outer}</a>")
+        inst.add_text_into_open_run("after")
+        inst.conclude_paragraph()
+        assert inst.tree == [
+            [[[["<i>before</i>", "<a><b>bold</b>[plain]</a>", "<i>after</i>"]]]]
+        ]
@@ -0,0 +1,105 @@
+"""Test the tag-handler registry used by get_text.
+
+:author: Shay Hill
+:created: 2023-07-03
+"""
+
+from typing import Iterator, List, Optional
+
+import pytest
+from lxml import etree
+from lxml.etree import _Element as EtreeElement  # type: ignore
+
+from docx2python import attribute_register, docx_text
+from docx2python.attribute_register import Tags
+from docx2python.docx_reader import DocxReader
+from docx2python.docx_text import (
+    TAG_HANDLERS,
+    TextContext,
+    get_text,
+    register_tag_handler,
+)
+from docx2python.iterators import iter_at_depth
+from docx2python.namespace import qn
+
+from .conftest import RESOURCES
+from .helpers.utils import valid_xml
+
+FIELD = (
+    "<w:body><w:p>"
+    + "<w:r><w:t>page </w:t></w:r>"
+    + '<w:fldSimple w:instr="PAGE"><w:r><w:t>1</w:t></w:r></w:fldSimple>'
+    + "</w:p></w:body>"
+)
+
+
+@pytest.fixture()
+def restore_handlers() -> Iterator[None]:
+    """Remove any handlers registered in a test."""
+    handlers = dict(TAG_HANDLERS)
+    content_tags = set(attribute_register._CONTENT_TAGS)
+    yield
+    TAG_HANDLERS.clear()
+    TAG_HANDLERS.update(handlers)
+    attribute_register._CONTENT_TAGS.clear()
+    attribute_register._CONTENT_TAGS.update(content_tags)
+
+
+def _get_paragraphs(root: EtreeElement) -> List[List[str]]:
+    """Extract paragraphs from an element with example.docx as context.
+
+    :param root: element to extract
+    :return: paragraphs (lists of runs)
+    """
+    with DocxReader(RESOURCES / "example.docx") as reader:
+        file = reader.file_of_type("officeDocument")
+        return list(iter_at_depth(get_text(file, root), 4))
+
+
+def test_every_action_tag_has_a_handler() -> None:
+    """Every tag that provokes an action is in the registry."""
+    no_action = {
+        Tags.BODY,
+        Tags.DOCUMENT,
+        Tags.PAR_PROPERTIES,
+        Tags.RUN_PROPERTIES,
+        Tags.TABLE,
+        Tags.TABLE_ROW,
+    }
+    assert set(TAG_HANDLERS) == {x.value for x in Tags} - no_action
+
+
+def test_unknown_tag_is_descended() -> None:
+    """Without a handler, children of unknown tags are extracted."""
+    root = etree.fromstring(valid_xml(FIELD))
+    assert _get_paragraphs(root) == [["page ", "1"]]
+
+
+def test_custom_handler(restore_handlers: None) -> None:
+    """Replace the text of a field with its instructions."""
+
+    def add_field(
+        ctx: TextContext, group: List[EtreeElement], depth: Optional[int]
+    ) -> None:
+        instr = group[0].attrib.get(qn("w:instr"), "")
+        ctx.tables.insert_text_as_new_run(f"[{instr}]")
+
+    register_tag_handler(qn("w:fldSimple"), add_field, descend=False)
+    root = etree.fromstring(valid_xml(FIELD))
+    assert _get_paragraphs(root) == [["page ", "[PAGE]"]]
+
+
+def test_custom_content_tag(restore_handlers: None) -> None:
+    """Registered tags are content, even without content below them."""
+    empty_field = '<w:body><w:p><w:fldSimple w:instr="DATE"/></w:p></w:body>'
+
+    def add_field(
+        ctx: TextContext, group: List[EtreeElement], depth: Optional[int]
+    ) -> None:
+        ctx.tables.insert_text_as_new_run(group[0].attrib[qn("w:instr")])
+
+    root = etree.fromstring(valid_xml(empty_field))
+    assert _get_paragraphs(root) == [[]]
+    register_tag_handler(qn("w:fldSimple"), add_field)
+    assert _get_paragraphs(root) == [["DATE"]]
+    assert docx_text.TAG_HANDLERS[qn("w:fldSimple")].open is add_field
@@ -7,9 +7,15 @@
 from xml.etree import ElementTree
 
 from docx2python.attribute_register import XML2HTML_FORMATTER
+from docx2python.stats import CacheStats
 from docx2python.text_runs import (
+    FormattingCache,
     _elem_tag_str,
     gather_Pr,
+    get_paragraph_formatting,
+    get_pPr,
+    get_pPr_style,
+    get_pStyle,
     get_run_formatting,
     html_close,
     html_open,
@@ -85,6 +91,78 @@ class TestGetRunStyle:
         ]
 
 
+class TestGetPStyle:
+    """Test text_runs.get_pStyle and get_pPr_style"""
+
+    def test_pStyle(self) -> None:
+        """Read pStyle from the pPr of a paragraph."""
+        xml = valid_xml('<w:p><w:pPr><w:pStyle w:val="Heading1"/></w:pPr></w:p>')
+        paragraph = ElementTree.fromstring(xml)[0]
+        assert get_pStyle(paragraph) == "Heading1"
+        assert get_pPr_style(get_pPr(paragraph)) == "Heading1"
+        assert get_paragraph_formatting(paragraph, XML2HTML_FORMATTER) == ["h1"]
+        assert get_paragraph_formatting(paragraph, {}) == []
+
+    def test_no_pPr(self) -> None:
+        """Return "" if there is no pPr or pStyle."""
+        for xml in ("<w:p/>", "<w:p><w:pPr/></w:p>"):
+            paragraph = ElementTree.fromstring(valid_xml(xml))[0]
+            assert get_pStyle(paragraph) == ""
+        assert get_pPr_style(None) == ""
+
+
+class TestFormattingCache:
+    """Test text_runs.FormattingCache"""
+
+    def test_same_formatting(self) -> None:
+        """Return the same formatting as get_run_formatting. Compute it once."""
+        document = ElementTree.fromstring(ONE_TEXT_RUN)
+        cache = FormattingCache()
+        expect = get_run_formatting(document[0], XML2HTML_FORMATTER)
+        assert cache.get_run_formatting(document[0], XML2HTML_FORMATTER) == expect
+        assert cache.get_run_formatting(document[0], XML2HTML_FORMATTER) == expect
+        assert cache.get_run_formatting(document[0], XML2HTML_FORMATTER) is not (
+            cache.get_run_formatting(document[0], XML2HTML_FORMATTER)
+        )
+        assert (cache.stats.misses, cache.stats.hits) == (1, 3)
+
+    def test_no_style(self) -> None:
+        """Cache runs without an rPr element."""
+        document = ElementTree.fromstring(NO_STYLE_RUN)
+        cache = FormattingCache()
+        assert cache.get_run_formatting(document[0], XML2HTML_FORMATTER) == []
+        assert cache.get_run_formatting(document[0], XML2HTML_FORMATTER) == []
+        assert (cache.stats.misses, cache.stats.hits) == (1, 1)
+
+    def test_no_html(self) -> None:
+        """Do not look up formatting without an xml2html mapping."""
+        document = ElementTree.fromstring(ONE_TEXT_RUN)
+        stats = CacheStats()
+        cache = FormattingCache(stats=stats)
+        assert cache.get_run_formatting(document[0], {}) == []
+        assert len(cache) == 0
+        assert stats.hit_rate == 0
+
+    def test_new_mapping(self) -> None:
+        """Forget formatting for another mapping."""
+        document = ElementTree.fromstring(ONE_TEXT_RUN)
+        cache = FormattingCache()
+        bold_only = {"b": XML2HTML_FORMATTER["b"]}
+        _ = cache.get_run_formatting(document[0], XML2HTML_FORMATTER)
+        assert cache.get_run_formatting(document[0], bold_only) == ["b"]
+        assert cache.stats.misses == 2
+
+    def test_maxsize(self) -> None:
+        """Forget the least recently used signature."""
+        styled = ElementTree.fromstring(ONE_TEXT_RUN)[0]
+        plain = ElementTree.fromstring(NO_STYLE_RUN)[0]
+        cache = FormattingCache(maxsize=1)
+        for run in (styled, plain, styled):
+            _ = cache.get_run_formatting(run, XML2HTML_FORMATTER)
+        assert len(cache) == 1
+        assert cache.stats.misses == 3
+
+
 class TestStyleStrings:
     """Test text_runs.style_open and text_runs.style_close"""
 
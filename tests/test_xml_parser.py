@@ -0,0 +1,53 @@
+"""Test the configured xml parser.
+
+:author: Shay Hill
+:created: 2023-07-03
+"""
+
+import threading
+from typing import List
+
+import pytest
+from lxml import etree
+
+from docx2python import docx2python
+from docx2python.docx_reader import DocxReader
+from docx2python.xml_parser import get_parser, parse_xml
+
+from .conftest import RESOURCES
+
+# more than libxml2 will hold in one text node without huge_tree
+HUGE_TEXT = b"<a>" + b"x" * 10_000_001 + b"</a>"
+
+
+def test_one_parser_per_thread() -> None:
+    """Reuse a parser in a thread. Do not share it between threads."""
+    assert get_parser() is get_parser()
+    assert get_parser() is not get_parser(huge_tree=True)
+    other: List[etree.XMLParser] = []
+    thread = threading.Thread(target=lambda: other.append(get_parser()))
+    thread.start()
+    thread.join()
+    assert other[0] is not get_parser()
+
+
+def test_remove_comments_and_pis() -> None:
+    """Comments and processing instructions are not in the tree."""
+    root = parse_xml(b"<a><!-- comment --><?pi data?><b/></a>")
+    assert [x.tag for x in root] == ["b"]
+
+
+def test_huge_tree() -> None:
+    """Refuse huge text nodes unless huge_tree."""
+    with pytest.raises(etree.XMLSyntaxError):
+        _ = parse_xml(HUGE_TEXT)
+    assert len(parse_xml(HUGE_TEXT, huge_tree=True).text) == 10_000_001
+
+
+def test_huge_tree_argument() -> None:
+    """Pass huge_tree from docx2python to the reader."""
+    with docx2python(RESOURCES / "example.docx", huge_tree=True) as content:
+        assert content.docx_reader.huge_tree is True
+        assert content.text
+    with DocxReader(RESOURCES / "example.docx") as reader:
+        assert reader.huge_tree is False